@@ -0,0 +1,319 @@
+"""Headless scenario benchmarks for Village Defense.
+
+Boots the real Game on the SDL dummy drivers, scripts each screen and reports
+frames per second, frame time percentiles and allocations. Run it from the
+project root so the assets are found:
+
+    python benchmark.py --output bench.json
+    python benchmark.py --baseline bench.json   # Exit code 1 on a regression
+    python benchmark.py --replay slow_path.rec  # Also time a recorded session
+"""
+import argparse
+import itertools
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pygame
+
+from src.game.core.constants import GameState, ShopConstants
+from src.game.core.game import Game
+from src.game.entities.hero import make_hero
+from src.game.entities.quest import Quest, QuestButton, quest_list
+from src.game.managers.battle_manager import BattleManager
+from src.game.managers.estimate_manager import estimate_manager
+from src.game.managers.odds_manager import odds_manager
+from src.game.managers.rng_manager import rng
+
+# Type aliases
+Setup = Callable[[Game], None]
+FrameScript = Callable[[Game, int], None]
+
+DEFAULT_FRAMES: int = 300
+ALLOCATION_FRAMES: int = 60  # Frames run again under tracemalloc, which slows everything down
+DEFAULT_THRESHOLD: float = 0.10  # Allowed slowdown against the baseline before it counts as a regression
+# Allocation growth always allowed on top of the threshold, small numbers are mostly noise
+ALLOCATION_SLACK: Dict[str, float] = {"retained_blocks_per_frame": 1.0, "alloc_peak_kb": 16.0, "alloc_growth_kb": 16.0}
+SEED: int = 1  # Every scenario sees the same shop, monsters and hits
+
+def post(event_type: int, **attributes: Any) -> None:
+    """Post a synthetic event for the next frame to handle."""
+    pygame.event.post(pygame.event.Event(event_type, **attributes))
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Get a percentile from already sorted values."""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[round((len(sorted_values) - 1) * fraction)]
+
+# Scenario setups and per-frame scripts
+
+def setup_home(game: Game) -> None:
+    """Show the home screen."""
+    game.game_state = GameState.HOME
+
+def setup_new_game(game: Game) -> None:
+    """Show the new game screen."""
+    game.game_state = GameState.NEW_GAME
+
+def type_hero_name(game: Game, frame: int) -> None:
+    """Click the name box, then type and erase letters."""
+    if frame == 0:
+        post(pygame.MOUSEBUTTONDOWN, button=1, pos=game.text_box.rect.center)
+    elif frame % 16 < 12:
+        letter = "abcdefghijklmnopqrstuvwxyz"[frame % 26]
+        post(pygame.KEYDOWN, key=ord(letter), unicode=letter, mod=0, scancode=0)
+    else:
+        post(pygame.KEYDOWN, key=pygame.K_BACKSPACE, unicode="\b", mod=0, scancode=0)
+
+def setup_village(game: Game) -> None:
+    """Show the village with a new hero."""
+    game.hero = make_hero("Bench", "Knight")
+    game.game_state = GameState.VILLAGE
+
+def setup_quests(count: int) -> Setup:
+    """Build a setup that fills the available quest list with count quests."""
+    def setup(game: Game) -> None:
+        game.hero = make_hero("Bench", "Knight")
+        quests = game.button_manager.available_quests
+        quests.clear_buttons()
+        for _, template in zip(range(count), itertools.cycle(sorted(quest_list, key=lambda quest: quest.name))):
+            quest = Quest(template.name, template.description, template.monster_list.copy(),
+                          template.reward, template.penalty)
+            quests.add_button(QuestButton(game.button_manager.quest_button_sheet, 0, 0, 700, 100, 1, quest))
+        game.game_state = GameState.QUEST
+    return setup
+
+def drag_quest_scrollbar(game: Game, frame: int) -> None:
+    """Grab the quest list scrollbar and sweep it up and down."""
+    quests = game.button_manager.available_quests
+    if frame == 0:
+        post(pygame.MOUSEBUTTONDOWN, button=1, pos=quests.scrollbar_handle_rect.center)
+        return
+    # Triangle wave over the height of the list, one sweep every 120 frames
+    phase = frame % 120
+    offset = phase if phase < 60 else 120 - phase
+    y = quests.rect.top + quests.rect.height * offset // 60
+    post(pygame.MOUSEMOTION, pos=(quests.scrollbar_rect.centerx, y), rel=(0, 0), buttons=(1, 0, 0))
+
+def setup_battle(game: Game) -> None:
+    """Start a battle with a battle log that has already spilled to disk."""
+    game.hero = make_hero("Bench", "Knight")
+    game.current_quest = game.button_manager.available_quests.buttons[0].quest
+    game.battle_manager = BattleManager(game.hero, game.battle_log)
+    for index in range(5000):
+        game.battle_log.append(f"Bench attacks for {index % 17} damage.")
+    game.game_state = GameState.BATTLE
+
+def append_battle_log(game: Game, frame: int) -> None:
+    """Add a combat message every frame."""
+    game.battle_log.append(f"Frame {frame}: the monster attacks for {frame % 13} damage.")
+
+def setup_shop(game: Game) -> None:
+    """Show the shop."""
+    game.hero = make_hero("Bench", "Knight")
+    game.game_state = GameState.SHOP
+
+def reroll_shop(game: Game, frame: int) -> None:
+    """Replace one of the shop cards every frame."""
+    cards = (ShopConstants.POTION_CARD_KEY, ShopConstants.WEAPON_CARD_KEY, ShopConstants.ARMOR_CARD_KEY)
+    game.village.shop.new_card(cards[frame % len(cards)])
+
+def setup_replay(path: str) -> Setup:
+    """Build a setup that plays back a session recorded with VILLAGE_DEFENSE_RECORD."""
+    def setup(game: Game) -> None:
+        game.event_manager.start_replay(path)  # Seeds the RNG
+        game.start()  # Deal the shop and quests again with the recorded seed
+    return setup
+
+SCENARIOS: Dict[str, Tuple[Setup, Optional[FrameScript]]] = {
+    "home_idle": (setup_home, None),
+    "new_game_typing": (setup_new_game, type_hero_name),
+    "village": (setup_village, None),
+    "quest_10": (setup_quests(10), drag_quest_scrollbar),
+    "quest_1000": (setup_quests(1000), drag_quest_scrollbar),
+    "quest_10000": (setup_quests(10000), drag_quest_scrollbar),
+    "battle_long_log": (setup_battle, append_battle_log),
+    "shop_rerolls": (setup_shop, reroll_shop),
+}
+
+def run_frames(game: Game, name: str, frames: Optional[int],
+               on_start: Optional[Callable[[], None]] = None) -> List[float]:
+    """
+    Reset the game, set up a scenario and run it through the real main loop.
+
+    Args:
+        game: The headless game
+        name: Name of the scenario
+        frames: Number of frames to run, or None to run until the game exits
+        on_start: Called right before the first frame, once the reset and setup are done
+
+    Returns:
+        Frame times in milliseconds
+    """
+    setup, script = SCENARIOS[name]
+    game.event_manager.stop()
+    game.scene_manager.clear()
+    game.battle_log.close()
+    rng.seed(SEED)
+    game.start()
+    pygame.event.clear()
+    setup(game)
+
+    timestamps: List[float] = []
+
+    def on_frame(frame: int) -> None:
+        if frame == 0 and on_start:
+            on_start()
+        timestamps.append(time.perf_counter())
+        if script:
+            script(game, frame)
+
+    game.run(max_frames=frames, frame_callback=on_frame)
+    timestamps.append(time.perf_counter())
+    return [(end - start) * 1000 for start, end in zip(timestamps, timestamps[1:])]
+
+def run_scenario(game: Game, name: str, frames: Optional[int]) -> Dict[str, float]:
+    """
+    Time a scenario, then run it again under tracemalloc to measure allocations.
+
+    Only the frames are measured, not the reset and setup before them. Retained
+    blocks are the net change in allocated blocks, i.e. memory the frames kept,
+    not how often they allocated.
+
+    Args:
+        game: The headless game
+        name: Name of the scenario
+        frames: Number of frames to time, or None to run until the game exits
+
+    Returns:
+        Dictionary of measurements
+    """
+    blocks_before: List[int] = []
+    frame_times = run_frames(game, name, frames, lambda: blocks_before.append(sys.getallocatedblocks()))
+    blocks_after = sys.getallocatedblocks()
+    ordered = sorted(frame_times)
+
+    allocation_frames = ALLOCATION_FRAMES if frames is None else min(frames, ALLOCATION_FRAMES)
+    traced_before: List[int] = []
+
+    def start_tracing() -> None:
+        tracemalloc.reset_peak()
+        traced_before.append(tracemalloc.get_traced_memory()[0])
+
+    tracemalloc.start()
+    allocation_times = run_frames(game, name, allocation_frames, start_tracing)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    start_blocks = blocks_before[0] if blocks_before else blocks_after
+    start_traced = traced_before[0] if traced_before else current
+
+    return {
+        "frames": len(frame_times),
+        "fps": round(len(frame_times) / (sum(frame_times) / 1000), 1) if frame_times else 0.0,
+        "p50_ms": round(percentile(ordered, 0.50), 3),
+        "p95_ms": round(percentile(ordered, 0.95), 3),
+        "p99_ms": round(percentile(ordered, 0.99), 3),
+        "max_ms": round(ordered[-1], 3) if ordered else 0.0,
+        "retained_blocks_per_frame": round((blocks_after - start_blocks) / max(len(frame_times), 1), 2),
+        "alloc_frames": len(allocation_times),
+        "alloc_peak_kb": round(max(peak - start_traced, 0) / 1024, 1),  # Above what was live before the frames
+        "alloc_growth_kb": round((current - start_traced) / 1024, 1),
+    }
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+            threshold: float) -> List[str]:
+    """
+    Compare results against a baseline and print a table.
+
+    A scenario regresses if it got slower, or if its retained blocks or
+    allocation peak or growth rose by more than the threshold plus ALLOCATION_SLACK.
+
+    Args:
+        results: Measurements of this run by scenario
+        baseline: Measurements of the baseline run by scenario
+        threshold: Allowed relative slowdown or allocation growth, e.g. 0.1 for 10%
+
+    Returns:
+        Names of the scenarios that regressed
+    """
+    regressions: List[str] = []
+    print(f"{'scenario':<18}{'fps':>10}{'base':>10}{'p95 ms':>10}{'base':>10}  status")
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            print(f"{name:<18}{result['fps']:>10}{'-':>10}{result['p95_ms']:>10}{'-':>10}  new")
+            continue
+        slower_fps = base["fps"] > 0 and result["fps"] < base["fps"] * (1 - threshold)
+        slower_p95 = result["p95_ms"] > base["p95_ms"] * (1 + threshold)
+        # Baselines written before a metric existed are not compared on it
+        grown = [key for key, slack in ALLOCATION_SLACK.items() if key in base and key in result
+                 and result[key] > base[key] + abs(base[key]) * threshold + slack]
+        status = "REGRESSION" if slower_fps or slower_p95 else "ok"
+        if grown:
+            status = "REGRESSION (" + ", ".join(grown) + ")"
+        if status != "ok":
+            regressions.append(name)
+        print(f"{name:<18}{result['fps']:>10}{base['fps']:>10}{result['p95_ms']:>10}{base['p95_ms']:>10}  {status}")
+    return regressions
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run the Village Defense headless benchmarks.")
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES, help="frames to time per scenario")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="scenario to run, can be repeated (default: all)")
+    parser.add_argument("--replay", action="append", default=[],
+                        help="recorded session to play back to the end as an extra scenario, can be repeated")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare against the results in this JSON file")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed relative slowdown against the baseline (default: 0.10)")
+    args = parser.parse_args()
+
+    game = Game(headless=True)
+    estimate_manager.enabled = False  # Worker processes would compete with the frames being timed
+    odds_manager.enabled = False
+    game.fps_limit = 0  # Run as fast as possible
+
+    names: List[str] = list(args.scenario or ([] if args.replay else SCENARIOS))
+    for path in args.replay:
+        name = "replay_" + os.path.basename(path).split(".")[0]
+        SCENARIOS[name] = (setup_replay(path), None)
+        names.append(name)
+
+    results: Dict[str, Dict[str, float]] = {}
+    for name in names:
+        frames = None if name.startswith("replay_") else args.frames
+        results[name] = run_scenario(game, name, frames)
+        result = results[name]
+        print(f"{name:<18} {result['fps']:>9.1f} fps  p50 {result['p50_ms']:.3f}  p95 {result['p95_ms']:.3f}  "
+              f"p99 {result['p99_ms']:.3f} ms  peak {result['alloc_peak_kb']:.0f} KB")
+    game.quit()
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "frames": args.frames,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(report, output_file, indent=4)
+
+    if args.baseline:
+        with open(args.baseline, "r") as baseline_file:
+            baseline = json.load(baseline_file)["results"]
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
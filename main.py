@@ -1,27 +1,16 @@
-from src.game.core.constants import GameState
+import multiprocessing
+import time
+IMPORT_START = time.perf_counter()
+
+from src.game.core.bootstrap import startup_profile
 from src.game.core.game import Game
+startup_profile.record("import", (time.perf_counter() - IMPORT_START) * 1000)
 
 def main() -> None:
     my_game = Game()
-    while my_game.game_state != GameState.EXIT:
-        if my_game.game_state == GameState.HOME:
-            my_game.home_screen()
-        elif my_game.game_state == GameState.NEW_GAME:
-            my_game.new_game_screen()
-        elif my_game.game_state == GameState.VILLAGE:
-            my_game.village_screen()
-        elif my_game.game_state == GameState.QUEST:
-            my_game.quest_screen()
-        elif my_game.game_state == GameState.BATTLE:
-            my_game.battle_screen()
-        elif my_game.game_state == GameState.SHOP:
-            my_game.shop_screen()
-        elif my_game.game_state == GameState.VICTORY:
-            my_game.victory_screen()
-        elif my_game.game_state == GameState.DEFEAT:
-            my_game.defeat_screen()
-    
+    my_game.run()
     my_game.quit()
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # Quest estimates run in worker processes, also in the PyInstaller build
     main()
\ No newline at end of file
@@ -0,0 +1,180 @@
+from enum import Enum
+from typing import Any, List, NamedTuple, Optional
+from src.game.core.constants import BattleActions
+from src.game.entities.ability import AttackAbility, DefendAbility
+from src.game.managers.rng_manager import rng, COMBAT_STREAM, RandomStream
+
+class BattleEventType(Enum):
+    """Things that can happen while a turn is resolved."""
+    ABILITY_HIT = 0
+    ABILITY_CRITICAL = 1
+    ABILITY_MISSED = 2
+    ABILITY_BLOCK = 3  # A defend ability was used
+    ABILITY_USED = 4  # An ability that had no visible effect
+    ON_COOLDOWN = 5
+    NOT_ENOUGH_ENERGY = 6
+    UNKNOWN_ABILITY = 7
+    POTION_USED = 8
+    NO_POTION = 9
+    REST = 10
+    FLED = 11
+    POTION_BLOCK = 12  # A block potion soaked part of the monster's attack
+    MONSTER_ATTACK = 13
+    DODGED = 14  # The hero's armor dodged the attack
+    ARMOR_BLOCK = 15  # The hero's armor blocked part of the attack
+
+class BattleOutcome(Enum):
+    """State of a battle after a turn."""
+    ONGOING = 0
+    VICTORY = 1
+    DEFEAT = 2
+
+class BattleAction(NamedTuple):
+    """An action the hero takes on their turn."""
+    kind: BattleActions
+    name: str = ""  # Ability or potion name
+
+class BattleEvent(NamedTuple):
+    """A single result of resolving a turn."""
+    type: BattleEventType
+    actor: str  # Name of the hero or monster acting
+    detail: str = ""  # Ability or potion name
+    amount: int = 0  # Damage, block or healing
+
+class TurnResult(NamedTuple):
+    """Everything a call to BattleEngine.resolve produced."""
+    events: List[BattleEvent]
+    taken: bool  # False if the action was refused and the hero may choose again
+
+class BattleEngine:
+    """Resolves battle turns without any pygame or UI code.
+
+    The engine only reads and changes the stats of the hero and monster it is
+    given, and reports what happened as BattleEvents. BattleManager turns those
+    into battle log lines and button states; simulations can call resolve
+    directly in a loop.
+    """
+
+    def __init__(self, combat_rng: Optional[RandomStream] = None) -> None:
+        """
+        Initialize the engine.
+
+        Args:
+            combat_rng: Stream for hit, crit, dodge and block rolls, defaults to the shared combat stream
+        """
+        self.combat_rng: RandomStream = combat_rng if combat_rng is not None else rng.stream(COMBAT_STREAM)
+
+    def resolve(self, hero: Any, monster: Any, action: BattleAction) -> TurnResult:
+        """
+        Resolve the hero's action and the monster's reply.
+
+        Args:
+            hero: The hero taking the turn
+            monster: The monster being fought
+            action: What the hero does
+
+        Returns:
+            The events of the turn and whether the turn was used up
+        """
+        events: List[BattleEvent] = []
+        kind = action.kind
+        if kind == BattleActions.ABILITY:
+            if not self._use_ability(hero, monster, action.name, events):
+                return TurnResult(events, False)
+        elif kind == BattleActions.USE_POTION:
+            if hero.apply_potion(action.name):
+                events.append(BattleEvent(BattleEventType.POTION_USED, hero.name, action.name))
+            else:
+                events.append(BattleEvent(BattleEventType.NO_POTION, hero.name, action.name))
+        elif kind == BattleActions.REST:
+            hero.rest()
+            events.append(BattleEvent(BattleEventType.REST, hero.name))
+        elif kind == BattleActions.FLEE:
+            events.append(BattleEvent(BattleEventType.FLED, hero.name))
+            return TurnResult(events, True)  # The monster gets no parting shot
+
+        if monster.current_hp > 0:
+            self.monster_attack(hero, monster, events)
+        return TurnResult(events, True)
+
+    def _use_ability(self, hero: Any, monster: Any, ability_name: str, events: List[BattleEvent]) -> bool:
+        """Use one of the hero's abilities. Returns False if the ability could not be used."""
+        ability = None
+        for known in hero.abilities:
+            if known.name == ability_name:
+                ability = known
+                break
+        if ability is None:
+            events.append(BattleEvent(BattleEventType.UNKNOWN_ABILITY, hero.name, ability_name))
+            return False
+        if ability.current_cooldown > 0:
+            events.append(BattleEvent(BattleEventType.ON_COOLDOWN, hero.name, ability_name))
+            return False
+        if hero.energy < ability.energy_cost:
+            events.append(BattleEvent(BattleEventType.NOT_ENOUGH_ENERGY, hero.name, ability_name))
+            return False
+
+        # Same rules as Ability.use, without building an AbilityEffect every turn
+        ability.current_cooldown = ability.cooldown
+        hero.energy -= ability.energy_cost
+        if isinstance(ability, AttackAbility):
+            damage, missed, critical = ability.roll(hero.weapon, self.combat_rng)
+            if missed:
+                events.append(BattleEvent(BattleEventType.ABILITY_MISSED, hero.name, ability_name))
+            else:
+                monster.current_hp = max(monster.current_hp - damage, 0)
+                if critical:
+                    events.append(BattleEvent(BattleEventType.ABILITY_CRITICAL, hero.name, ability_name, damage))
+                elif damage > 0:
+                    events.append(BattleEvent(BattleEventType.ABILITY_HIT, hero.name, ability_name, damage))
+                else:
+                    events.append(BattleEvent(BattleEventType.ABILITY_USED, hero.name, ability_name))
+        elif isinstance(ability, DefendAbility) and ability.block_amount > 0:
+            events.append(BattleEvent(BattleEventType.ABILITY_BLOCK, hero.name, ability_name, ability.block_amount))
+        else:
+            events.append(BattleEvent(BattleEventType.ABILITY_USED, hero.name, ability_name))
+
+        hero.update_abilities()  # Cooldowns tick at the end of the hero's turn
+        return True
+
+    def monster_attack(self, hero: Any, monster: Any, events: List[BattleEvent]) -> None:
+        """
+        Let the monster attack the hero, using up any block potion.
+
+        Args:
+            hero: The hero being attacked
+            monster: The attacking monster
+            events: List the events are added to
+        """
+        potion_block = hero.potion_block
+        damage = max(0, monster.damage - potion_block)
+        if potion_block > 0:
+            events.append(BattleEvent(BattleEventType.POTION_BLOCK, hero.name, amount=potion_block))
+        events.append(BattleEvent(BattleEventType.MONSTER_ATTACK, monster.name, amount=damage))
+
+        if hero.armor:
+            damage, dodged, blocked = hero.armor.roll_defence(damage, self.combat_rng)
+            if dodged:
+                events.append(BattleEvent(BattleEventType.DODGED, hero.name, hero.armor.name))
+            elif blocked:
+                events.append(BattleEvent(BattleEventType.ARMOR_BLOCK, hero.name, hero.armor.name, hero.armor.block))
+        hero.current_hp = max(hero.current_hp - damage, 0)
+        hero.potion_block = 0
+
+    @staticmethod
+    def outcome(hero: Any, monster: Any) -> BattleOutcome:
+        """
+        Check if the battle is over.
+
+        Args:
+            hero: The hero
+            monster: The monster
+
+        Returns:
+            DEFEAT if the hero is down, VICTORY if only the monster is, ONGOING otherwise
+        """
+        if hero.current_hp <= 0:
+            return BattleOutcome.DEFEAT
+        if monster.current_hp <= 0:
+            return BattleOutcome.VICTORY
+        return BattleOutcome.ONGOING
@@ -0,0 +1,473 @@
+import copy
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+from src.game.core.battle_engine import BattleAction
+from src.game.core.constants import BattleActions
+from src.game.entities.ability import AttackAbility
+from src.game.utils.lru_cache import LRUCache
+
+# Works out the exact odds of a battle instead of sampling it. A battle only
+# depends on a small state (health, energy, cooldowns and potions), so every
+# reachable state is visited once and its odds are memoized.
+
+TOLERANCE: float = 1e-12  # Odds are exact to this, see BattleSolver._solve_level
+MAX_SWEEPS: int = 10_000
+DEFAULT_MAX_MODELS: int = 16  # Battles whose solved states BattleSolver keeps
+# Value of fleeing for solve_policy. The quest fails but the hero lives, while a defeat ends the game
+FLEE_VALUE: float = 0.3
+HEALTH_POTION: str = "Health Potion"
+BLOCK_POTION: str = "Block Potion"
+HEALTH_POTION_HEAL: int = 5  # Same as Hero.apply_potion
+BLOCK_POTION_BLOCK: int = 2
+
+class SolverState(NamedTuple):
+    """Everything that can change during a battle, at the start of the hero's turn."""
+    hero_hp: int
+    monster_hp: int
+    energy: int
+    cooldowns: Tuple[int, ...]  # Current cooldown of each ability, in BattleModel.abilities order
+    health_potions: int
+    block_potions: int
+
+class BattleOdds(NamedTuple):
+    """Odds of a battle from some state on."""
+    win_probability: float
+    expected_hp_loss: float  # Health the hero is expected to lose by the end of the battle, net of healing
+
+class AbilityStats(NamedTuple):
+    """The parts of an ability the solver needs."""
+    name: str
+    cooldown: int
+    energy_cost: int
+    outcomes: Tuple[Tuple[float, int], ...]  # (probability, damage), empty for defend abilities
+
+class BattleModel:
+    """The fixed stats of a hero and monster pair, and the transitions between states."""
+
+    def __init__(self, hero: Any, monster: Any) -> None:
+        """
+        Read the fixed stats of a battle.
+
+        Args:
+            hero: The hero
+            monster: The monster
+        """
+        self.max_hp: int = hero.max_hp
+        self.max_energy: int = hero.max_energy
+        self.rest_heal: int = hero.level * 5  # Same as Hero.rest
+        self.monster_damage: int = monster.damage
+        self.armor: Any = hero.armor
+        self.abilities: Tuple[AbilityStats, ...] = tuple(
+            AbilityStats(ability.name, ability.cooldown, ability.energy_cost,
+                         tuple(ability.outcomes(hero.weapon)) if isinstance(ability, AttackAbility) else ())
+            for ability in hero.abilities)
+        # Damage after armor for each possible incoming damage, as (probability, damage) tuples
+        self._defence: Dict[int, List[Tuple[float, int]]] = {}
+
+    @property
+    def key(self) -> Tuple:
+        """Values that decide every transition, used to share solved states between battles."""
+        return (self.max_hp, self.max_energy, self.rest_heal, self.monster_damage,
+                self.armor.name if self.armor else "", self.abilities)
+
+    def with_monster_damage(self, damage: int) -> "BattleModel":
+        """
+        Get the same battle against a monster that hits for a different amount.
+
+        Args:
+            damage: Damage of the monster's attack
+
+        Returns:
+            A new model
+        """
+        model = copy.copy(self)
+        model.monster_damage = damage
+        model._defence = {}
+        return model
+
+    @staticmethod
+    def state_of(hero: Any, monster: Any) -> SolverState:
+        """
+        Get the state of a battle in progress.
+
+        Args:
+            hero: The hero
+            monster: The monster
+
+        Returns:
+            The solver state
+        """
+        return SolverState(hero.current_hp, monster.current_hp, hero.energy,
+                           tuple(ability.current_cooldown for ability in hero.abilities),
+                           hero.potion_bag.get(HEALTH_POTION, 0), hero.potion_bag.get(BLOCK_POTION, 0))
+
+    def defence(self, incoming: int) -> List[Tuple[float, int]]:
+        """
+        Get the damage the hero takes from an attack, after armor.
+
+        Args:
+            incoming: Damage of the attack
+
+        Returns:
+            List of (probability, damage) tuples
+        """
+        outcomes = self._defence.get(incoming)
+        if outcomes is None:
+            outcomes = self.armor.defence_outcomes(incoming) if self.armor else [(1.0, incoming)]
+            self._defence[incoming] = outcomes
+        return outcomes
+
+    def transitions(self, state: SolverState, action: BattleAction) -> List[Tuple[float, SolverState, int]]:
+        """
+        Get every state one turn can lead to, with the same rules as BattleEngine.resolve.
+
+        Args:
+            state: State at the start of the turn
+            action: What the hero does
+
+        Returns:
+            List of (probability, next state, health lost) tuples. Health lost is net of
+            healing from resting or potions, so it is negative if the hero ends the turn healthier
+        """
+        hero_hp, monster_hp, energy = state.hero_hp, state.monster_hp, state.energy
+        cooldowns, health_potions, block_potions = state.cooldowns, state.health_potions, state.block_potions
+        hero_results: List[Tuple[float, int]] = [(1.0, monster_hp)]  # (probability, monster health)
+        block = 0
+
+        if action.kind == BattleActions.ABILITY:
+            index = next((i for i, ability in enumerate(self.abilities) if ability.name == action.name), None)
+            if index is None:
+                raise ValueError(f"Unknown ability: {action.name}")
+            ability = self.abilities[index]
+            if cooldowns[index] > 0 or energy < ability.energy_cost:
+                raise ValueError(f"{action.name} cannot be used in this state")
+            energy -= ability.energy_cost
+            # The cooldown is set, then every cooldown ticks at the end of the turn
+            cooldowns = tuple(max((ability.cooldown if i == index else cooldown) - 1, 0)
+                              for i, cooldown in enumerate(cooldowns))
+            if ability.outcomes:
+                hero_results = [(probability, max(monster_hp - damage, 0))
+                                for probability, damage in ability.outcomes]
+        elif action.kind == BattleActions.REST:
+            energy = self.max_energy
+            hero_hp = min(hero_hp + self.rest_heal, self.max_hp)
+            cooldowns = tuple(max(cooldown - 1, 0) for cooldown in cooldowns)
+        elif action.kind == BattleActions.USE_POTION:
+            if action.name == HEALTH_POTION and health_potions > 0:
+                health_potions -= 1
+                hero_hp = min(hero_hp + HEALTH_POTION_HEAL, self.max_hp)
+            elif action.name == BLOCK_POTION and block_potions > 0:
+                block_potions -= 1
+                block = BLOCK_POTION_BLOCK
+            else:
+                raise ValueError(f"No {action.name} to use")
+        else:  # Fleeing ends the battle, solve_policy scores it separately
+            raise ValueError(f"The solver cannot model {action.kind.name}")
+
+        results: List[Tuple[float, SolverState, int]] = []
+        for hero_probability, next_monster_hp in hero_results:
+            if next_monster_hp <= 0:
+                results.append((hero_probability, SolverState(hero_hp, 0, energy, cooldowns,
+                                                              health_potions, block_potions),
+                                state.hero_hp - hero_hp))
+                continue
+            for probability, damage in self.defence(max(0, self.monster_damage - block)):
+                next_hero_hp = max(hero_hp - damage, 0)
+                results.append((hero_probability * probability,
+                                SolverState(next_hero_hp, next_monster_hp, energy, cooldowns,
+                                            health_potions, block_potions),
+                                state.hero_hp - next_hero_hp))
+        return results
+
+    def actions(self, state: SolverState) -> List[BattleAction]:
+        """
+        Get the actions worth considering in a state.
+
+        Some legal actions are left out because another action is always at
+        least as good, which keeps the state space small:
+        - Defend abilities and health potions: resting also ticks cooldowns,
+          restores energy and heals at least as much as a Health Potion.
+        - Damage potions: their bonus is never applied to an attack.
+
+        Args:
+            state: The state
+
+        Returns:
+            The actions, abilities first
+        """
+        actions = [BattleAction(BattleActions.ABILITY, ability.name)
+                   for ability, cooldown in zip(self.abilities, state.cooldowns)
+                   if cooldown == 0 and state.energy >= ability.energy_cost and ability.outcomes]
+        actions.append(BattleAction(BattleActions.REST))
+        if state.block_potions > 0:
+            actions.append(BattleAction(BattleActions.USE_POTION, BLOCK_POTION))
+        actions.append(BattleAction(BattleActions.FLEE))
+        return actions
+
+# Type alias, a policy picks the hero's action in a state
+Policy = Callable[[SolverState, BattleModel], BattleAction]
+
+def greedy_policy(state: SolverState, model: BattleModel) -> BattleAction:
+    """
+    Drink a health potion if the next hit could be deadly, else use the ready
+    attack ability with the best expected damage, else rest.
+
+    Args:
+        state: Current state
+        model: The battle
+
+    Returns:
+        The action to take
+    """
+    if state.health_potions > 0 and state.hero_hp <= model.monster_damage and state.hero_hp < model.max_hp:
+        return BattleAction(BattleActions.USE_POTION, HEALTH_POTION)
+    best: Optional[AbilityStats] = None
+    best_damage = 0.0
+    for ability, cooldown in zip(model.abilities, state.cooldowns):
+        if cooldown > 0 or state.energy < ability.energy_cost or not ability.outcomes:
+            continue
+        expected = sum(probability * damage for probability, damage in ability.outcomes)
+        if best is None or expected > best_damage:
+            best, best_damage = ability, expected
+    if best is None:
+        return BattleAction(BattleActions.REST)
+    return BattleAction(BattleActions.ABILITY, best.name)
+
+class BattleSolver:
+    """Computes exact battle odds with memoized dynamic programming over SolverStates.
+
+    Solved states are kept per BattleModel.key, so asking again after every
+    turn of a battle only looks up states that are already solved. Only the
+    most recently used max_models battles are kept.
+    """
+
+    def __init__(self, policy: Policy = greedy_policy, max_models: int = DEFAULT_MAX_MODELS) -> None:
+        """
+        Initialize the solver.
+
+        Args:
+            policy: How the hero acts in every state
+            max_models: Number of battles whose solved states are kept
+        """
+        self.policy: Policy = policy
+        self._memo: LRUCache = LRUCache(max_models)  # BattleModel.key -> (model, solved states)
+
+    def _entry(self, model: BattleModel) -> Tuple[BattleModel, Dict[SolverState, BattleOdds]]:
+        """Get the cached model and solved states of a battle, adding an empty entry if there is none."""
+        entry = self._memo.get(model.key)
+        if entry is None:
+            entry = (model, {})
+            self._memo.put(model.key, entry)
+        return entry
+
+    def odds(self, hero: Any, monster: Any) -> BattleOdds:
+        """
+        Get the odds of a battle in progress, assuming the hero follows the policy from now on.
+
+        Args:
+            hero: The hero
+            monster: The monster
+
+        Returns:
+            Win probability and expected health lost
+        """
+        model, memo = self._entry(BattleModel(hero, monster))
+        return self.solve(model, model.state_of(hero, monster), memo)
+
+    def cached_odds(self, hero: Any, monster: Any) -> Optional[BattleOdds]:
+        """
+        Get the odds of a battle in progress if they are already solved, without solving anything.
+
+        Args:
+            hero: The hero
+            monster: The monster
+
+        Returns:
+            The odds, or None if the state is not solved yet
+        """
+        model = BattleModel(hero, monster)
+        state = model.state_of(hero, monster)
+        entry = self._memo.get(model.key)
+        return self._terminal(state) or (entry[1].get(state) if entry is not None else None)
+
+    def add(self, model: BattleModel, solved: Dict[SolverState, BattleOdds]) -> None:
+        """
+        Add states solved elsewhere, e.g. by solve in a worker process.
+
+        Args:
+            model: The battle the states belong to
+            solved: Odds of each state
+        """
+        self._entry(model)[1].update(solved)
+
+    def solve(self, model: BattleModel, start: SolverState,
+              memo: Optional[Dict[SolverState, BattleOdds]] = None) -> BattleOdds:
+        """
+        Solve every state reachable from start that is not memoized yet.
+
+        Args:
+            model: The battle
+            start: State to get the odds of
+            memo: Solved states, filled in by the call
+
+        Returns:
+            Odds of the start state
+        """
+        if memo is None:
+            memo = {}
+        odds = self._terminal(start) or memo.get(start)
+        if odds is not None:
+            return odds
+
+        # Find the unsolved states and their transitions
+        transitions: Dict[SolverState, List[Tuple[float, SolverState, int]]] = {}
+        stack = [start]
+        while stack:
+            state = stack.pop()
+            if state in transitions:
+                continue
+            transitions[state] = model.transitions(state, self.policy(state, model))
+            for _, next_state, _ in transitions[state]:
+                if next_state not in transitions and next_state not in memo and self._terminal(next_state) is None:
+                    stack.append(next_state)
+
+        # The monster never heals, so states can be solved one monster health level at a time
+        levels: Dict[int, List[SolverState]] = {}
+        for state in transitions:
+            levels.setdefault(state.monster_hp, []).append(state)
+        for monster_hp in sorted(levels):
+            self._solve_level(levels[monster_hp], transitions, memo)
+        return memo[start]
+
+    @staticmethod
+    def _terminal(state: SolverState) -> Optional[BattleOdds]:
+        """Get the odds of a finished battle, None if it is still going."""
+        if state.hero_hp <= 0:
+            return BattleOdds(0.0, 0.0)
+        if state.monster_hp <= 0:
+            return BattleOdds(1.0, 0.0)
+        return None
+
+    def _solve_level(self, states: List[SolverState],
+                     transitions: Dict[SolverState, List[Tuple[float, SolverState, int]]],
+                     memo: Dict[SolverState, BattleOdds]) -> None:
+        """
+        Solve the states that share a monster health level.
+
+        Turns that miss keep the battle on the same level and resting can heal the
+        hero back to an earlier state, so a level can loop on itself. Its states
+        are swept until no value moves by more than TOLERANCE. Lower levels are
+        already in memo, so each level is solved once.
+        """
+        # Highest hero health first: damage moves down, so most values are fresh when read
+        states = sorted(states, key=lambda state: -state.hero_hp)
+        win: Dict[SolverState, float] = dict.fromkeys(states, 0.0)
+        hp_loss: Dict[SolverState, float] = dict.fromkeys(states, 0.0)
+        for _ in range(MAX_SWEEPS):
+            change = 0.0
+            for state in states:
+                state_win = state_loss = 0.0
+                for probability, next_state, lost in transitions[state]:
+                    if next_state in win:
+                        next_win, next_loss = win[next_state], hp_loss[next_state]
+                    else:
+                        next_win, next_loss = self._terminal(next_state) or memo[next_state]
+                    state_win += probability * next_win
+                    state_loss += probability * (lost + next_loss)
+                change = max(change, abs(state_win - win[state]), abs(state_loss - hp_loss[state]))
+                win[state] = state_win
+                hp_loss[state] = state_loss
+            if change < TOLERANCE:
+                break
+        for state in states:
+            memo[state] = BattleOdds(win[state], hp_loss[state])
+
+def solve_policy(model: BattleModel, starts: List[SolverState],
+                 flee_value: float = FLEE_VALUE) -> Dict[SolverState, BattleAction]:
+    """
+    Find the best action in every state reachable from starts by value iteration.
+
+    A win is worth 1, a defeat 0 and fleeing flee_value. Like BattleSolver.solve,
+    states are solved one monster health level at a time, lowest first, and each
+    level is swept until no value moves by more than TOLERANCE. Nothing here
+    touches pygame or shared state, so it can run in a worker process.
+
+    Args:
+        model: The battle
+        starts: States the policy must cover
+        flee_value: Value of fleeing
+
+    Returns:
+        Best action for each non-terminal reachable state
+    """
+    # Find the reachable states and the transitions of every action
+    choices: Dict[SolverState, List[Tuple[BattleAction, List[Tuple[float, SolverState, int]]]]] = {}
+    stack = [state for state in starts if BattleSolver._terminal(state) is None]
+    while stack:
+        state = stack.pop()
+        if state in choices:
+            continue
+        options = []
+        for action in model.actions(state):
+            results = [] if action.kind == BattleActions.FLEE else model.transitions(state, action)
+            options.append((action, results))
+            for _, next_state, _ in results:
+                if next_state not in choices and BattleSolver._terminal(next_state) is None:
+                    stack.append(next_state)
+        choices[state] = options
+
+    levels: Dict[int, List[SolverState]] = {}
+    for state in choices:
+        levels.setdefault(state.monster_hp, []).append(state)
+    value: Dict[SolverState, float] = {}
+    policy: Dict[SolverState, BattleAction] = {}
+    for monster_hp in sorted(levels):
+        states = sorted(levels[monster_hp], key=lambda state: -state.hero_hp)
+        index = {state: i for i, state in enumerate(states)}
+        # Lower levels are solved, so each action is a constant plus the part that stays on this level
+        compiled: List[List[Tuple[BattleAction, float, Tuple[Tuple[float, int], ...]]]] = []
+        for state in states:
+            options = []
+            for action, results in choices[state]:
+                if action.kind == BattleActions.FLEE:
+                    options.append((action, flee_value, ()))
+                    continue
+                constant = 0.0
+                loops: Dict[int, float] = {}
+                for probability, next_state, _ in results:
+                    i = index.get(next_state)
+                    if i is not None:
+                        loops[i] = loops.get(i, 0.0) + probability
+                        continue
+                    terminal = BattleSolver._terminal(next_state)
+                    constant += probability * (terminal.win_probability if terminal else value[next_state])
+                options.append((action, constant, tuple((probability, i) for i, probability in loops.items())))
+            compiled.append(options)
+
+        values = [0.0] * len(states)
+        for _ in range(MAX_SWEEPS):
+            change = 0.0
+            for i, options in enumerate(compiled):
+                best = 0.0
+                for _, constant, loops in options:
+                    score = constant
+                    for probability, j in loops:
+                        score += probability * values[j]
+                    if score > best:
+                        best = score
+                if best - values[i] > change:  # Values only grow from 0
+                    change = best - values[i]
+                values[i] = best
+            if change < TOLERANCE:
+                break
+
+        for i, state in enumerate(states):
+            value[state] = values[i]
+            # Ties go to the first action, so fleeing only wins when it is strictly better
+            for action, constant, loops in compiled[i]:
+                if constant + sum(probability * values[j] for probability, j in loops) >= values[i] - TOLERANCE:
+                    policy[state] = action
+                    break
+    return policy
+
+# Shared solver for the live odds on the battle screen
+battle_solver: BattleSolver = BattleSolver()
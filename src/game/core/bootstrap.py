@@ -0,0 +1,117 @@
+import os
+import time
+import pygame
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List
+
+# Set to 1 to print the startup report once the first frame is on screen
+STARTUP_REPORT_ENV_VAR: str = "VILLAGE_DEFENSE_STARTUP_REPORT"
+
+# Time each startup phase may take before the report flags it, in milliseconds
+STARTUP_BUDGET_MS: Dict[str, float] = {
+    "import": 500.0,  # Importing the game modules, including pygame itself
+    "init": 250.0,  # pygame, mixer, display and game managers
+    "assets": 250.0,  # Preloading and preparing images
+    "first_frame": 100.0,  # From entering the main loop to the first presented frame
+}
+
+class StartupProfile:
+    """Records how long each phase of starting the game took."""
+
+    def __init__(self) -> None:
+        """Initialize an empty profile."""
+        self.phases: Dict[str, float] = {}
+
+    def record(self, phase: str, ms: float) -> None:
+        """
+        Add time to a phase.
+
+        Args:
+            phase: Name of the phase, e.g. "init"
+            ms: Time spent in milliseconds
+        """
+        self.phases[phase] = self.phases.get(phase, 0.0) + ms
+
+    @contextmanager
+    def measure(self, phase: str) -> Iterator[None]:
+        """
+        Time the body of a with block and add it to a phase.
+
+        Args:
+            phase: Name of the phase the block belongs to
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(phase, (time.perf_counter() - start) * 1000)
+
+    def total_ms(self) -> float:
+        """
+        Get the time spent in all phases.
+
+        Returns:
+            Total startup time in milliseconds
+        """
+        return sum(self.phases.values())
+
+    def report(self) -> List[Dict[str, Any]]:
+        """
+        Compare each phase against its budget.
+
+        Returns:
+            List of dictionaries with phase, ms, budget_ms and over_budget
+        """
+        return [{
+            "phase": phase,
+            "ms": round(ms, 3),
+            "budget_ms": STARTUP_BUDGET_MS.get(phase),
+            "over_budget": phase in STARTUP_BUDGET_MS and ms > STARTUP_BUDGET_MS[phase],
+        } for phase, ms in self.phases.items()]
+
+    def format_report(self) -> str:
+        """
+        Format the startup report as text.
+
+        Returns:
+            One line per phase with its time and budget, followed by the total
+        """
+        lines = ["Startup time:"]
+        for row in self.report():
+            budget = f"{row['budget_ms']:.0f} ms" if row["budget_ms"] is not None else "no budget"
+            flag = "  OVER BUDGET" if row["over_budget"] else ""
+            lines.append(f"  {row['phase']:<12}{row['ms']:>9.1f} ms  (budget {budget}){flag}")
+        lines.append(f"  {'total':<12}{self.total_ms():>9.1f} ms")
+        return "\n".join(lines)
+
+    def clear(self) -> None:
+        """Forget all recorded phases."""
+        self.phases.clear()
+
+# Shared profile filled in by main.py and Game
+startup_profile: StartupProfile = StartupProfile()
+
+def report_requested() -> bool:
+    """
+    Check if the startup report should be printed.
+
+    Returns:
+        True if the STARTUP_REPORT_ENV_VAR environment variable is set
+    """
+    return os.environ.get(STARTUP_REPORT_ENV_VAR, "0") not in ("", "0")
+
+_initialized: bool = False
+
+def bootstrap() -> None:
+    """Initialize pygame. Nothing pygame-related runs at import time; this is called by Game."""
+    global _initialized
+    if _initialized:
+        return
+    pygame.init()
+    _initialized = True
+
+def shutdown() -> None:
+    """Shut pygame down so a later bootstrap starts it again."""
+    global _initialized
+    pygame.quit()
+    _initialized = False
@@ -17,9 +17,10 @@ class GameState(Enum):
 
 class BattleActions(Enum):
     """Available actions during battle."""
-    ATTACK = 0
-    DEFEND = 1
-    USE_POTION = 2
+    ABILITY = 0
+    USE_POTION = 1
+    REST = 2
+    FLEE = 3
 
 class Colors:
     """Color constants used throughout the game."""
@@ -68,6 +69,10 @@ class GameConstants:
     POPUP_HEIGHT: Final[int] = 300
 
     FPS: Final[int] = 60
+    UPDATE_RATE: Final[int] = 60  # Fixed simulation steps per second
+    MAX_UPDATES_PER_FRAME: Final[int] = 5  # Simulation steps run before a frame is drawn anyway
+    IDLE_TIMEOUT: Final[int] = 1000  # Longest a static screen sleeps waiting for input, in ms
+    AUTO_TURN_DELAY: Final[float] = 0.4  # Seconds between turns while auto-battle is on
 
     BUTTON_WIDTH: Final[int] = 200
     BUTTON_HEIGHT: Final[int] = 50
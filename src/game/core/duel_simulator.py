@@ -0,0 +1,249 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from src.game.entities.ability import AttackAbility
+from src.game.entities.ability_dictionaries import attack_abilities
+from src.game.entities.combat_stats import DEFAULT_ABILITY, hero_class_stats, monster_stats
+from src.game.entities.items import Weapon, armor_dictionary, weapon_dictionary
+
+# Runs many hero vs monster duels at once with NumPy arrays, one array slot per
+# duel. Follows the same rules as BattleEngine, so the numbers can be used to
+# balance stats without playing the game. NumPy is optional and only imported
+# when a simulation is run.
+
+DEFAULT_DUELS: int = 100_000
+DEFAULT_MAX_TURNS: int = 200  # Duels still going after this many turns count as timeouts
+
+def _import_numpy() -> Any:
+    """Import NumPy, with a clear message if it is missing."""
+    try:
+        import numpy
+    except ImportError as error:
+        raise ImportError("The duel simulator needs NumPy, install it with 'pip install numpy'") from error
+    return numpy
+
+@dataclass
+class DuelResults:
+    """Per duel results of a simulation. The arrays hold one value per duel."""
+    hero_class: str
+    monster_name: str
+    won: Any  # bool array, the monster was defeated
+    lost: Any  # bool array, the hero was defeated
+    turns: Any  # int array, turns until the duel ended or timed out
+    hero_hp: Any  # int array, hero health left
+    hero_max_hp: Any  # int array, hero starting health
+
+    @property
+    def duels(self) -> int:
+        """Number of duels simulated."""
+        return int(self.won.size)
+
+    @property
+    def win_rate(self) -> float:
+        """Fraction of duels the hero won."""
+        return float(self.won.mean())
+
+    @property
+    def timeout_rate(self) -> float:
+        """Fraction of duels that hit the turn limit."""
+        return float((~(self.won | self.lost)).mean())
+
+    def turns_histogram(self, wins_only: bool = True) -> Any:
+        """
+        Count how many duels ended after each number of turns.
+
+        Args:
+            wins_only: Only count duels the hero won, i.e. turns to kill
+
+        Returns:
+            Array where index n holds the number of duels that took n turns
+        """
+        numpy = _import_numpy()
+        turns = self.turns[self.won] if wins_only else self.turns
+        return numpy.bincount(turns)
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Summarize the results.
+
+        Returns:
+            Dictionary of win rate, turns to kill and hero health left after a win
+        """
+        numpy = _import_numpy()
+        summary: Dict[str, Any] = {
+            "hero_class": self.hero_class,
+            "monster": self.monster_name,
+            "duels": self.duels,
+            "win_rate": round(self.win_rate, 4),
+            "timeout_rate": round(self.timeout_rate, 4),
+        }
+        if self.won.any():
+            kill_turns = self.turns[self.won]
+            hp_left = self.hero_hp[self.won] / self.hero_max_hp[self.won]
+            p50, p95 = numpy.percentile(kill_turns, [50, 95])
+            summary.update({
+                "turns_mean": round(float(kill_turns.mean()), 2),
+                "turns_p50": float(p50),
+                "turns_p95": float(p95),
+                "hp_left_mean": round(float(self.hero_hp[self.won].mean()), 2),
+                "hp_left_fraction": round(float(hp_left.mean()), 4),
+            })
+        return summary
+
+def attack_priority(weapon: Weapon, ability_names: Iterable[str]) -> List[Tuple[AttackAbility, float]]:
+    """
+    Get the attack abilities among ability_names with their expected damage, best first.
+
+    Args:
+        weapon: The weapon the abilities are used with
+        ability_names: Names of the abilities the hero knows
+
+    Returns:
+        List of (ability, expected damage) tuples
+    """
+    table = []
+    for name in ability_names:
+        ability = attack_abilities.get(name)
+        if not isinstance(ability, AttackAbility):
+            continue  # Defend abilities have no effect on combat yet
+        table.append((ability, ability.expected_damage(weapon)))
+    table.sort(key=lambda entry: entry[1], reverse=True)
+    return table
+
+def simulate_duels(hero_class: str, monster_name: str, duels: int = DEFAULT_DUELS,
+                   seed: Optional[int] = None, max_turns: int = DEFAULT_MAX_TURNS,
+                   hero_level: int = 1, max_energy: int = 10) -> DuelResults:
+    """
+    Simulate many duels between a new hero and a freshly spawned monster.
+
+    Each turn the hero uses the affordable, ready attack ability with the best
+    expected damage, or rests if there is none. The monster then attacks,
+    and the hero's armor may dodge or block. Potions are not used.
+
+    Args:
+        hero_class: Name of the hero class, e.g. "Knight"
+        monster_name: Name of the monster, e.g. "Goblin"
+        duels: Number of duels to run at once
+        seed: Seed of the NumPy generator, or None for a random one
+        max_turns: Turn limit of a duel
+        hero_level: Hero level, sets how much health resting restores
+        max_energy: Hero energy
+
+    Returns:
+        The results of every duel
+    """
+    numpy = _import_numpy()
+    if duels <= 0:
+        raise ValueError("duels must be greater than 0")
+    generator = numpy.random.default_rng(seed)
+    hero_stats = hero_class_stats[hero_class]
+    monster = monster_stats[monster_name]
+    weapon = weapon_dictionary[hero_stats.weapon]
+    armor = armor_dictionary[hero_stats.armor]
+
+    # Per ability constants, ordered by preference
+    abilities = attack_priority(weapon, (DEFAULT_ABILITY,) + hero_stats.abilities)
+    accuracy = numpy.array([min(1.0, weapon.accuracy * a.accuracy_modifier) for a, _ in abilities])
+    crit_chance = numpy.array([min(1.0, weapon.crit_chance * a.crit_chance_modifier) for a, _ in abilities])
+    base_damage = numpy.array([int(weapon.damage * a.damage_multiplier) for a, _ in abilities])
+    crit_damage = numpy.array([int(int(weapon.damage * a.damage_multiplier) * (weapon.crit_damage * a.crit_damage_modifier))
+                               for a, _ in abilities])
+    cooldown = numpy.array([a.cooldown for a, _ in abilities])
+    energy_cost = numpy.array([a.energy_cost for a, _ in abilities])
+
+    # Per duel state
+    hero_max_hp = generator.integers(hero_stats.health[0], hero_stats.health[1] + 1, size=duels)
+    hero_hp = hero_max_hp.copy()
+    energy = numpy.full(duels, max_energy)
+    cooldowns = numpy.zeros((duels, len(abilities)), dtype=numpy.int64)
+    monster_hp = generator.integers(*monster.health, size=duels)
+    monster_damage = generator.integers(*monster.damage, size=duels)
+    turns = numpy.zeros(duels, dtype=numpy.int64)
+    won = numpy.zeros(duels, dtype=bool)
+    lost = numpy.zeros(duels, dtype=bool)
+
+    active = numpy.arange(duels)
+    for turn in range(1, max_turns + 1):
+        if active.size == 0:
+            break
+        turns[active] = turn
+
+        # Pick the first ready, affordable ability, -1 means rest
+        ready = (cooldowns[active] == 0) & (energy[active][:, None] >= energy_cost)
+        has_choice = ready.any(axis=1)
+        choice = numpy.where(has_choice, ready.argmax(axis=1), -1)
+
+        attacking = active[has_choice]
+        picked = choice[has_choice]
+        hit_roll = generator.random(attacking.size)
+        crit_roll = generator.random(attacking.size)
+        hit = hit_roll <= accuracy[picked]
+        critical = crit_roll < crit_chance[picked]
+        damage = numpy.where(hit, numpy.where(critical, crit_damage[picked], base_damage[picked]), 0)
+        monster_hp[attacking] = numpy.maximum(monster_hp[attacking] - damage, 0)
+        energy[attacking] -= energy_cost[picked]
+        cooldowns[attacking, picked] = cooldown[picked]
+
+        resting = active[~has_choice]
+        energy[resting] = max_energy
+        hero_hp[resting] = numpy.minimum(hero_hp[resting] + hero_level * 5, hero_max_hp[resting])
+
+        # Cooldowns tick at the end of the hero's turn
+        cooldowns[active] = numpy.maximum(cooldowns[active] - 1, 0)
+
+        # Monsters still standing strike back
+        alive = monster_hp[active] > 0
+        striking = active[alive]
+        dodge_roll = generator.random(striking.size)
+        block_roll = generator.random(striking.size)
+        incoming = monster_damage[striking]
+        dodged = dodge_roll < armor.dodge_chance
+        blocked = ~dodged & (block_roll < armor.block_chance)
+        incoming = numpy.where(dodged, 0, numpy.where(blocked, numpy.maximum(incoming - armor.block, 0), incoming))
+        hero_hp[striking] = numpy.maximum(hero_hp[striking] - incoming, 0)
+
+        # Same order as BattleEngine.outcome, a downed hero loses even if the monster fell
+        defeated = hero_hp[active] <= 0
+        victorious = ~defeated & ~alive
+        lost[active[defeated]] = True
+        won[active[victorious]] = True
+        active = active[~(defeated | victorious)]
+
+    return DuelResults(hero_class, monster_name, won, lost, turns, hero_hp, hero_max_hp)
+
+def balance_table(duels: int = DEFAULT_DUELS, seed: Optional[int] = None,
+                  max_turns: int = DEFAULT_MAX_TURNS) -> List[Dict[str, Any]]:
+    """
+    Simulate every hero class against every monster.
+
+    Args:
+        duels: Number of duels per pairing
+        seed: Seed of the first pairing, the others use seed + their index
+        max_turns: Turn limit of a duel
+
+    Returns:
+        One summary dictionary per pairing
+    """
+    rows = []
+    index = 0
+    for hero_class in hero_class_stats:
+        for monster_name in monster_stats:
+            pairing_seed = None if seed is None else seed + index
+            results = simulate_duels(hero_class, monster_name, duels, pairing_seed, max_turns)
+            rows.append(results.summary())
+            index += 1
+    return rows
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Simulate hero vs monster duels for balance analysis.")
+    parser.add_argument("--duels", type=int, default=DEFAULT_DUELS, help="Duels per pairing")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for reproducible results")
+    parser.add_argument("--max-turns", type=int, default=DEFAULT_MAX_TURNS, help="Turn limit of a duel")
+    args = parser.parse_args()
+
+    print(f"{'Hero':<10}{'Monster':<8}{'Win':>8}{'Turns':>8}{'p95':>6}{'HP left':>9}")
+    for row in balance_table(args.duels, args.seed, args.max_turns):
+        print(f"{row['hero_class']:<10}{row['monster']:<8}{row['win_rate']:>8.1%}"
+              f"{row.get('turns_mean', 0):>8.2f}{row.get('turns_p95', 0):>6.0f}"
+              f"{row.get('hp_left_fraction', 0):>9.1%}")
@@ -0,0 +1,229 @@
+import copy
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from src.game.core.battle_engine import BattleAction, BattleEngine, BattleOutcome
+from src.game.core.combatant import Combatant
+from src.game.core.constants import BattleActions
+from src.game.core.duel_simulator import attack_priority
+from src.game.entities.ability import Ability
+from src.game.entities.ability_dictionaries import attack_abilities, defense_abilities
+from src.game.entities.combat_stats import monster_stats
+from src.game.entities.items import armor_dictionary, weapon_dictionary
+from src.game.managers.rng_manager import RandomStream
+
+# Plays whole quests out many times with BattleEngine to estimate how likely a
+# hero build is to finish them. Nothing here imports pygame, so the functions
+# can run in worker processes.
+
+ESTIMATE_VERSION: int = 1  # Bump when the simulated rules change, old cached estimates are then ignored
+DEFAULT_TRIALS: int = 2000
+MAX_TURNS: int = 200  # A battle still going after this many turns counts as lost
+
+# Success rate thresholds of the difficulty ratings, highest first
+DIFFICULTY_RATINGS: Tuple[Tuple[float, str], ...] = (
+    (0.9, "Easy"),
+    (0.7, "Fair"),
+    (0.4, "Hard"),
+    (0.0, "Deadly"),
+)
+
+class HeroBuild(NamedTuple):
+    """Everything about a hero that changes how a quest goes."""
+    class_name: str
+    level: int
+    max_hp: int
+    weapon: str
+    armor: str  # Empty if the hero has no armor
+    abilities: Tuple[str, ...]
+
+    @classmethod
+    def from_hero(cls, hero: Any) -> "HeroBuild":
+        """
+        Get the build of a hero.
+
+        Args:
+            hero: The hero
+
+        Returns:
+            The hero's build
+        """
+        return cls(hero.class_name, hero.level, hero.max_hp,
+                   hero.weapon.name if hero.weapon else "",
+                   hero.armor.name if hero.armor else "",
+                   tuple(sorted(ability.name for ability in hero.abilities)))
+
+class QuestEstimate(NamedTuple):
+    """Results of playing a quest out many times."""
+    quest: str
+    trials: int
+    success_rate: float
+    expected_gold: float  # Gold from slain monsters, failed runs included
+    expected_hp_loss: float  # Health lost by the end of the quest
+
+    @property
+    def difficulty(self) -> str:
+        """Difficulty rating of the quest for the build."""
+        for threshold, rating in DIFFICULTY_RATINGS:
+            if self.success_rate >= threshold:
+                return rating
+        return DIFFICULTY_RATINGS[-1][1]
+
+class QuestTally(NamedTuple):
+    """Summed results of a batch of trials, so batches from several workers can be added up."""
+    trials: int
+    successes: int
+    gold: int
+    hp_loss: int
+
+class _SimulatedHero(Combatant):
+    """The parts of a Hero that BattleEngine uses, without any pygame."""
+
+    def __init__(self, build: HeroBuild) -> None:
+        """
+        Initialize a hero from a build.
+
+        Args:
+            build: The build to simulate
+        """
+        super().__init__(build.class_name, build.max_hp)
+        self.level: int = build.level
+        self.weapon = weapon_dictionary[build.weapon]
+        self.armor = armor_dictionary.get(build.armor)
+        # Copies, the abilities in the dictionaries are shared by every hero
+        self.abilities: List[Ability] = []
+        for name in build.abilities:
+            ability = attack_abilities.get(name) or defense_abilities.get(name)
+            if ability is not None:
+                self.abilities.append(copy.copy(ability))
+        self.energy: int = 10
+        self.max_energy: int = 10
+        self.potion_block: int = 0
+
+    def reset(self) -> None:
+        """Heal the hero and clear cooldowns before a new run."""
+        self.current_hp = self.max_hp
+        self.energy = self.max_energy
+        for ability in self.abilities:
+            ability.current_cooldown = 0
+
+    def rest(self) -> None:
+        """Same as Hero.rest."""
+        self.energy = self.max_energy
+        self.current_hp = min(self.current_hp + self.level * 5, self.max_hp)
+        self.update_abilities()
+
+    def update_abilities(self) -> None:
+        """Same as Hero.update_abilities."""
+        for ability in self.abilities:
+            ability.update_cooldown()
+
+    def apply_potion(self, potion_name: str) -> bool:
+        """The simulated hero carries no potions."""
+        return False
+
+class _SimulatedMonster(Combatant):
+    """The parts of a Monster that BattleEngine uses."""
+
+    def __init__(self, name: str, spawn_rng: RandomStream) -> None:
+        """
+        Spawn a monster, rolling its stats like Monster does.
+
+        Args:
+            name: Name of the monster, e.g. "Goblin"
+            spawn_rng: Stream for the stat rolls
+        """
+        stats = monster_stats[name]
+        super().__init__(name, spawn_rng.randrange(*stats.health))
+        self.damage: int = spawn_rng.randrange(*stats.damage)
+        self.gold: int = spawn_rng.randrange(*stats.gold)
+
+def simulate_quest(build: HeroBuild, monster_list: Dict[str, int], trials: int, seed: str) -> QuestTally:
+    """
+    Play a quest out a number of times.
+
+    Monsters are drawn like Quest.get_monster does. Each turn the hero uses the
+    ready attack ability with the best expected damage, or rests if none is
+    ready. Health and cooldowns carry over between the battles of a run.
+    The hero drinks no potions and gains no levels, so the estimate errs on
+    the cautious side.
+
+    Args:
+        build: The hero build
+        monster_list: Monsters to slay, by name
+        trials: Number of runs
+        seed: Seed of the random streams
+
+    Returns:
+        The summed results of the runs
+    """
+    engine = BattleEngine(RandomStream("estimate-combat", seed))
+    spawn_rng = RandomStream("estimate-spawn", seed)
+    hero = _SimulatedHero(build)
+    priority = [ability.name for ability, _ in attack_priority(hero.weapon, build.abilities)]
+    known = {ability.name: ability for ability in hero.abilities}
+    order = [known[name] for name in priority]
+    rest = BattleAction(BattleActions.REST)
+    actions = {ability.name: BattleAction(BattleActions.ABILITY, ability.name) for ability in order}
+
+    successes = gold = hp_loss = 0
+    for _ in range(trials):
+        hero.reset()
+        remaining = dict(monster_list)
+        while True:
+            living = [name for name, count in remaining.items() if count > 0]
+            if not living:
+                successes += 1
+                break
+            monster = _SimulatedMonster(spawn_rng.choice(living), spawn_rng)
+            outcome = BattleOutcome.ONGOING
+            for _turn in range(MAX_TURNS):
+                action = rest
+                for ability in order:
+                    if ability.current_cooldown == 0 and hero.energy >= ability.energy_cost:
+                        action = actions[ability.name]
+                        break
+                engine.resolve(hero, monster, action)
+                outcome = engine.outcome(hero, monster)
+                if outcome != BattleOutcome.ONGOING:
+                    break
+            if outcome != BattleOutcome.VICTORY:
+                break
+            gold += monster.gold
+            remaining[monster.name] -= 1
+        hp_loss += hero.max_hp - hero.current_hp
+    return QuestTally(trials, successes, gold, hp_loss)
+
+def combine(quest: str, tallies: List[QuestTally]) -> QuestEstimate:
+    """
+    Turn the tallies of one quest into an estimate.
+
+    Args:
+        quest: Name of the quest
+        tallies: Results of every batch of trials
+
+    Returns:
+        The estimate
+    """
+    trials = sum(tally.trials for tally in tallies)
+    if trials == 0:
+        return QuestEstimate(quest, 0, 0.0, 0.0, 0.0)
+    return QuestEstimate(quest, trials,
+                         sum(tally.successes for tally in tallies) / trials,
+                         sum(tally.gold for tally in tallies) / trials,
+                         sum(tally.hp_loss for tally in tallies) / trials)
+
+def estimate_quest(build: HeroBuild, quest: str, monster_list: Dict[str, int],
+                   trials: int = DEFAULT_TRIALS, seed: Optional[int] = 0) -> QuestEstimate:
+    """
+    Estimate a quest in this process. EstimateManager runs the same simulation in worker processes.
+
+    Args:
+        build: The hero build
+        quest: Name of the quest
+        monster_list: Monsters to slay, by name
+        trials: Number of runs
+        seed: Seed of the runs
+
+    Returns:
+        The estimate
+    """
+    return combine(quest, [simulate_quest(build, monster_list, trials, f"{seed}:{quest}:0")])
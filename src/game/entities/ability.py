@@ -1,7 +1,7 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from src.game.core.combatant import Combatant
 from dataclasses import dataclass
-from random import random
+from src.game.managers.rng_manager import rng, COMBAT_STREAM, RandomStream
 
 @dataclass
 class AbilityEffect:
@@ -105,31 +105,73 @@ class AttackAbility(Ability):
             raise ValueError("Hero must have a weapon equipped!")
             
         effect = super().use(user, target)
+        effect.damage, effect.missed, effect.critical = self.roll(user.weapon)
+        if effect.missed:
+            return effect
+            
+        # Apply damage to target
+        if target:
+            target.take_damage(effect.damage)
+            
+        return effect
+
+    def roll(self, weapon: Any, combat_rng: Optional[RandomStream] = None) -> Tuple[int, bool, bool]:
+        """
+        Roll the hit and crit of an attack with a weapon, without using the ability.
         
+        Args:
+            weapon: The attacker's weapon
+            combat_rng: Stream for the rolls, defaults to the shared combat stream
+            
+        Returns:
+            Tuple of (damage, missed, critical)
+        """
         # Calculate modified weapon stats
-        accuracy = min(1.0, user.weapon.accuracy * self.accuracy_modifier)
-        crit_chance = min(1.0, user.weapon.crit_chance * self.crit_chance_modifier)
-        crit_damage = user.weapon.crit_damage * self.crit_damage_modifier
-        base_damage = int(user.weapon.damage * self.damage_multiplier)
+        accuracy = min(1.0, weapon.accuracy * self.accuracy_modifier)
+        crit_chance = min(1.0, weapon.crit_chance * self.crit_chance_modifier)
+        base_damage = int(weapon.damage * self.damage_multiplier)
         
         # Check for miss
-        if random() > accuracy:
-            effect.missed = True
-            effect.damage = 0
-            return effect
+        if combat_rng is None:
+            combat_rng = rng.stream(COMBAT_STREAM)
+        if combat_rng.random() > accuracy:
+            return 0, True, False
             
         # Check for critical hit
-        if random() < crit_chance:
-            effect.critical = True
-            effect.damage = int(base_damage * crit_damage)
-        else:
-            effect.damage = base_damage
+        if combat_rng.random() < crit_chance:
+            crit_damage = weapon.crit_damage * self.crit_damage_modifier
+            return int(base_damage * crit_damage), False, True
+        return base_damage, False, False
+
+    def outcomes(self, weapon: Any) -> List[Tuple[float, int]]:
+        """
+        Get every result roll can give with its probability.
+        
+        Args:
+            weapon: The attacker's weapon
             
-        # Apply damage to target
-        if target:
-            target.take_damage(effect.damage)
+        Returns:
+            List of (probability, damage) tuples, a miss deals 0 damage
+        """
+        accuracy = min(1.0, weapon.accuracy * self.accuracy_modifier)
+        crit_chance = min(1.0, weapon.crit_chance * self.crit_chance_modifier)
+        base_damage = int(weapon.damage * self.damage_multiplier)
+        crit_damage = int(base_damage * (weapon.crit_damage * self.crit_damage_modifier))
+        results = [(1.0 - accuracy, 0), (accuracy * (1.0 - crit_chance), base_damage),
+                   (accuracy * crit_chance, crit_damage)]
+        return [(probability, damage) for probability, damage in results if probability > 0]
+
+    def expected_damage(self, weapon: Any) -> float:
+        """
+        Get the average damage of the ability with a weapon.
+        
+        Args:
+            weapon: The attacker's weapon
             
-        return effect
+        Returns:
+            Expected damage per use
+        """
+        return sum(probability * damage for probability, damage in self.outcomes(weapon))
 
 class DefendAbility(Ability):
     """An ability that provides defensive benefits."""
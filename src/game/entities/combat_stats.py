@@ -0,0 +1,36 @@
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+# Plain stat tables shared by the entity classes and the balance simulators.
+# Nothing here imports pygame.
+
+DEFAULT_ABILITY: str = "Strike"  # Every hero starts with it
+
+@dataclass(frozen=True)
+class MonsterStats:
+    """Stat ranges of a monster type. Ranges include low and exclude high, like randrange."""
+    health: Tuple[int, int]
+    damage: Tuple[int, int]
+    gold: Tuple[int, int]
+    image_name: str
+
+@dataclass(frozen=True)
+class HeroClassStats:
+    """Starting stats of a hero class."""
+    health: Tuple[int, int]  # Includes both ends, like randint
+    weapon: str
+    armor: str
+    abilities: Tuple[str, ...]  # Learned on top of DEFAULT_ABILITY
+
+monster_stats: Dict[str, MonsterStats] = {
+    "Goblin": MonsterStats(health=(5, 10), damage=(1, 3), gold=(0, 5), image_name="goblin_image.jpg"),
+    "Orc": MonsterStats(health=(10, 17), damage=(2, 5), gold=(6, 10), image_name="orc_image.jpg"),
+    "Ogre": MonsterStats(health=(17, 25), damage=(4, 8), gold=(11, 20), image_name="ogre_image.jpg"),
+}
+
+hero_class_stats: Dict[str, HeroClassStats] = {
+    "Knight": HeroClassStats(health=(10, 15), weapon="Rusty Sword", armor="Iron Chestplate",
+                             abilities=("Power Attack", "Guard")),
+    "Assassin": HeroClassStats(health=(7, 12), weapon="Iron Knife", armor="Shadow Cloak",
+                               abilities=("Precise Strike", "Critical Strike")),
+}
@@ -1,11 +1,12 @@
-from random import randint
 from typing import Dict, Union, Optional, Tuple, Any, List
 from src.game.entities.items import Item, Armor, Weapon, weapon_dictionary, armor_dictionary
 from src.game.entities.ability import Ability
 from src.game.entities.ability_dictionaries import attack_abilities, defense_abilities
+from src.game.entities.combat_stats import DEFAULT_ABILITY, hero_class_stats
 from src.game.ui.ui_helpers import *
 from src.game.core.combatant import Combatant
-from src.game.utils.fileIO import resource_path
+from src.game.managers.asset_manager import asset_manager, image_path
+from src.game.managers.rng_manager import rng, HERO_STREAM
 import pygame
 
 # Type aliases
@@ -55,7 +56,7 @@ class Hero(Combatant):
         self.energy: int = 10
         self.max_energy: int = 10
 
-        self.add_ability("Strike")  # Default ability for all heroes
+        self.add_ability(DEFAULT_ABILITY)  # Default ability for all heroes
 
         # TODO Change Hero Abilities to be three lists of Attack Defense and Utility abilities
 
@@ -139,22 +140,37 @@ class Hero(Combatant):
         Args:
             potion_name: Name of the potion to use
         """
-        if potion_name in self.potion_bag and self.potion_bag[potion_name] > 0:
+        if self.apply_potion(potion_name):
             if potion_name == "Health Potion":
-                self.current_hp += 5
-                if self.current_hp > self.max_hp:
-                    self.current_hp = self.max_hp
                 print(f"{self.name} used a Health Potion! Health is now {self.current_hp}.")
             elif potion_name == "Damage Potion":
-                self.potion_damage = 3
                 print(f"{self.name} used a Damage Potion! Damage increased by {self.potion_damage}.")
             elif potion_name == "Block Potion":
-                self.potion_block = 2
                 print(f"{self.name} used a Block Potion! Block increased by {self.potion_block}.")
-            self.potion_bag[potion_name] -= 1
         else:
             print(f"You don't have any {potion_name}(s) left!")
 
+    def apply_potion(self, potion_name: str) -> bool:
+        """
+        Drink a potion from the hero's inventory without printing anything.
+        
+        Args:
+            potion_name: Name of the potion to use
+            
+        Returns:
+            bool: True if the hero had the potion, False otherwise
+        """
+        if self.potion_bag.get(potion_name, 0) <= 0:
+            return False
+        if potion_name == "Health Potion":
+            self.current_hp = min(self.current_hp + 5, self.max_hp)
+        elif potion_name == "Damage Potion":
+            self.potion_damage = 3
+        elif potion_name == "Block Potion":
+            self.potion_block = 2
+        self.potion_bag[potion_name] -= 1
+        return True
+
     def add_gold(self, amount: int) -> None:
         """
         Add gold to the hero's inventory.
@@ -329,12 +345,11 @@ class Hero(Combatant):
         self.energy = data.get("energy", 10)
         self.max_energy = data.get("max_energy", 10)
         if self.class_name == "Knight":
-            self.image = pygame.image.load(resource_path("src\\game\\assets\\images\\knight.png")).convert()
+            self.image = asset_manager.get_image(image_path("knight.png"), size=(100, 100))
         else:
-            self.image = pygame.image.load(resource_path("src\\game\\assets\\images\\assassin.png")).convert()
-        self.image = pygame.transform.scale(self.image, (100, 100))
+            self.image = asset_manager.get_image(image_path("assassin.png"), size=(100, 100))
 
-        self.add_ability("Strike")
+        self.add_ability(DEFAULT_ABILITY)
 
     def draw(self, surface: pygame.Surface, font: pygame.font.Font, 
             x: int = 0, y: int = 0) -> None:
@@ -425,15 +440,15 @@ class Assassin(Hero):
         Args:
             name: The assassin's name
         """
-        image = pygame.image.load(resource_path("src\\game\\assets\\images\\assassin.png")).convert()
-        image = pygame.transform.scale(image, (100, 100))
-        health = randint(7, 12)
-        weapon = weapon_dictionary["Iron Knife"]
-        armor = armor_dictionary["Shadow Cloak"]
+        stats = hero_class_stats["Assassin"]
+        image = asset_manager.get_image(image_path("assassin.png"), size=(100, 100))
+        health = rng.stream(HERO_STREAM).randint(*stats.health)
+        weapon = weapon_dictionary[stats.weapon]
+        armor = armor_dictionary[stats.armor]
         super().__init__(name, health, image, weapon, armor, border_color=Colors.GREEN, class_name="Assassin")
         # Add Assassin starting abilities
-        self.add_ability("Precise Strike")
-        self.add_ability("Critical Strike")
+        for ability_name in stats.abilities:
+            self.add_ability(ability_name)
 
 class Knight(Hero):
     """A class representing a Knight hero."""
@@ -445,15 +460,15 @@ class Knight(Hero):
         Args:
             name: The knight's name
         """
-        image = pygame.image.load(resource_path("src\\game\\assets\\images\\knight.png")).convert()
-        image = pygame.transform.scale(image, (100, 100))
-        health = randint(10, 15)
-        weapon = weapon_dictionary["Rusty Sword"]
-        armor = armor_dictionary["Iron Chestplate"]
+        stats = hero_class_stats["Knight"]
+        image = asset_manager.get_image(image_path("knight.png"), size=(100, 100))
+        health = rng.stream(HERO_STREAM).randint(*stats.health)
+        weapon = weapon_dictionary[stats.weapon]
+        armor = armor_dictionary[stats.armor]
         super().__init__(name, health, image, weapon, armor, border_color=Colors.RED, class_name="Knight")
         # Add Knight starting abilities
-        self.add_ability("Power Attack")
-        self.add_ability("Guard")
+        for ability_name in stats.abilities:
+            self.add_ability(ability_name)
 
 def make_hero(hero_name: str, hero_class: str) -> Hero:
     """
@@ -1,5 +1,5 @@
-from random import random
-from typing import Dict, Union
+from src.game.managers.rng_manager import rng, COMBAT_STREAM, RandomStream
+from typing import Dict, List, Optional, Tuple, Union
 
 class Item:
     """
@@ -35,11 +35,12 @@ class Weapon(Item):
         self.crit_damage: float = crit_damage
 
     def calculate_damage(self) -> int:
-        if random() > self.accuracy:
+        combat_rng = rng.stream(COMBAT_STREAM)
+        if combat_rng.random() > self.accuracy:
             print("Attack missed!")
             return 0
         
-        if random() < self.crit_chance:
+        if combat_rng.random() < self.crit_chance:
             effective_damage = int(self.damage * self.crit_damage)
             print("Critical Hit!")
         else:
@@ -66,16 +67,37 @@ class Armor(Item):
         self.dodge_chance: float = dodge_chance
 
     def calculate_defence(self, incoming_damage: int) -> int:
-        if random() < self.dodge_chance:
+        final_damage, dodged, blocked = self.roll_defence(incoming_damage)
+        if dodged:
             print("Attack dodged!")
-            return 0
-        
-        if random() < self.block_chance:
-            final_damage = max(incoming_damage - self.block, 0)
+        elif blocked:
             print(f"Attack blocked! Damage reduced by {self.block} points.")
-        else:
-            final_damage = incoming_damage
         return final_damage
+
+    def roll_defence(self, incoming_damage: int,
+                     combat_rng: Optional[RandomStream] = None) -> Tuple[int, bool, bool]:
+        """
+        :param incoming_damage: Damage before armor.
+        :param combat_rng:      Stream for the dodge and block rolls, defaults to the shared combat stream.
+        :return:                The damage after armor, whether it was dodged and whether it was blocked.
+        """
+        if combat_rng is None:
+            combat_rng = rng.stream(COMBAT_STREAM)
+        if combat_rng.random() < self.dodge_chance:
+            return 0, True, False
+        if combat_rng.random() < self.block_chance:
+            return max(incoming_damage - self.block, 0), False, True
+        return incoming_damage, False, False
+
+    def defence_outcomes(self, incoming_damage: int) -> List[Tuple[float, int]]:
+        """
+        :param incoming_damage: Damage before armor.
+        :return:                Every result roll_defence can give as (probability, damage after armor) tuples.
+        """
+        blocked_chance = (1.0 - self.dodge_chance) * self.block_chance
+        results = [(self.dodge_chance, 0), (blocked_chance, max(incoming_damage - self.block, 0)),
+                   (1.0 - self.dodge_chance - blocked_chance, incoming_damage)]
+        return [(probability, damage) for probability, damage in results if probability > 0]
     
     def __str__(self) -> str:
         base_info = super().__str__()
@@ -1,9 +1,10 @@
-from typing import Dict, Union, Optional
+from typing import Dict, Union, Optional, Tuple
 from src.game.core.constants import *
 from src.game.ui.ui_helpers import *
 from src.game.core.combatant import Combatant
-from src.game.utils.fileIO import resource_path
-import random
+from src.game.managers.asset_manager import asset_manager, image_path
+from src.game.managers.rng_manager import rng, SPAWN_STREAM
+from src.game.entities.combat_stats import monster_stats
 import pygame
 
 # Type aliases
@@ -13,6 +14,8 @@ MonsterDict = Dict[str, Union[str, int]]
 class Monster(Combatant):
     """A base class for all monsters in the game."""
     # TODO update monsters to use weapons and abilities
+
+    PORTRAIT_SIZE: Tuple[int, int] = (100, 100)
     
     def __init__(self, name_or_data: Union[str, MonsterDict], max_hp: int = 10, 
                 damage: int = 1, gold: int = 10, image: str = "goblin_image.jpg") -> None:
@@ -40,6 +43,7 @@ class Monster(Combatant):
             self.gold: int = gold
             self.image: str = image
             print("A new monster appears!")
+        self.portrait: Optional[pygame.Surface] = None
         # Always calculate experience based on max_hp and damage
         self.experience: int = (self.max_hp + self.damage) // 2
 
@@ -56,6 +60,19 @@ class Monster(Combatant):
         """Returns the name of the monster."""
         return self.name
 
+    @classmethod
+    def get_portrait(cls, image: str) -> pygame.Surface:
+        """
+        Get the scaled portrait for an image, decoding it on first use.
+
+        Args:
+            image: The monster's image filename
+
+        Returns:
+            The shared portrait surface for that image
+        """
+        return asset_manager.get_image(image_path(image), size=cls.PORTRAIT_SIZE)
+
     def to_dict(self) -> MonsterDict:
         """
         Convert monster data to a dictionary for saving.
@@ -107,8 +124,9 @@ class Monster(Combatant):
 
         draw_text(self.name, font, Colors.BLACK, surface, 
                     monster_border.x + 20, monster_border.y + 10)
-        monster_image = pygame.image.load(resource_path(f"src\\game\\assets\\images\\{self.image}")).convert()
-        monster_image = pygame.transform.scale(monster_image, (100, 100))
+        if self.portrait is None:
+            self.portrait = Monster.get_portrait(self.image)
+        monster_image = self.portrait
         surface.blit(monster_image, (monster_border.x + 10, 
                     monster_border.y + font.get_linesize() + 10))
         
@@ -122,12 +140,10 @@ class Monster(Combatant):
 
 class Goblin(Monster):
     """A class representing a Goblin monster."""
-    healthLow: int = 5
-    healthHigh: int = 10
-    damageLow: int = 1
-    damageHigh: int = 3
-    goldLow: int = 0
-    goldHigh: int = 5
+    healthLow, healthHigh = monster_stats["Goblin"].health
+    damageLow, damageHigh = monster_stats["Goblin"].damage
+    goldLow, goldHigh = monster_stats["Goblin"].gold
+    image_name: str = monster_stats["Goblin"].image_name
 
     def __init__(self, name: str = "Goblin") -> None:
         """
@@ -136,19 +152,18 @@ class Goblin(Monster):
         Args:
             name: The name of the goblin
         """
-        health = random.randrange(self.healthLow, self.healthHigh)
-        damage = random.randrange(self.damageLow, self.damageHigh)
-        gold = random.randrange(self.goldLow, self.goldHigh)
-        super().__init__(name, health, damage, gold, image="goblin_image.jpg")
+        spawn_rng = rng.stream(SPAWN_STREAM)
+        health = spawn_rng.randrange(self.healthLow, self.healthHigh)
+        damage = spawn_rng.randrange(self.damageLow, self.damageHigh)
+        gold = spawn_rng.randrange(self.goldLow, self.goldHigh)
+        super().__init__(name, health, damage, gold, image=self.image_name)
 
 class Orc(Monster):
     """A class representing an Orc monster."""
-    healthLow: int = 10
-    healthHigh: int = 17
-    damageLow: int = 2
-    damageHigh: int = 5
-    goldLow: int = 6
-    goldHigh: int = 10
+    healthLow, healthHigh = monster_stats["Orc"].health
+    damageLow, damageHigh = monster_stats["Orc"].damage
+    goldLow, goldHigh = monster_stats["Orc"].gold
+    image_name: str = monster_stats["Orc"].image_name
 
     def __init__(self, name: str = "Orc") -> None:
         """
@@ -157,19 +172,18 @@ class Orc(Monster):
         Args:
             name: The name of the orc
         """
-        health = random.randrange(self.healthLow, self.healthHigh)
-        damage = random.randrange(self.damageLow, self.damageHigh)
-        gold = random.randrange(self.goldLow, self.goldHigh)
-        super().__init__(name, health, damage, gold, image="orc_image.jpg")
+        spawn_rng = rng.stream(SPAWN_STREAM)
+        health = spawn_rng.randrange(self.healthLow, self.healthHigh)
+        damage = spawn_rng.randrange(self.damageLow, self.damageHigh)
+        gold = spawn_rng.randrange(self.goldLow, self.goldHigh)
+        super().__init__(name, health, damage, gold, image=self.image_name)
 
 class Ogre(Monster):
     """A class representing an Ogre monster."""
-    healthLow: int = 17
-    healthHigh: int = 25
-    damageLow: int = 4
-    damageHigh: int = 8
-    goldLow: int = 11
-    goldHigh: int = 20
+    healthLow, healthHigh = monster_stats["Ogre"].health
+    damageLow, damageHigh = monster_stats["Ogre"].damage
+    goldLow, goldHigh = monster_stats["Ogre"].gold
+    image_name: str = monster_stats["Ogre"].image_name
 
     def __init__(self, name: str = "Ogre") -> None:
         """
@@ -178,10 +192,11 @@ class Ogre(Monster):
         Args:
             name: The name of the ogre
         """
-        health = random.randrange(self.healthLow, self.healthHigh)
-        damage = random.randrange(self.damageLow, self.damageHigh)
-        gold = random.randrange(self.goldLow, self.goldHigh)
-        super().__init__(name, health, damage, gold, image="ogre_image.jpg")
+        spawn_rng = rng.stream(SPAWN_STREAM)
+        health = spawn_rng.randrange(self.healthLow, self.healthHigh)
+        damage = spawn_rng.randrange(self.damageLow, self.damageHigh)
+        gold = spawn_rng.randrange(self.goldLow, self.goldHigh)
+        super().__init__(name, health, damage, gold, image=self.image_name)
 
 def get_monster(level_or_name: Union[int, str] = "Goblin") -> Monster:
     """
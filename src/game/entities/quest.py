@@ -2,7 +2,9 @@ from src.game.entities.monster import *
 from src.game.ui.ui_helpers import *
 from src.game.ui.spritesheet import SpriteSheet
 from src.game.entities.items import potion_dictionary, Item
-import random
+from src.game.managers.font_manager import font_manager
+from src.game.managers.rng_manager import rng, SPAWN_STREAM
+from src.game.core.quest_estimator import QuestEstimate
 import pygame
 from typing import Dict, Optional, Tuple, List, Set, Union
 
@@ -34,6 +36,7 @@ class Quest:
         self.monsters_slain: MonsterCount = {}
         for key in monster_list:
             self.monsters_slain[key] = 0
+        self.version: int = 0  # Incremented whenever quest progress changes
 
     def get_monster(self) -> Optional[Monster]:
         """
@@ -49,7 +52,7 @@ class Quest:
                 living_monsters.append(monster_type)
         
         if living_monsters:
-            return get_monster(random.choice(living_monsters))
+            return get_monster(rng.stream(SPAWN_STREAM).choice(living_monsters))
         return None
 
     def slay_monster(self, monster: Monster) -> None:
@@ -61,6 +64,7 @@ class Quest:
         """
         if monster.name in self.monsters_slain.keys():
             self.monsters_slain[monster.name] += 1
+            self.version += 1
 
     def is_complete(self) -> bool:
         """
@@ -120,6 +124,11 @@ class QuestButton(Button):
         self.quest: Quest = quest
         self.selected: bool = False
         self.failed: bool = False
+        self.estimate: Optional[QuestEstimate] = None  # Difficulty for the current hero, once worked out
+        # Pre-rendered button surfaces keyed by button state
+        self._surfaces: Dict[int, pygame.Surface] = {}
+        self._quest_version: int = quest.version
+        self._rendered_size: Tuple[int, int] = self.rect.size
         if self.quest.is_complete():
             self.select()  # Set to selected state if quest is complete
 
@@ -127,60 +136,108 @@ class QuestButton(Button):
         """Mark the quest as failed and lock it."""
         self.failed = True
         self.lock()  # Lock the button when failed
+        self.invalidate()
+
+    def set_estimate(self, estimate: Optional[QuestEstimate]) -> None:
+        """
+        Show a difficulty estimate on the button.
+
+        Args:
+            estimate: The estimate, or None to hide it
+        """
+        if estimate != self.estimate:
+            self.estimate = estimate
+            self.invalidate()
+
+    def invalidate(self) -> None:
+        """Discard the pre-rendered surfaces so the next draw rebuilds them."""
+        self._surfaces.clear()
+
+    def _render(self) -> pygame.Surface:
+        """
+        Compose the button graphic and quest information for the current state.
+
+        Returns:
+            Surface holding the finished button, drawn at (0, 0)
+        """
+        image = self.button_sheet.get_image(self.state, self.frame_width, 
+                                            self.frame_height, self.scale, Colors.BLACK)
+        width = max(self.rect.width, image.get_width())
+        height = max(self.rect.height, image.get_height())
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+
+        # Draw the base button
+        surface.blit(image, (0, 0))
+
+        # Draw quest information
+        font = font_manager.get_font(None, 24)
+        name_color = Colors.RED if self.failed else Colors.BLACK
+        draw_text(self.quest.name, font, name_color, surface, 10, 10)
+
+        # Draw reward/penalty with appropriate colors
+        reward_color = Colors.GRAY if self.failed else Colors.GREEN
+        penalty_color = Colors.GRAY if self.failed else Colors.RED
+        draw_text(self.quest.reward.name, font, reward_color, surface, 10, 40)
+        draw_text(str(self.quest.penalty), font, penalty_color, surface, 10, 70)
+
+        # Draw description and progress with appropriate color
+        desc_color = Colors.GRAY if self.failed else Colors.BLACK
+        draw_wrapped_text(self.quest.description, font, desc_color, surface, 
+                        self.rect.width // 3, 10, self.rect.width // 3 + 50)
+
+        # Draw progress with appropriate color
+        progress_color = Colors.GRAY if self.failed else Colors.BLACK
+        output_text = ""
+        for key in self.quest.monster_list.keys():
+            output_text += f"{key}: {self.quest.monsters_slain[key]}/{self.quest.monster_list[key]}\n"
+
+        draw_multiple_lines(output_text, font, progress_color, surface, 
+                            self.rect.width // 4 * 3 + 25, 10)
+
+        # Draw the difficulty rating once it has been estimated
+        if self.estimate is not None and not self.failed:
+            draw_text(f"{self.estimate.difficulty} ({self.estimate.success_rate:.0%})", font,
+                      Colors.BLACK, surface, self.rect.width // 4 * 3 + 25, 70)
+
+        # If failed, draw "FAILED" text overlay
+        if self.failed:
+            failed_font = font_manager.get_font(None, 48)  # Larger font for FAILED text
+            failed_text = failed_font.render("FAILED", True, Colors.RED)
+            failed_rect = failed_text.get_rect()
+            # Position the text in the center-right of the button
+            failed_rect.center = (self.rect.width // 2 + self.rect.width // 4, 
+                                self.rect.height // 2)
+            surface.blit(failed_text, failed_rect)
+
+        return surface
 
     def draw(self, surface: Optional[pygame.Surface]) -> None:
         """
         Draw the button if a surface is provided, otherwise just update state.
 
+        The button is pre-rendered once per state and only rebuilt when the
+        quest progress, failed status or button size changes, so drawing is
+        a single blit.
+
         Args:
             surface: Optional pygame surface to draw on
         """
         if surface is not None:
-            # Draw the base button
-            image = self.button_sheet.get_image(self.state, self.frame_width, 
-                                                self.frame_height, self.scale, Colors.BLACK)
-            surface.blit(image, (self.rect.x, self.rect.y))
-            
-            # Draw quest information
-            name_color = Colors.RED if self.failed else Colors.BLACK
-            draw_text(self.quest.name, pygame.font.Font(None, 24), name_color, 
-                        surface, self.rect.x + 10, self.rect.y + 10)
-            
-            # Draw reward/penalty with appropriate colors
-            reward_color = Colors.GRAY if self.failed else Colors.GREEN
-            penalty_color = Colors.GRAY if self.failed else Colors.RED
-            draw_text(self.quest.reward.name, pygame.font.Font(None, 24), 
-                        reward_color, surface, self.rect.x + 10, self.rect.y + 40)
-            draw_text(str(self.quest.penalty), pygame.font.Font(None, 24), 
-                        penalty_color, surface, self.rect.x + 10, self.rect.y + 70)
-
-            # Draw description and progress with appropriate color
-            desc_color = Colors.GRAY if self.failed else Colors.BLACK
-            draw_wrapped_text(self.quest.description, pygame.font.Font(None, 24), 
-                            desc_color, surface, 
-                            self.rect.x + self.rect.width // 3, 
-                            self.rect.y + 10, self.rect.width // 3 + 50)
-
-            # Draw progress with appropriate color
-            progress_color = Colors.GRAY if self.failed else Colors.BLACK
-            output_text = ""
-            for key in self.quest.monster_list.keys():
-                output_text += f"{key}: {self.quest.monsters_slain[key]}/{self.quest.monster_list[key]}\n"
-
-            draw_multiple_lines(output_text, pygame.font.Font(None, 24), 
-                                progress_color, surface, 
-                                self.rect.x + self.rect.width // 4 * 3 + 25, 
-                                self.rect.y + 10)
-
-            # If failed, draw "FAILED" text overlay
-            if self.failed:
-                failed_font = pygame.font.Font(None, 48)  # Larger font for FAILED text
-                failed_text = failed_font.render("FAILED", True, Colors.RED)
-                failed_rect = failed_text.get_rect()
-                # Position the text in the center-right of the button
-                failed_rect.center = (self.rect.centerx + self.rect.width // 4, 
-                                    self.rect.centery)
-                surface.blit(failed_text, failed_rect)
+            if self.quest.version != self._quest_version or self.rect.size != self._rendered_size:
+                self.invalidate()
+                self._quest_version = self.quest.version
+                self._rendered_size = self.rect.size
+
+            button_surface = self._surfaces.get(self.state)
+            if button_surface is None:
+                button_surface = self._render()
+                self._surfaces[self.state] = button_surface
+            surface.blit(button_surface, (self.rect.x, self.rect.y))
+            self._drawn_key = self._render_key()
+
+    def _render_key(self) -> Tuple:
+        """Get the values that decide what the button looks like on screen."""
+        return super()._render_key() + (self.failed, self.quest.version, self.estimate)
 
 # Type hint for the quest list
 quest_list: Set[Quest] = {
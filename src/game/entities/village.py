@@ -2,7 +2,8 @@ from src.game.ui.ui_helpers import *
 from src.game.core.constants import *
 from src.game.entities.items import *
 from src.game.entities.hero import *
-import random
+from src.game.managers.font_manager import font_manager
+from src.game.managers.rng_manager import rng, SHOP_STREAM
 import pygame
 from typing import Dict, Optional, Union
 
@@ -13,19 +14,19 @@ ItemDict = Dict[str, Union[Item, Weapon, Armor]]
 class Shop:
     """A class representing a shop where heroes can buy items."""
 
-    def __init__(self, font: pygame.font.Font) -> None:
+    def __init__(self, font: Optional[pygame.font.Font] = None) -> None:
         """
         Initialize the shop with random items.
 
         Args:
-            font: Font to use for text rendering
+            font: Font to use for text rendering, defaults to the shared default font
         """
-        self.potion_key: str = random.choice(list(potion_dictionary.keys()))
-        self.weapon_key: str = random.choice(list(weapon_dictionary.keys()))
-        self.armor_key: str = random.choice(list(armor_dictionary.keys()))
+        self.potion_key: str = rng.stream(SHOP_STREAM).choice(list(potion_dictionary.keys()))
+        self.weapon_key: str = rng.stream(SHOP_STREAM).choice(list(weapon_dictionary.keys()))
+        self.armor_key: str = rng.stream(SHOP_STREAM).choice(list(armor_dictionary.keys()))
         self.card_selected_key: Optional[str] = None
         self.selected_price: int = 0
-        self.font: pygame.font.Font = font
+        self.font: pygame.font.Font = font if font is not None else font_manager.get_font()
 
     def new_card(self, card_name: str) -> None:
         """
@@ -35,13 +36,13 @@ class Shop:
             card_name: Name of the item type to change
         """
         if card_name == ShopConstants.POTION_CARD_KEY:
-            self.potion_key = random.choice(list(potion_dictionary.keys()))
+            self.potion_key = rng.stream(SHOP_STREAM).choice(list(potion_dictionary.keys()))
             self.selected_price = potion_dictionary[self.potion_key].value
         elif card_name == ShopConstants.WEAPON_CARD_KEY:
-            self.weapon_key = random.choice(list(weapon_dictionary.keys()))
+            self.weapon_key = rng.stream(SHOP_STREAM).choice(list(weapon_dictionary.keys()))
             self.selected_price = weapon_dictionary[self.weapon_key].value
         elif card_name == ShopConstants.ARMOR_CARD_KEY:
-            self.armor_key = random.choice(list(armor_dictionary.keys()))
+            self.armor_key = rng.stream(SHOP_STREAM).choice(list(armor_dictionary.keys()))
             self.selected_price = armor_dictionary[self.armor_key].value
         self.card_selected_key = card_name
 
@@ -198,20 +199,20 @@ class Shop:
 class Village:
     """A class representing a village that can be damaged and has a shop."""
     
-    def __init__(self, name: str, health: int, font: pygame.font.Font) -> None:
+    def __init__(self, name: str, health: int, font: Optional[pygame.font.Font] = None) -> None:
         """
         Initialize the village with a name and health.
 
         Args:
             name: Name of the village
             health: Starting health of the village
-            font: Font to use for text rendering
+            font: Font to use for text rendering, defaults to the shared default font
         """
         self.name: str = name
         self.health: int = health
         self.max_health: int = health
         self.level: int = 1
-        self.font: pygame.font.Font = font
+        self.font: pygame.font.Font = font if font is not None else font_manager.get_font()
         self.shop: Shop = Shop(self.font)
     
     def take_damage(self, damage: int) -> None:
@@ -0,0 +1,206 @@
+import os
+import time
+import pygame
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from src.game.utils.fileIO import resource_path
+
+# Type aliases
+Size = Tuple[int, int]
+ColorKey = Tuple[int, int, int]
+AssetKey = Tuple[str, Optional[Size], bool, Optional[ColorKey], bool]
+ManifestEntry = Union[str, Dict[str, Any]]
+
+IMAGE_DIR: str = os.path.join("src", "game", "assets", "images")
+
+def image_path(*parts: str) -> str:
+    """
+    Get the relative path of a file in the images folder, using the separator of the current platform.
+
+    Args:
+        parts: Folders and name of the image file, e.g. "knight.png" or "buttons", "quest_sheet.png"
+
+    Returns:
+        Path relative to the game root, suitable for AssetManager.get_image
+    """
+    return os.path.join(IMAGE_DIR, *parts)
+
+@dataclass
+class AssetStats:
+    """Load statistics for a single asset variant."""
+    path: str
+    size: Optional[Size]
+    alpha: bool
+    colorkey: Optional[ColorKey]
+    decode_ms: float = 0.0  # Time spent decoding the file from disk
+    prepare_ms: float = 0.0  # Time spent converting and scaling this variant
+    bytes: int = 0
+    requests: int = 0
+
+class AssetManager:
+    """Central registry that loads each image once and shares it everywhere."""
+
+    def __init__(self) -> None:
+        """Initialize an empty asset registry. Nothing is loaded until requested."""
+        self._decoded: Dict[str, pygame.Surface] = {}
+        self._decode_ms: Dict[str, float] = {}
+        self._images: Dict[AssetKey, pygame.Surface] = {}
+        self._stats: Dict[AssetKey, AssetStats] = {}
+
+    def get_image(self, path: str, size: Optional[Size] = None, alpha: bool = False,
+                colorkey: Optional[ColorKey] = None, convert: bool = True) -> pygame.Surface:
+        """
+        Get an image variant, loading it on first use.
+
+        The file at path is decoded at most once; every (size, alpha, colorkey)
+        variant is derived from that decoded surface and cached as well. The
+        returned surface is shared, so callers must not draw onto it.
+
+        Args:
+            path: Path of the image relative to the game root
+            size: Size to scale the image to, or None to keep the original size
+            alpha: Convert with per-pixel alpha instead of the display format
+            colorkey: RGB color to treat as transparent
+            convert: Convert to the display format. Requires a display mode to be set.
+
+        Returns:
+            The requested image surface
+        """
+        key: AssetKey = (path, tuple(size) if size else None, alpha,
+                         tuple(colorkey) if colorkey else None, convert)
+        image = self._images.get(key)
+        if image is None:
+            image = self._load_variant(key)
+        self._stats[key].requests += 1
+        return image
+
+    def _decode(self, path: str) -> pygame.Surface:
+        """Decode an image file from disk, reusing an earlier decode of the same path."""
+        decoded = self._decoded.get(path)
+        if decoded is None:
+            start = time.perf_counter()
+            decoded = pygame.image.load(resource_path(path))
+            self._decode_ms[path] = (time.perf_counter() - start) * 1000
+            self._decoded[path] = decoded
+        return decoded
+
+    def _load_variant(self, key: AssetKey) -> pygame.Surface:
+        """Build and cache one variant of an image."""
+        path, size, alpha, colorkey, convert = key
+        first_decode = path not in self._decoded
+        image = self._decode(path)
+
+        start = time.perf_counter()
+        if convert:
+            image = image.convert_alpha() if alpha else image.convert()
+        if size is not None and image.get_size() != size:
+            image = pygame.transform.scale(image, size)
+        if colorkey is not None:
+            if image is self._decoded[path]:
+                image = image.copy()
+            image.set_colorkey(colorkey)
+        prepare_ms = (time.perf_counter() - start) * 1000
+
+        self._images[key] = image
+        self._stats[key] = AssetStats(
+            path=path,
+            size=size,
+            alpha=alpha,
+            colorkey=colorkey,
+            decode_ms=self._decode_ms[path] if first_decode else 0.0,
+            prepare_ms=prepare_ms,
+            bytes=image.get_width() * image.get_height() * image.get_bytesize(),
+        )
+        return image
+
+    def preload(self, manifest: Iterable[ManifestEntry]) -> None:
+        """
+        Load a list of assets up front.
+
+        Args:
+            manifest: Entries that are either a path or a dictionary of
+                get_image keyword arguments including "path"
+        """
+        for entry in manifest:
+            if isinstance(entry, str):
+                self.get_image(entry)
+            else:
+                self.get_image(**entry)
+
+    def is_loaded(self, path: str) -> bool:
+        """
+        Check if a file has been decoded.
+
+        Args:
+            path: Path of the image relative to the game root
+
+        Returns:
+            True if the file is already in memory, False otherwise
+        """
+        return path in self._decoded
+
+    def report(self) -> List[Dict[str, Any]]:
+        """
+        Get per-asset load statistics, slowest first.
+
+        Returns:
+            List of dictionaries with path, variant, timings, memory and request count
+        """
+        rows = [{
+            "path": stats.path,
+            "size": stats.size,
+            "alpha": stats.alpha,
+            "colorkey": stats.colorkey,
+            "decode_ms": round(stats.decode_ms, 3),
+            "prepare_ms": round(stats.prepare_ms, 3),
+            "bytes": stats.bytes,
+            "requests": stats.requests,
+        } for stats in self._stats.values()]
+        rows.sort(key=lambda row: row["decode_ms"] + row["prepare_ms"], reverse=True)
+        return rows
+
+    def total_bytes(self) -> int:
+        """
+        Get the approximate memory held by decoded files and cached variants.
+
+        Returns:
+            Number of bytes of pixel data
+        """
+        # Variants that need no conversion are the decoded surface itself
+        unique = {id(image): image for image in self._decoded.values()}
+        unique.update((id(image), image) for image in self._images.values())
+        return sum(image.get_width() * image.get_height() * image.get_bytesize()
+                   for image in unique.values())
+
+    def trim(self) -> None:
+        """
+        Release decoded source files that are not themselves a cached variant.
+
+        A later request for a new variant of a trimmed file decodes it again.
+        """
+        in_use = {id(image) for image in self._images.values()}
+        for path in [path for path, image in self._decoded.items() if id(image) not in in_use]:
+            del self._decoded[path]
+
+    def clear(self) -> None:
+        """Drop every loaded image and its statistics."""
+        self._decoded.clear()
+        self._decode_ms.clear()
+        self._images.clear()
+        self._stats.clear()
+
+# Shared registry used by every entity and UI module
+asset_manager: AssetManager = AssetManager()
+
+# Images preloaded by Game once the display is ready
+DEFAULT_MANIFEST: List[ManifestEntry] = [
+    {"path": image_path("buttons", "button_sheet_0.png"), "alpha": True},
+    {"path": image_path("buttons", "quest_sheet.png"), "alpha": True},
+    {"path": image_path("assassin_sheet.png"), "alpha": True},
+    {"path": image_path("knight_sheet.png"), "alpha": True},
+    {"path": image_path("knight.png"), "size": (100, 100)},
+    {"path": image_path("assassin.png"), "size": (100, 100)},
+    {"path": image_path("goblin_image.jpg"), "size": (100, 100)},
+    {"path": image_path("orc_image.jpg"), "size": (100, 100)},
+    {"path": image_path("ogre_image.jpg"), "size": (100, 100)},
+]
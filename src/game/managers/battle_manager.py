@@ -1,13 +1,32 @@
-import pygame
-from src.game.core.constants import GameState, Colors
+from src.game.core.battle_engine import BattleAction, BattleEngine, BattleEvent, BattleEventType
+from src.game.core.battle_solver import BattleModel, BattleOdds, greedy_policy
+from src.game.core.constants import BattleActions, GameState
 from src.game.entities.monster import Monster
 from src.game.entities.hero import Hero
 from src.game.entities.items import potion_dictionary
-from src.game.entities.ability import DefendAbility, AttackAbility
 from src.game.ui.tooltip import Tooltip
+from src.game.ui.battle_log import BattleLog
 from enum import Enum
 from src.game.managers.button_manager import ButtonManager
-from typing import Optional, List
+from src.game.managers.odds_manager import OddsManager, odds_manager as shared_odds_manager
+from src.game.managers.policy_manager import policy_manager
+from typing import Dict, Optional, List
+
+# Battle log line for each engine event; events without a line are not logged
+LOG_MESSAGES: Dict[BattleEventType, str] = {
+    BattleEventType.ABILITY_HIT: "{actor} used {detail} dealing {amount} damage!",
+    BattleEventType.ABILITY_CRITICAL: "{actor}'s {detail} landed a critical hit for {amount} damage!",
+    BattleEventType.ABILITY_MISSED: "{actor}'s {detail} missed!",
+    BattleEventType.ABILITY_BLOCK: "{actor} used {detail} gaining {amount} block!",
+    BattleEventType.ON_COOLDOWN: "{detail} is still on cooldown!",
+    BattleEventType.NOT_ENOUGH_ENERGY: "Not enough energy to use {detail}!",
+    BattleEventType.UNKNOWN_ABILITY: "{actor} doesn't know {detail}!",
+    BattleEventType.POTION_USED: "{actor} used a {detail}!",
+    BattleEventType.NO_POTION: "{actor} has no {detail} left!",
+    BattleEventType.REST: "{actor} rests to restore energy.",
+    BattleEventType.POTION_BLOCK: "{actor} blocks {amount} damage!",
+    BattleEventType.MONSTER_ATTACK: "{actor} attacks {target} for {amount} damage.",
+}
 
 
 class TurnState(Enum):
@@ -22,15 +41,28 @@ class BattleState(Enum):
     MONSTER_DEFEATED = 4
 
 class BattleManager:
-    def __init__(self, hero: Hero, battle_log: List[str]) -> None:
+    """Connects the battle screen to the BattleEngine rules.
+    
+    The engine resolves every action; this class keeps track of which menu is
+    open, writes the resulting events to the battle log and updates the buttons.
+    """
+    
+    def __init__(self, hero: Hero, battle_log: BattleLog, engine: Optional[BattleEngine] = None,
+                 odds_manager: Optional[OddsManager] = None) -> None:
         """Initialize the battle manager.
         
         Args:
             hero: The player's hero character
-            battle_log: List to store battle messages
+            battle_log: Battle log to store battle messages
+            engine: Rules engine, defaults to one using the shared combat stream
+            odds_manager: Works out the live odds, defaults to the shared odds manager
         """
+        self.engine: BattleEngine = engine if engine is not None else BattleEngine()
+        self.odds_manager: OddsManager = odds_manager if odds_manager is not None else shared_odds_manager
+        self.odds: Optional[BattleOdds] = None  # Odds of the current battle, None if unknown
+        self.auto: bool = False  # Auto-battle takes the hero's turns
         self.hero: Hero = hero
-        self.battle_log: List[str] = battle_log
+        self.battle_log: BattleLog = battle_log
         self.monster: Optional[Monster] = None
         self.state: BattleState = BattleState.HOME
         self.turn: TurnState = TurnState.HERO_TURN  # Start with hero's turn
@@ -48,6 +80,14 @@ class BattleManager:
         self.state = BattleState.HOME  # Reset to HOME state for new battle
         self.turn = TurnState.HERO_TURN
         self.battle_log.append(f"A {self.monster.name} appears!")
+        self.update_odds()
+
+    def update_odds(self) -> None:
+        """Look up the odds of the battle from its current state, None until the odds manager has solved them."""
+        if self.monster is None or not self.hero.is_alive() or not self.monster.is_alive():
+            self.odds = None
+            return
+        self.odds = self.odds_manager.request(self.hero, self.monster)
 
     def update_battle_state(self) -> Optional[bool]:
         """Update the battle state and check for victory/defeat conditions.
@@ -84,6 +124,11 @@ class BattleManager:
         """
         # Store button manager reference for use in other methods
         self.button_manager = button_manager
+        auto_button = button_manager.get_button(GameState.BATTLE, "Auto")
+        if self.auto:
+            auto_button.select()
+        else:
+            auto_button.deselect()
         
         if self.state == BattleState.MONSTER_DEFEATED:
             # Lock combat buttons, unlock victory buttons
@@ -187,28 +232,91 @@ class BattleManager:
             else:
                 button.lock()
 
+    def _log_events(self, events: List[BattleEvent]) -> None:
+        """Write the events of a turn to the battle log.
+        
+        Args:
+            events: Events returned by the engine
+        """
+        for event in events:
+            message = LOG_MESSAGES.get(event.type)
+            if message is not None:
+                self.battle_log.append(message.format(actor=event.actor, detail=event.detail,
+                                                      amount=event.amount, target=self.hero.name))
+            elif event.type == BattleEventType.DODGED:
+                print("Attack dodged!")
+            elif event.type == BattleEventType.ARMOR_BLOCK:
+                print(f"Attack blocked! Damage reduced by {event.amount} points.")
+
+    def _take_turn(self, action: BattleAction) -> bool:
+        """Resolve a hero action and the monster's reply, then go back to the battle menu.
+        
+        Args:
+            action: The hero's action
+            
+        Returns:
+            bool: True if the turn was used up, False if the action was refused
+        """
+        result = self.engine.resolve(self.hero, self.monster, action)
+        self._log_events(result.events)
+        if result.taken:
+            # The monster replies within the same turn, so it is the hero's turn again
+            self.state = BattleState.HOME
+            self.turn = TurnState.HERO_TURN
+            self.update_odds()
+        return result.taken
+
+    def auto_action(self) -> BattleAction:
+        """Pick the hero's next move for auto-battle.
+        
+        Uses the optimal policy once policy_manager has solved it, and the
+        greedy policy while it is still being worked out.
+        
+        Returns:
+            The action to take
+        """
+        action = policy_manager.best_action(self.hero, self.monster)
+        if action is None:
+            model = BattleModel(self.hero, self.monster)
+            action = greedy_policy(model.state_of(self.hero, self.monster), model)
+        return action
+
+    def can_take_auto_turn(self) -> bool:
+        """Check if auto-battle can act, i.e. it is the hero's turn with no menu open."""
+        return self.turn == TurnState.HERO_TURN and self.state == BattleState.HOME and self.monster is not None
+
+    def take_auto_turn(self, action: Optional[BattleAction] = None) -> bool:
+        """Let auto-battle take the hero's turn.
+        
+        Args:
+            action: The move to make, defaults to auto_action
+            
+        Returns:
+            bool: True if the hero fled
+        """
+        if not self.can_take_auto_turn():
+            return False
+        if action is None:
+            action = self.auto_action()
+        if action.kind == BattleActions.FLEE:
+            self.auto = False
+            return self.handle_flee()
+        self._take_turn(action)
+        return False
+
     def handle_monster_attack(self) -> None:
         """Handle monster's attack action."""
         if self.turn != TurnState.MONSTER_TURN:
             return  # Not monster's turn
             
         if self.monster and self.monster.is_alive():
-            # Calculate damage after hero's block
-            damage = max(0, self.monster.damage - self.hero.potion_block)
-            self.hero.take_damage(damage)
-            
-            # Create battle log message
-            if self.hero.potion_block > 0:
-                self.battle_log.append(f"{self.hero.name} blocks {self.hero.potion_block} damage!")
-                self.battle_log.append(f"{self.monster.name} attacks {self.hero.name} for {damage} damage.")
-            else:
-                self.battle_log.append(f"{self.monster.name} attacks {self.hero.name} for {damage} damage.")
-            
-            # Reset hero's block after the attack
-            self.hero.potion_block = 0
+            events: List[BattleEvent] = []
+            self.engine.monster_attack(self.hero, self.monster, events)
+            self._log_events(events)
             
             # Switch back to hero's turn
             self.turn = TurnState.HERO_TURN
+            self.update_odds()
 
     def start_monster_turn(self) -> None:
         """Handle the monster's turn."""
@@ -222,8 +330,8 @@ class BattleManager:
             ability_name: Optional name of ability to use. If provided, use the ability.
                         If not provided, toggle ability selection mode.
         """
-        if self.turn != TurnState.HERO_TURN or not self.button_manager:
-            return  # Not hero's turn or no button manager
+        if self.turn != TurnState.HERO_TURN:
+            return  # Not hero's turn
 
         # If ability name is provided, use that ability
         if ability_name:
@@ -231,44 +339,29 @@ class BattleManager:
             return
             
         # Toggle between showing and hiding ability buttons
-        if self.state == BattleState.USE_ABILITY:
-            self.state = BattleState.HOME
-            self._toggle_ability_buttons(self.button_manager, False)
-        else:
-            self.state = BattleState.USE_ABILITY
-            self._toggle_ability_buttons(self.button_manager, True)
-            # Update button states based on ability cooldowns and energy costs
-            self._update_ability_button_states(self.button_manager)
+        self.state = BattleState.HOME if self.state == BattleState.USE_ABILITY else BattleState.USE_ABILITY
+        if self.button_manager:
+            # Also updates button states based on ability cooldowns and energy costs
+            self._toggle_ability_buttons(self.button_manager, self.state == BattleState.USE_ABILITY)
 
     def handle_rest(self) -> None:
         """Handle hero's Rest action."""
-        if self.turn != TurnState.HERO_TURN:
+        if self.turn != TurnState.HERO_TURN or not self.monster:
             return  # Not hero's turn
-        print("The Hero rests restoring his energy")
-        self.hero.rest()
-        self.battle_log.append(f"{self.hero.name} rests to restore energy.")
-
-        # Return to normal battle state and switch turns
-        self.state = BattleState.HOME
-        self.turn = TurnState.MONSTER_TURN
-        
-        if self.monster and self.monster.is_alive():
-            self.start_monster_turn()
+        self._take_turn(BattleAction(BattleActions.REST))
 
     def handle_use_potion(self) -> None:
         """Handle hero's potion use."""
-        if self.turn != TurnState.HERO_TURN or not self.button_manager:
-            return  # Not hero's turn or no button manager
+        if self.turn != TurnState.HERO_TURN:
+            return  # Not hero's turn
             
         # Toggle between showing and hiding potion buttons
-        if self.state == BattleState.USE_ITEM:
-            self.state = BattleState.HOME
-            self._toggle_potion_buttons(self.button_manager, False)
-        else:
-            self.state = BattleState.USE_ITEM
-            self._toggle_potion_buttons(self.button_manager, True)
-            # Update potion button states based on inventory
-            self._update_potion_button_states(self.button_manager)
+        self.state = BattleState.HOME if self.state == BattleState.USE_ITEM else BattleState.USE_ITEM
+        if self.button_manager:
+            self._toggle_potion_buttons(self.button_manager, self.state == BattleState.USE_ITEM)
+            if self.state == BattleState.USE_ITEM:
+                # Update potion button states based on inventory
+                self._update_potion_button_states(self.button_manager)
         # Note: Turn state doesn't change until potion is actually used
 
     def use_potion(self, potion_name: str) -> None:
@@ -277,20 +370,13 @@ class BattleManager:
         Args:
             potion_name: Name of the potion to use
         """
-        if self.turn != TurnState.HERO_TURN or self.state != BattleState.USE_ITEM or not self.button_manager:
+        if self.turn != TurnState.HERO_TURN or self.state != BattleState.USE_ITEM or not self.monster:
             return  # Not in correct state to use potion
             
-        self.hero.use_potion(potion_name)
-        self.battle_log.append(f"{self.hero.name} used a {potion_name}!")
-        
-        # Hide potion buttons after use
-        self._toggle_potion_buttons(self.button_manager, False)
-        
-        # Return to normal battle state and switch turns
-        self.state = BattleState.HOME
-        self.turn = TurnState.MONSTER_TURN
-        if self.monster and self.monster.is_alive():
-            self.start_monster_turn()
+        self._take_turn(BattleAction(BattleActions.USE_POTION, potion_name))
+        if self.button_manager:
+            # Hide potion buttons after use
+            self._toggle_potion_buttons(self.button_manager, False)
 
     def handle_flee(self) -> bool:
         """Handle hero's flee action.
@@ -300,6 +386,8 @@ class BattleManager:
         """
         if self.turn != TurnState.HERO_TURN:
             return False  # Not hero's turn
+        if self.monster:
+            self._take_turn(BattleAction(BattleActions.FLEE))
         self.state = BattleState.RUN_AWAY
         return True  # Successful flee
     
@@ -309,55 +397,13 @@ class BattleManager:
         Args:
             ability_name: Name of the ability to use
         """
-        if self.turn != TurnState.HERO_TURN or self.state != BattleState.USE_ABILITY or not self.button_manager:
+        if self.turn != TurnState.HERO_TURN or self.state != BattleState.USE_ABILITY:
             return
 
-        if self.monster and self.monster.is_alive():            # Find the ability first to check requirements
-            target_ability = None
-            for ability in self.hero.abilities:
-                if ability.name == ability_name:
-                    if not ability.can_use(self.hero):
-                        self.battle_log.append(f"{ability_name} is still on cooldown!")
-                        return
-                    if self.hero.energy < ability.energy_cost:
-                        self.battle_log.append(f"Not enough energy to use {ability_name}!")
-                        return
-                    target_ability = ability
-                    break
-            
-            if not target_ability:
-                self.battle_log.append(f"{self.hero.name} doesn't know {ability_name}!")
-                return
-                    
-            # Now try to use the ability
-            effect = target_ability.use(self.hero, self.monster)
-            self.hero.energy -= target_ability.energy_cost
-            
-            # Log appropriate message based on the effect
-            if hasattr(effect, 'missed') and effect.missed:
-                self.battle_log.append(f"{self.hero.name}'s {ability_name} missed!")
-            elif hasattr(effect, 'critical') and effect.critical:
-                self.battle_log.append(f"{self.hero.name}'s {ability_name} landed a critical hit for {effect.damage} damage!")
-            elif effect.damage > 0:
-                self.battle_log.append(f"{self.hero.name} used {ability_name} dealing {effect.damage} damage!")
-            elif effect.healing > 0:
-                self.battle_log.append(f"{self.hero.name} used {ability_name} restoring {effect.healing} health!")
-            elif effect.block > 0:
-                self.battle_log.append(f"{self.hero.name} used {ability_name} gaining {effect.block} block!")
-            
-            # Hide ability buttons after successful use
-            self._toggle_ability_buttons(self.button_manager, False)
-
-            # Update ability cooldowns at the end of the heros turn
-            self.hero.update_abilities()
-            
-            # Return to normal battle state and switch turns
-            self.state = BattleState.HOME
-            self.turn = TurnState.MONSTER_TURN
-            
-            # Start monster turn if it's still alive
-            if self.monster.is_alive():
-                self.start_monster_turn()
+        if self.monster and self.monster.is_alive():
+            if self._take_turn(BattleAction(BattleActions.ABILITY, ability_name)) and self.button_manager:
+                # Hide ability buttons after successful use
+                self._toggle_ability_buttons(self.button_manager, False)
 
     def _toggle_ability_buttons(self, button_manager: ButtonManager, show: bool) -> None:
         """Show or hide ability selection buttons.
@@ -366,14 +412,16 @@ class BattleManager:
             button_manager: The button manager to update button states
             show: Whether to show or hide the buttons
         """
-        # Clear existing buttons first
-        button_manager.clear_hero_ability_buttons()
-        
+        # Only rebuilds the buttons if the hero's abilities changed
+        button_manager.sync_hero_ability_buttons(self.hero.abilities)
+
+        for button in button_manager.hero_ability_buttons.buttons:
+            if show and not button.is_visible():
+                button.show()
+            elif not show and button.is_visible():
+                button.hide()
+
         if show:
-            # Create ability buttons for hero's abilities
-            for ability in self.hero.abilities:
-                button_manager.add_hero_ability_button(ability)
-                
             # Update button states based on cooldowns and energy costs
             self._update_ability_button_states(button_manager)
 
@@ -384,12 +432,13 @@ class BattleManager:
             button_manager: The button manager to update button states
         """
         # Update each button's state based on ability status
-        for button in button_manager.hero_ability_buttons.buttons:                
-            for ability in self.hero.abilities:
-                if button.text == ability.name:
-                    # Lock button if ability is on cooldown or hero lacks energy
-                    if ability.current_cooldown > 0 or self.hero.energy < ability.energy_cost:
-                        button.lock()
-                    else:
-                        button.unlock()
-                    break
\ No newline at end of file
+        for ability in self.hero.abilities:
+            button = button_manager.get_hero_ability_button(ability.name)
+            if button is None:
+                continue
+            # Lock button if ability is on cooldown or hero lacks energy
+            should_lock = ability.current_cooldown > 0 or self.hero.energy < ability.energy_cost
+            if should_lock and not button.is_locked():
+                button.lock()
+            elif not should_lock and button.is_locked():
+                button.unlock()
\ No newline at end of file
@@ -1,6 +1,9 @@
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 import pygame
-from src.game.utils.fileIO import resource_path
+from src.game.managers.asset_manager import asset_manager, image_path
+from src.game.managers.font_manager import font_manager
+from src.game.managers.render_manager import RenderManager
+from src.game.managers.profiler_manager import profiler
 from src.game.ui.button import Button, TextButton
 from src.game.ui.spritesheet import SpriteSheet
 from src.game.core.constants import GameState, GameConstants, Colors
@@ -13,13 +16,13 @@ class ButtonManager:
 
     
     
-    def __init__(self, font: pygame.font.Font):
-        self.font = font
+    def __init__(self, font: Optional[pygame.font.Font] = None):
+        self.font = font if font is not None else font_manager.get_font()
 
-        button_images: pygame.Surface = pygame.image.load(resource_path('src\\game\\assets\\images\\buttons\\button_sheet_0.png')).convert_alpha()
-        quest_button_images: pygame.Surface = pygame.image.load(resource_path('src\\game\\assets\\images\\buttons\\quest_sheet.png')).convert_alpha()
-        assassin_button_images: pygame.Surface = pygame.image.load(resource_path('src\\game\\assets\\images\\assassin_sheet.png')).convert_alpha()
-        knight_button_images: pygame.Surface = pygame.image.load(resource_path('src\\game\\assets\\images\\knight_sheet.png')).convert_alpha()
+        button_images: pygame.Surface = asset_manager.get_image(image_path('buttons', 'button_sheet_0.png'), alpha=True)
+        quest_button_images: pygame.Surface = asset_manager.get_image(image_path('buttons', 'quest_sheet.png'), alpha=True)
+        assassin_button_images: pygame.Surface = asset_manager.get_image(image_path('assassin_sheet.png'), alpha=True)
+        knight_button_images: pygame.Surface = asset_manager.get_image(image_path('knight_sheet.png'), alpha=True)
 
         # Split the 800x250 button sheet into 5 rows of 800x50
         self.button_sheet_gray      = SpriteSheet(button_images.subsurface((0, 0, 800, 50)))
@@ -61,8 +64,9 @@ class ButtonManager:
             20  # button_spacing
         )
         
-        # Initialize available quests
-        for quest in quest_list:
+        # Initialize available quests. quest_list is a set, sort it so the order
+        # does not change between runs and recorded clicks hit the same quest.
+        for quest in sorted(quest_list, key=lambda quest: quest.name):
             quest_button = QuestButton(
                 self.quest_button_sheet,  # Use yellow button sheet for quests
                 0,  # x position will be set by ScrollableButtons
@@ -81,6 +85,9 @@ class ButtonManager:
             GameConstants.SCREEN_HEIGHT // 2,
             GameConstants.BUTTON_HEIGHT,
         )
+        # Ability buttons are built once per ability and reused across battles
+        self.hero_ability_pool: Dict[str, TextButton] = {}
+        self._hero_ability_names: Tuple[str, ...] = ()
 
     def _initialize_buttons(self) -> Dict[GameState, Dict[str, Button]]:
         """Initialize all game buttons organized by game state."""
@@ -357,6 +364,16 @@ class ButtonManager:
                 'Flee',
                 self.font,
             ),
+            'Auto': TextButton(
+                self.button_sheet_yellow,
+                potion_x,
+                button_y_start + button_spacing * 3,  # Fourth row, under the potions
+                GameConstants.BUTTON_WIDTH, 
+                GameConstants.BUTTON_HEIGHT,
+                1,
+                'Auto',
+                self.font,
+            ),
             'Continue': TextButton(
                 self.button_sheet_green,
                 button_x,
@@ -534,8 +551,24 @@ class ButtonManager:
             surface: The surface to draw the buttons on
             state: The game state whose buttons to draw
         """
-        for button in self.buttons[state].values():
-            button.draw(surface)
+        with profiler.measure("draw_buttons"):
+            for button in self.buttons[state].values():
+                button.draw(surface)
+
+    def draw_dirty_buttons(self, surface: pygame.Surface, state: GameState, renderer: RenderManager) -> None:
+        """Redraw only the buttons of a game state that changed since they were last drawn.
+        
+        Args:
+            surface: The surface to draw the buttons on
+            state: The game state whose buttons to draw
+            renderer: The render manager used to erase and report changed regions
+        """
+        with profiler.measure("draw_buttons"):
+            for button in self.buttons[state].values():
+                button.update_hover()
+                if button.needs_redraw():
+                    renderer.erase(button.rect)
+                    button.draw(surface)
 
     def handle_click(self, state: GameState, pos: tuple[int, int]) -> Optional[str]:
         """Handle a click event for buttons in a game state.
@@ -623,6 +656,48 @@ class ButtonManager:
                 Game.instance.village.health += penalty_value  # Penalty value is negative
                 Game.instance.battle_log.append(f"Village suffers {abs(penalty_value)} damage from quest failure!")
 
+    def _create_hero_ability_button(self, ability: Ability) -> TextButton:
+        """Create the button and tooltip for a hero ability.
+        
+        Args:
+            ability: The ability the button uses
+            
+        Returns:
+            The new ability button
+        """
+        # Choose button color based on ability type
+        if isinstance(ability, AttackAbility):
+            button_sheet = self.button_sheet_red
+        elif isinstance(ability, DefendAbility):
+            button_sheet = self.button_sheet_blue
+        else:
+            button_sheet = self.button_sheet_gray
+
+        button = TextButton(
+            button_sheet,
+            0,  # x position will be set by ScrollableButtons
+            0,  # y position will be set by ScrollableButtons
+            GameConstants.BUTTON_WIDTH, 
+            GameConstants.BUTTON_HEIGHT,
+            1,
+            ability.name,
+            self.font,
+            Colors.BLACK
+        )
+        button.set_tooltip(f"{ability.description}\nEnergy Cost: {ability.energy_cost}", self.font)
+        return button
+
+    def get_hero_ability_button(self, ability_name: str) -> Optional[TextButton]:
+        """Get the pooled button for an ability.
+        
+        Args:
+            ability_name: The name of the ability
+            
+        Returns:
+            The ability's button, or None if it has not been created yet
+        """
+        return self.hero_ability_pool.get(ability_name)
+
     def add_hero_ability_button(self, ability: Ability) -> None:
         """Add a hero ability button to the scrollable area.
         
@@ -630,28 +705,32 @@ class ButtonManager:
             ability: The ability to add
         """
         if ability:
-            # Choose button color based on ability type
-            if isinstance(ability, AttackAbility):
-                button_sheet = self.button_sheet_red
-            elif isinstance(ability, DefendAbility):
-                button_sheet = self.button_sheet_blue
-            else:
-                button_sheet = self.button_sheet_gray
-
-            button = TextButton(
-                button_sheet,
-                0,  # x position will be set by ScrollableButtons
-                0,  # y position will be set by ScrollableButtons
-                GameConstants.BUTTON_WIDTH, 
-                GameConstants.BUTTON_HEIGHT,
-                1,
-                ability.name,
-                self.font,
-                Colors.BLACK
-            )
-            button.set_tooltip(f"{ability.description}\nEnergy Cost: {ability.energy_cost}", self.font)
+            button = self.hero_ability_pool.get(ability.name)
+            if button is None:
+                button = self._create_hero_ability_button(ability)
+                self.hero_ability_pool[ability.name] = button
             self.hero_ability_buttons.add_button(button)
+            self._hero_ability_names += (ability.name,)
+
+    def sync_hero_ability_buttons(self, abilities: List[Ability]) -> bool:
+        """Make the scrollable area hold one pooled button per ability.
+        
+        Nothing is rebuilt unless the list of abilities changed since the last call.
+        
+        Args:
+            abilities: The hero's current abilities
+            
+        Returns:
+            True if the buttons were rebuilt, False if they were already up to date
+        """
+        if tuple(ability.name for ability in abilities) == self._hero_ability_names:
+            return False
+        self.clear_hero_ability_buttons()
+        for ability in abilities:
+            self.add_hero_ability_button(ability)
+        return True
 
     def clear_hero_ability_buttons(self) -> None:
         """Clear all hero ability buttons from the scrollable area."""
-        self.hero_ability_buttons.buttons.clear()
\ No newline at end of file
+        self.hero_ability_buttons.clear_buttons()
+        self._hero_ability_names = ()
\ No newline at end of file
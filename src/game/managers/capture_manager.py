@@ -0,0 +1,185 @@
+import cProfile
+import os
+import pstats
+import time
+from typing import Dict, List, Optional, Tuple
+from src.game.core.constants import GameState
+
+# Environment variables that start a capture without changing code
+CAPTURE_FRAMES_ENV_VAR: str = "VILLAGE_DEFENSE_PROFILE_FRAMES"  # Number of frames to capture
+CAPTURE_STATE_ENV_VAR: str = "VILLAGE_DEFENSE_PROFILE_STATE"  # Wait for this GameState name, e.g. BATTLE
+CAPTURE_DIR_ENV_VAR: str = "VILLAGE_DEFENSE_PROFILE_DIR"  # Output folder, "profiles" by default
+
+DEFAULT_CAPTURE_FRAMES: int = 300
+MAX_STACK_DEPTH: int = 64
+
+# Type aliases
+FunctionKey = Tuple[str, int, str]  # (filename, line number, function name) as used by pstats
+
+class CaptureManager:
+    """Runs cProfile over a window of frames and writes pstats and collapsed-stack files.
+
+    Frames are profiled separately per GameState, so the collapsed stacks are
+    rooted at the state each frame ran in and a flamegraph can be split by screen.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an idle capture manager."""
+        self.frames_left: int = 0
+        self.wait_for_state: Optional[GameState] = None
+        self.output_dir: str = os.environ.get(CAPTURE_DIR_ENV_VAR, "profiles")
+        self._profiles: Dict[GameState, cProfile.Profile] = {}
+        self._frame_counts: Dict[GameState, int] = {}
+        self._active: Optional[cProfile.Profile] = None
+        self.last_output: List[str] = []
+
+    @property
+    def capturing(self) -> bool:
+        """True while a capture is armed or running."""
+        return self.frames_left > 0
+
+    def start(self, frames: int = DEFAULT_CAPTURE_FRAMES, state: Optional[GameState] = None) -> None:
+        """Arm a capture. Ignored if one is already running.
+
+        Args:
+            frames: Number of frames to profile
+            state: Only start once the game is in this state, or None to start on the next frame
+        """
+        if self.capturing or frames <= 0:
+            return
+        self.frames_left = frames
+        self.wait_for_state = state
+        self._profiles = {}
+        self._frame_counts = {}
+        print(f"Profiling the next {frames} frames" + (f" of {state.name}" if state else ""))
+
+    def start_from_environment(self) -> None:
+        """Arm a capture if the CAPTURE_FRAMES_ENV_VAR environment variable is set."""
+        frames = os.environ.get(CAPTURE_FRAMES_ENV_VAR)
+        if not frames:
+            return
+        state_name = os.environ.get(CAPTURE_STATE_ENV_VAR)
+        state = GameState[state_name.upper()] if state_name else None
+        self.start(int(frames), state)
+
+    def begin_frame(self, state: GameState) -> None:
+        """Start profiling a frame if a capture is running.
+
+        Args:
+            state: The game state the frame runs in
+        """
+        if not self.capturing:
+            return
+        if self.wait_for_state is not None:
+            if state != self.wait_for_state:
+                return
+            self.wait_for_state = None
+        profile = self._profiles.get(state)
+        if profile is None:
+            profile = self._profiles[state] = cProfile.Profile()
+        self._frame_counts[state] = self._frame_counts.get(state, 0) + 1
+        self._active = profile
+        profile.enable()
+
+    def end_frame(self) -> None:
+        """Stop profiling the current frame and write the files after the last one."""
+        if self._active is None:
+            return
+        self._active.disable()
+        self._active = None
+        self.frames_left -= 1
+        if self.frames_left == 0:
+            self.last_output = self.write()
+
+    def stop(self) -> None:
+        """End a running capture early and write what was collected."""
+        if self._active is not None:
+            self._active.disable()
+            self._active = None
+        if self.capturing and self._profiles:
+            self.last_output = self.write()
+        self.frames_left = 0
+        self.wait_for_state = None
+
+    def write(self) -> List[str]:
+        """Write the pstats file and the collapsed-stack file of the capture.
+
+        Returns:
+            Paths of the written files
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        states = "-".join(state.name for state in self._profiles)
+        base = os.path.join(self.output_dir, f"capture_{states}_{time.strftime('%Y%m%d-%H%M%S')}")
+
+        combined: Optional[pstats.Stats] = None
+        stack_lines: List[str] = []
+        for state, profile in self._profiles.items():
+            stats = pstats.Stats(profile)
+            stack_lines.extend(collapse_stacks(stats, state.name))
+            if combined is None:
+                combined = stats
+            else:
+                combined.add(stats)
+
+        paths = [base + ".pstats", base + ".collapsed"]
+        combined.dump_stats(paths[0])
+        with open(paths[1], "w") as collapsed_file:
+            collapsed_file.write("\n".join(stack_lines) + "\n")
+
+        frames = ", ".join(f"{state.name}: {count}" for state, count in self._frame_counts.items())
+        print(f"Profile of {frames} frames written to {paths[0]} and {paths[1]}")
+        self._profiles = {}
+        return paths
+
+def _frame_label(function: FunctionKey) -> str:
+    """Format a pstats function key as a flamegraph frame name."""
+    filename, line, name = function
+    if filename == "~":  # Built-in functions
+        return name.replace(";", ":")
+    return f"{name} ({os.path.basename(filename)}:{line})".replace(";", ":")
+
+def collapse_stacks(stats: pstats.Stats, root: str) -> List[str]:
+    """Turn profile stats into collapsed-stack lines for flamegraph tools.
+
+    cProfile only records caller/callee pairs, so full stacks are rebuilt by
+    walking down from the functions nobody called, splitting each function's
+    time between its callers in proportion to the time each call path spent in it.
+
+    Args:
+        stats: The profile statistics
+        root: Name of the root frame, e.g. the game state
+
+    Returns:
+        Lines of "root;outer;...;inner microseconds"
+    """
+    entries = stats.stats  # {function: (primitive calls, calls, own time, cumulative time, callers)}
+    callees: Dict[FunctionKey, Dict[FunctionKey, float]] = {}
+    for function, (_, _, _, _, callers) in entries.items():
+        for caller, caller_stats in callers.items():
+            callees.setdefault(caller, {})[function] = caller_stats[3]
+    roots = [function for function, entry in entries.items() if not any(caller in entries for caller in entry[4])]
+
+    totals: Dict[str, float] = {}
+
+    def walk(function: FunctionKey, path: Tuple[str, ...], path_time: float, seen: frozenset) -> None:
+        _, _, own_time, cumulative_time, _ = entries[function]
+        share = path_time / cumulative_time if cumulative_time > 0 else 0.0
+        stack = path + (_frame_label(function),)
+        if own_time * share > 0:
+            key = ";".join(stack)
+            totals[key] = totals.get(key, 0.0) + own_time * share
+        if len(stack) >= MAX_STACK_DEPTH:
+            return
+        for callee, edge_time in callees.get(function, {}).items():
+            if callee in seen or callee not in entries:
+                continue  # Recursion is folded into the outer call
+            walk(callee, stack, edge_time * share, seen | {callee})
+
+    for function in roots:
+        walk(function, (root,), entries[function][3], frozenset((function,)))
+
+    return [f"{stack} {round(seconds * 1_000_000)}" for stack, seconds in totals.items()
+            if round(seconds * 1_000_000) > 0]
+
+# Shared capture manager used by the main loop
+capture_manager: CaptureManager = CaptureManager()
@@ -0,0 +1,167 @@
+import json
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
+from src.game.core.quest_estimator import (DEFAULT_TRIALS, ESTIMATE_VERSION, HeroBuild, QuestEstimate,
+                                           QuestTally, combine, simulate_quest)
+
+# Environment variable to move the estimate cache, "quest_estimates.json" by default
+ESTIMATE_CACHE_ENV_VAR: str = "VILLAGE_DEFENSE_ESTIMATE_CACHE"
+DEFAULT_CACHE_FILE: str = "quest_estimates.json"
+BATCHES_PER_QUEST: int = 4  # Each quest is split so one long quest can use several workers
+
+# Type aliases
+EstimateKey = str
+
+class EstimateManager:
+    """Estimates quest difficulty in worker processes and caches the results on disk.
+
+    request never blocks: it returns a cached estimate or queues the quest on a
+    ProcessPoolExecutor and returns None. Game calls poll every frame while
+    the manager is busy, whichever screen is shown.
+    """
+
+    def __init__(self, cache_file: Optional[str] = None, trials: int = DEFAULT_TRIALS,
+                 max_workers: Optional[int] = None) -> None:
+        """
+        Initialize the manager. The worker pool is only started once a quest needs estimating.
+
+        Args:
+            cache_file: Path of the cache file, defaults to ESTIMATE_CACHE_ENV_VAR or DEFAULT_CACHE_FILE
+            trials: Number of runs per estimate
+            max_workers: Number of worker processes, defaults to one less than the number of CPUs
+        """
+        self.enabled: bool = True
+        self.cache_file: str = cache_file or os.environ.get(ESTIMATE_CACHE_ENV_VAR, DEFAULT_CACHE_FILE)
+        self.trials: int = trials
+        self.max_workers: int = max_workers or max(1, (os.cpu_count() or 2) - 1)
+        self.seed: int = 0  # Fixed, so the same build always gets the same rating
+        self.finished: int = 0  # Estimates collected so far, screens compare it to spot new ones
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._cache: Optional[Dict[EstimateKey, QuestEstimate]] = None
+        self._pending: Dict[EstimateKey, Tuple[str, List[Future]]] = {}
+        self._failed: Set[EstimateKey] = set()
+
+    @staticmethod
+    def cache_key(build: HeroBuild, quest: str) -> EstimateKey:
+        """
+        Get the cache key of a build and quest.
+
+        Args:
+            build: The hero build
+            quest: Name of the quest
+
+        Returns:
+            Key of the estimate in the cache
+        """
+        return "|".join((build.class_name, str(build.level), str(build.max_hp), build.weapon,
+                         build.armor, ",".join(build.abilities), quest))
+
+    def _load_cache(self) -> Dict[EstimateKey, QuestEstimate]:
+        """Read the cache file the first time it is needed."""
+        if self._cache is None:
+            self._cache = {}
+            try:
+                with open(self.cache_file, "r") as cache:
+                    data = json.load(cache)
+                if data.get("version") == ESTIMATE_VERSION and data.get("trials") == self.trials:
+                    for key, values in data.get("estimates", {}).items():
+                        self._cache[key] = QuestEstimate(*values)
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError, TypeError) as e:
+                print(f"Error loading quest estimates: {e}")
+        return self._cache
+
+    def _save_cache(self) -> None:
+        """Write the cache file."""
+        data = {
+            "version": ESTIMATE_VERSION,
+            "trials": self.trials,
+            "estimates": {key: list(estimate) for key, estimate in self._load_cache().items()},
+        }
+        try:
+            with open(self.cache_file, "w") as cache:
+                json.dump(data, cache)
+        except OSError as e:
+            print(f"Error saving quest estimates: {e}")
+
+    def get(self, build: HeroBuild, quest: str) -> Optional[QuestEstimate]:
+        """
+        Get a finished estimate without queueing anything.
+
+        Args:
+            build: The hero build
+            quest: Name of the quest
+
+        Returns:
+            The estimate, or None if there is none yet
+        """
+        return self._load_cache().get(self.cache_key(build, quest))
+
+    def request(self, build: HeroBuild, quest: str, monster_list: Dict[str, int]) -> Optional[QuestEstimate]:
+        """
+        Get an estimate, queueing it in the background if it is not cached.
+
+        Args:
+            build: The hero build
+            quest: Name of the quest
+            monster_list: Monsters the quest asks for, by name
+
+        Returns:
+            The cached estimate, or None while it is being worked out
+        """
+        key = self.cache_key(build, quest)
+        estimate = self._load_cache().get(key)
+        if estimate is not None or not self.enabled or key in self._pending or key in self._failed:
+            return estimate
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        monsters = dict(monster_list)
+        batch_trials = [self.trials // BATCHES_PER_QUEST + (batch < self.trials % BATCHES_PER_QUEST)
+                        for batch in range(BATCHES_PER_QUEST)]
+        futures = [self._executor.submit(simulate_quest, build, monsters, trials, f"{self.seed}:{quest}:{batch}")
+                   for batch, trials in enumerate(batch_trials) if trials > 0]
+        self._pending[key] = (quest, futures)
+        return None
+
+    @property
+    def busy(self) -> bool:
+        """True while estimates are being worked out."""
+        return bool(self._pending)
+
+    def poll(self) -> int:
+        """
+        Collect the estimates that finished since the last call and save them.
+
+        Returns:
+            Number of new estimates
+        """
+        finished = 0
+        for key, (quest, futures) in list(self._pending.items()):
+            if not all(future.done() for future in futures):
+                continue
+            del self._pending[key]
+            try:
+                tallies: List[QuestTally] = [future.result() for future in futures]
+            except Exception as e:  # A worker died or the simulation raised
+                print(f"Error estimating {quest}: {e}")
+                self._failed.add(key)
+                continue
+            self._load_cache()[key] = combine(quest, tallies)
+            finished += 1
+        self.finished += finished
+        if finished:
+            self._save_cache()
+        return finished
+
+    def shutdown(self) -> None:
+        """Stop the workers, dropping any estimates still queued."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._pending.clear()
+
+# Shared estimator used by the quest screen
+estimate_manager: EstimateManager = EstimateManager()
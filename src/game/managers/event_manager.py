@@ -1,7 +1,50 @@
+import gzip
+import json
+import os
 import pygame
 from src.game.core.constants import GameState
+from src.game.managers.rng_manager import rng
 from src.game.ui.button import Button
-from typing import Tuple, Optional, List, Dict, Any
+from typing import IO, Tuple, Optional, List, Dict, Any
+
+# Environment variables that record or replay a session without changing code
+RECORD_ENV_VAR: str = "VILLAGE_DEFENSE_RECORD"  # Path to write the recording to
+REPLAY_ENV_VAR: str = "VILLAGE_DEFENSE_REPLAY"  # Path of a recording to play back
+SEED_ENV_VAR: str = "VILLAGE_DEFENSE_SEED"  # Optional RNG seed for a new recording
+
+RECORDING_VERSION: int = 3  # 2: draws come from the named streams in rng_manager, 3: frames can carry decisions
+READABLE_VERSIONS: Tuple[int, ...] = (2, RECORDING_VERSION)  # Version 2 frames have no decisions
+
+# Input events written to recordings. Window and audio events are left out,
+# they depend on the machine and do not change the game.
+RECORDED_EVENT_TYPES: Tuple[int, ...] = (
+    pygame.QUIT,
+    pygame.KEYDOWN,
+    pygame.KEYUP,
+    pygame.TEXTINPUT,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEBUTTONUP,
+    pygame.MOUSEMOTION,
+    pygame.MOUSEWHEEL,
+)
+
+# Type aliases
+RecordedEvent = Tuple[int, Dict[str, Any]]
+RecordedFrame = Tuple[int, int, List[RecordedEvent], List[Any]]  # (pygame ticks, update steps, events, decisions)
+
+def _encode_event(event: pygame.event.Event) -> RecordedEvent:
+    """Convert an event to a JSON friendly (type, attributes) pair."""
+    attributes = {name: value for name, value in event.dict.items()
+                  if value is None or isinstance(value, (bool, int, float, str, tuple, list))}
+    if event.type == pygame.MOUSEWHEEL:
+        # Wheel events have no position, but the scroll target depends on it
+        attributes["pos"] = pygame.mouse.get_pos()
+    return event.type, attributes
+
+def _decode_event(event_type: int, attributes: Dict[str, Any]) -> pygame.event.Event:
+    """Rebuild an event from a recording, turning JSON lists back into tuples."""
+    return pygame.event.Event(event_type, {name: tuple(value) if isinstance(value, list) else value
+                                           for name, value in attributes.items()})
 
 class EventManager:
     """Manages event handling and processing for the game."""
@@ -10,6 +53,17 @@ class EventManager:
         """Initialize the event manager."""
         self.button_delay_timer = 0
         self.BUTTON_DELAY = 250  # 250ms = 0.25 seconds
+        self.frame = 0  # Number of finished frames since the recording or replay started
+        self.seed: Optional[int] = None
+        self._recording: Optional[IO[str]] = None
+        self._pending: List[RecordedEvent] = []  # Input of the current frame, written by end_frame
+        self._decisions: List[Any] = []  # Decisions of the current frame, written by end_frame
+        self._replay_decisions: List[Any] = []  # Recorded decisions of the current frame not handed out yet
+        self._replay: Dict[int, RecordedFrame] = {}
+        self._replay_frames: int = 0  # Length of the replay in frames
+        self._replay_ticks: int = 0
+        self._replay_updates: int = 1
+        self.replaying: bool = False
         self.key_actions = {
             pygame.K_ESCAPE: "escape",
             pygame.K_BACKSPACE: "backspace",
@@ -18,13 +72,22 @@ class EventManager:
             pygame.K_TAB: "tab",
         }
         
+    def get_ticks(self) -> int:
+        """Get the game clock in milliseconds.
+        Returns:
+            int: The recorded clock of the current frame while replaying, pygame's clock otherwise
+        """
+        if self.replaying:
+            return self._replay_ticks
+        return pygame.time.get_ticks()
+        
     def can_click_buttons(self) -> bool:
         """Check if enough time has passed to allow button clicks."""
-        return pygame.time.get_ticks() - self.button_delay_timer >= self.BUTTON_DELAY
+        return self.get_ticks() - self.button_delay_timer >= self.BUTTON_DELAY
         
     def reset_button_delay(self) -> None:
         """Reset the button click delay timer."""
-        self.button_delay_timer = pygame.time.get_ticks()
+        self.button_delay_timer = self.get_ticks()
         
     def handle_quit_event(self, event: pygame.event.Event, game_state: GameState) -> Tuple[GameState, bool]:
         """Handle quit event.
@@ -127,7 +190,180 @@ class EventManager:
         Returns:
             list: List of pygame events
         """
-        return pygame.event.get()
+        if self.replaying:
+            return self._next_replay_frame()
+        return self._record(pygame.event.get())
+        
+    def wait_for_events(self, timeout: int) -> List[pygame.event.Event]:
+        """Sleep until an event arrives or the timeout passes, then get all current events.
+        Args:
+            timeout: Maximum time to wait in milliseconds
+            
+        Returns:
+            list: List of pygame events, empty if the timeout passed
+        """
+        if self.replaying:
+            return self._next_replay_frame()  # Nobody is at the keyboard, never sleep
+        event = pygame.event.wait(timeout)
+        if event.type == pygame.NOEVENT:
+            return self._record([])
+        return self._record([event] + pygame.event.get())
+        
+    @property
+    def recording(self) -> bool:
+        """True while events are being written to a recording."""
+        return self._recording is not None
+        
+    def start_recording(self, path: str, seed: Optional[int] = None) -> int:
+        """Record every frame's input to a file until stop() is called.
+        
+        The game's RNG streams are seeded first and the seed stored with the recording,
+        so a replay sees the same shop cards, monsters and hits.
+        
+        Args:
+            path: File to write, gzip compressed JSON lines
+            seed: RNG seed, or None to pick one
+            
+        Returns:
+            int: The seed the recording was started with
+        """
+        self.stop()
+        self.seed = rng.seed(seed)
+        self.frame = 0
+        self._recording = gzip.open(path, "wt", encoding="utf-8")
+        self._write_line({"version": RECORDING_VERSION, "seed": self.seed})
+        print(f"Recording input to {path} (seed {self.seed})")
+        return self.seed
+        
+    def start_replay(self, path: str) -> int:
+        """Feed a recording back frame by frame instead of reading real input.
+        
+        Frame numbers count calls to end_frame, so the game must be in the same
+        state the recording started in. Each frame gets the recorded input, clock
+        and number of update steps. Once the recording runs out a QUIT event ends
+        the game.
+        
+        Args:
+            path: File written by start_recording
+            
+        Returns:
+            int: The RNG seed of the recording, already applied
+        """
+        self.stop()
+        with gzip.open(path, "rt", encoding="utf-8") as recording:
+            header = json.loads(recording.readline())
+            if header.get("version") not in READABLE_VERSIONS:
+                raise ValueError(f"Unsupported recording version in {path}: {header.get('version')}")
+            frames: Dict[int, RecordedFrame] = {}
+            frame_count = 0
+            for line in recording:
+                data = json.loads(line)
+                if isinstance(data, dict):  # Trailer written by stop()
+                    frame_count = max(frame_count, data["frames"])
+                    continue
+                frame, ticks, updates, events = data[:4]
+                decisions = data[4] if len(data) > 4 else []
+                frames[frame] = (ticks, updates, [(event_type, attributes) for event_type, attributes in events],
+                                 decisions)
+                frame_count = max(frame_count, frame + 1)
+        self.seed = rng.seed(header["seed"])
+        self.frame = 0
+        self._replay = frames
+        self._replay_frames = frame_count
+        self._replay_ticks = 0
+        self._replay_updates = 1
+        self._replay_decisions = []
+        self.replaying = True
+        return self.seed
+        
+    def start_from_environment(self) -> None:
+        """Start a replay or recording if REPLAY_ENV_VAR or RECORD_ENV_VAR is set."""
+        replay_path = os.environ.get(REPLAY_ENV_VAR)
+        record_path = os.environ.get(RECORD_ENV_VAR)
+        if replay_path:
+            self.start_replay(replay_path)
+        elif record_path:
+            seed = os.environ.get(SEED_ENV_VAR)
+            self.start_recording(record_path, int(seed) if seed else None)
+        
+    def stop(self) -> None:
+        """Finish a recording or replay and go back to live input."""
+        if self._recording is not None:
+            # The trailer keeps quiet frames at the end, so replays run as long as the session
+            self._write_line({"frames": self.frame})
+            self._recording.close()
+            self._recording = None
+        self._replay = {}
+        self.replaying = False
+        
+    def replay_updates(self) -> Optional[int]:
+        """Get the number of update steps the current frame ran when it was recorded.
+        Returns:
+            int: Number of steps while replaying, None when the game clock decides
+        """
+        return self._replay_updates if self.replaying else None
+        
+    def end_frame(self, updates: int) -> None:
+        """Finish a frame, writing it to the recording if anything happened.
+        Args:
+            updates: Number of fixed update steps the frame ran
+        """
+        if self._recording is not None and (self._pending or self._decisions or updates != 1):
+            # Quiet frames with a single step are left out, replays fill them back in
+            line = [self.frame, pygame.time.get_ticks(), updates, self._pending]
+            if self._decisions:
+                line.append(self._decisions)
+            self._write_line(line)
+        self._pending = []
+        self._decisions = []
+        self.frame += 1
+        
+    def record_decision(self, decision: Any) -> None:
+        """Write a choice the game made to the recording, so a replay can make the same one.
+        
+        For choices that depend on something a replay cannot reproduce, such as
+        when a worker process finished.
+        
+        Args:
+            decision: JSON friendly value describing the choice
+        """
+        if self._recording is not None:
+            self._decisions.append(decision)
+        
+    def replay_decision(self) -> Optional[Any]:
+        """Get the next choice recorded with record_decision in the current frame.
+        Returns:
+            The recorded value, or None if the frame has no more decisions or nothing is replaying
+        """
+        if not self.replaying or not self._replay_decisions:
+            return None
+        return self._replay_decisions.pop(0)
+        
+    def _record(self, events: List[pygame.event.Event]) -> List[pygame.event.Event]:
+        """Keep a frame's input events for the recording, then pass them through."""
+        if self._recording is not None:
+            self._pending.extend(_encode_event(event) for event in events if event.type in RECORDED_EVENT_TYPES)
+        return events
+        
+    def _next_replay_frame(self) -> List[pygame.event.Event]:
+        """Get the recorded events of the current frame."""
+        # Drain real input so the queue does not fill up, but let the window still be closed
+        live_quit = any(event.type == pygame.QUIT for event in pygame.event.get())
+        if live_quit or self.frame >= self._replay_frames:
+            self.stop()
+            return [pygame.event.Event(pygame.QUIT)]
+        recorded = self._replay.get(self.frame)
+        if recorded is None:
+            self._replay_updates = 1
+            self._replay_decisions = []
+            return []
+        self._replay_ticks, self._replay_updates, events, decisions = recorded
+        self._replay_decisions = list(decisions)
+        return [_decode_event(event_type, attributes) for event_type, attributes in events]
+        
+    def _write_line(self, data: Any) -> None:
+        """Write one compact JSON line to the recording."""
+        self._recording.write(json.dumps(data, separators=(",", ":")) + "\n")
         
     def get_mouse_pos(self) -> Tuple[int, int]:
         """Get current mouse position.
@@ -0,0 +1,62 @@
+import pygame
+from typing import Dict, Optional, Tuple
+from src.game.utils.fileIO import resource_path
+
+# Type aliases
+FontKey = Tuple[Optional[str], int, bool, bool]
+
+DEFAULT_FONT_SIZE: int = 24
+
+class FontManager:
+    """Shared registry that creates each font once and hands out the same object."""
+
+    def __init__(self) -> None:
+        """Initialize an empty font registry."""
+        self._fonts: Dict[FontKey, pygame.font.Font] = {}
+        self.creations: int = 0
+        self.requests: int = 0
+
+    def get_font(self, face: Optional[str] = None, size: int = DEFAULT_FONT_SIZE,
+                bold: bool = False, italic: bool = False) -> pygame.font.Font:
+        """
+        Get a font, creating it on first use.
+
+        Args:
+            face: Path of a font file relative to the game root, or None for the default font
+            size: Point size of the font
+            bold: Render the font in bold
+            italic: Render the font in italics
+
+        Returns:
+            The shared Font object for this face, size and style
+        """
+        self.requests += 1
+        key: FontKey = (face, size, bold, italic)
+        font = self._fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(resource_path(face) if face else None, size)
+            font.set_bold(bold)
+            font.set_italic(italic)
+            self._fonts[key] = font
+            self.creations += 1
+        return font
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the registry counters.
+
+        Returns:
+            Dictionary with the number of cached fonts, font creations and requests
+        """
+        return {
+            "fonts": len(self._fonts),
+            "creations": self.creations,
+            "requests": self.requests,
+        }
+
+    def clear(self) -> None:
+        """Drop all fonts, e.g. after pygame.font has been shut down."""
+        self._fonts.clear()
+
+# Shared registry used by Game, the managers and entity drawing code
+font_manager: FontManager = FontManager()
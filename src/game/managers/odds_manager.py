@@ -0,0 +1,106 @@
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Dict, Optional, Set, Tuple
+from src.game.core.battle_solver import BattleModel, BattleOdds, BattleSolver, Policy, SolverState, battle_solver
+
+def solve_odds(model: BattleModel, start: SolverState, policy: Policy) -> Dict[SolverState, BattleOdds]:
+    """
+    Solve a battle from a state on.
+
+    Args:
+        model: The battle
+        start: State to solve from
+        policy: How the hero acts in every state
+
+    Returns:
+        Odds of every state reachable from start
+    """
+    solved: Dict[SolverState, BattleOdds] = {}
+    BattleSolver(policy).solve(model, start, solved)
+    return solved
+
+class OddsManager:
+    """Works out the live battle odds in a worker process.
+
+    request never blocks: it returns the odds if the solver already has them
+    or queues the battle and returns None. A solved battle covers every state
+    the policy can reach, so later turns are looked up straight away. Call
+    poll once per frame and ask again when it reports new odds.
+    """
+
+    def __init__(self, solver: BattleSolver = battle_solver, max_workers: int = 1) -> None:
+        """
+        Initialize the manager. The worker pool is only started when odds are first needed.
+
+        Args:
+            solver: Solver that keeps the solved states, its policy is used in the worker
+            max_workers: Number of worker processes
+        """
+        self.enabled: bool = True
+        self.solver: BattleSolver = solver
+        self.max_workers: int = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending: Dict[Tuple, Tuple[BattleModel, Future]] = {}
+        self._failed: Set[Tuple] = set()
+
+    def request(self, hero: Any, monster: Any) -> Optional[BattleOdds]:
+        """
+        Get the odds of a battle in progress, queueing them in the background if they are not solved.
+
+        Args:
+            hero: The hero
+            monster: The monster
+
+        Returns:
+            The odds, or None while they are being worked out
+        """
+        odds = self.solver.cached_odds(hero, monster)
+        if odds is not None or not self.enabled:
+            return odds
+        model = BattleModel(hero, monster)
+        state = model.state_of(hero, monster)
+        key = (model.key, state)
+        if key in self._pending or key in self._failed:
+            return None
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        self._pending[key] = (model, self._executor.submit(solve_odds, model, state, self.solver.policy))
+        return None
+
+    @property
+    def busy(self) -> bool:
+        """True while odds are being worked out."""
+        return bool(self._pending)
+
+    def poll(self) -> int:
+        """
+        Collect the odds that finished since the last call.
+
+        Returns:
+            Number of battles solved
+        """
+        finished = 0
+        for key, (model, future) in list(self._pending.items()):
+            if not future.done():
+                continue
+            del self._pending[key]
+            try:
+                self.solver.add(model, future.result())
+            except ValueError:  # The hero is in a state the solver does not model
+                self._failed.add(key)
+                continue
+            except Exception as e:  # A worker died
+                print(f"Error solving battle odds: {e}")
+                self._failed.add(key)
+                continue
+            finished += 1
+        return finished
+
+    def shutdown(self) -> None:
+        """Stop the worker, dropping any odds still being solved."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._pending.clear()
+
+# Shared odds worker used by the battle screen
+odds_manager: OddsManager = OddsManager()
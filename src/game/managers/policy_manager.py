@@ -0,0 +1,147 @@
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Set, Tuple
+from src.game.core.battle_engine import BattleAction
+from src.game.core.battle_solver import BattleModel, SolverState, solve_policy
+from src.game.entities.combat_stats import monster_stats
+from src.game.utils.lru_cache import LRUCache
+
+# Policies are large, a few hundred thousand states for a well equipped hero, so
+# only those of the most recent builds and monster types are kept
+DEFAULT_MAX_POLICIES: int = 6
+
+# Type aliases
+PolicyKey = Tuple  # (hero class, level, max hp, max energy, weapon, armor, abilities, monster type)
+Policy = Dict[SolverState, BattleAction]
+
+def solve_policies(model: BattleModel, damages: List[int], starts: List[SolverState]) -> Dict[int, Policy]:
+    """
+    Solve the auto-battle policy for every damage a monster type can roll.
+
+    Args:
+        model: The battle against one monster of the type
+        damages: Damage values the monster type can have
+        starts: States the policies must cover
+
+    Returns:
+        Policy for each damage value
+    """
+    return {damage: solve_policy(model.with_monster_damage(damage), starts) for damage in damages}
+
+class PolicyManager:
+    """Works out optimal auto-battle policies in a worker process and caches them.
+
+    Policies are cached per hero build and monster type, and cover every health
+    and damage roll of the type, so later battles with the same build are
+    instant. Only the max_policies most recently used keys are kept. A state
+    the cache does not cover yet is solved again in the background.
+    """
+
+    def __init__(self, max_workers: int = 1, max_policies: int = DEFAULT_MAX_POLICIES) -> None:
+        """
+        Initialize the manager. The worker pool is only started when a policy is first needed.
+
+        Args:
+            max_workers: Number of worker processes
+            max_policies: Number of build and monster type keys whose policies are kept
+        """
+        self.max_workers: int = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._policies: LRUCache = LRUCache(max_policies)  # PolicyKey -> policy for each damage value
+        self._pending: Dict[PolicyKey, Future] = {}
+        self._failed: Set[PolicyKey] = set()
+
+    @staticmethod
+    def cache_key(hero: Any, monster: Any) -> PolicyKey:
+        """
+        Get the cache key of a battle.
+
+        Args:
+            hero: The hero
+            monster: The monster
+
+        Returns:
+            Key of the battle's policies
+        """
+        return (hero.class_name, hero.level, hero.max_hp, hero.max_energy,
+                hero.weapon.name if hero.weapon else "", hero.armor.name if hero.armor else "",
+                tuple(ability.name for ability in hero.abilities), monster.name)
+
+    @staticmethod
+    def _work(hero: Any, monster: Any) -> Tuple[BattleModel, List[int], List[SolverState]]:
+        """Get the model, damage values and start states covering every roll of the monster's type."""
+        model = BattleModel(hero, monster)
+        state = model.state_of(hero, monster)
+        stats = monster_stats.get(monster.name)
+        if stats is None:  # Not a spawnable type, cover just this monster
+            return model, [monster.damage], [state]
+        damages = sorted(set(range(*stats.damage)) | {monster.damage})
+        healths = sorted(set(range(*stats.health)) | {state.monster_hp})
+        return model, damages, [state._replace(monster_hp=health) for health in healths]
+
+    def best_action(self, hero: Any, monster: Any) -> Optional[BattleAction]:
+        """
+        Get the optimal action in the current state of a battle. Never blocks.
+
+        Args:
+            hero: The hero
+            monster: The monster
+
+        Returns:
+            The action, or None while the policy is being worked out in the background
+        """
+        key = self.cache_key(hero, monster)
+        state = BattleModel.state_of(hero, monster)
+        policy = (self._policies.get(key) or {}).get(monster.damage)
+        if policy is not None and state in policy:
+            return policy[state]
+
+        if key not in self._pending and key not in self._failed:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            self._pending[key] = self._executor.submit(solve_policies, *self._work(hero, monster))
+        return None
+
+    def _merge(self, key: PolicyKey, policies: Dict[int, Policy]) -> None:
+        """Add solved policies to the cache."""
+        cached = self._policies.get(key)
+        if cached is None:
+            cached = {}
+            self._policies.put(key, cached)
+        for damage, policy in policies.items():
+            cached.setdefault(damage, {}).update(policy)
+
+    @property
+    def busy(self) -> bool:
+        """True while a policy is being worked out."""
+        return bool(self._pending)
+
+    def poll(self) -> int:
+        """
+        Collect the policies that finished since the last call.
+
+        Returns:
+            Number of new policies
+        """
+        finished = 0
+        for key, future in list(self._pending.items()):
+            if not future.done():
+                continue
+            del self._pending[key]
+            try:
+                self._merge(key, future.result())
+            except Exception as e:  # A worker died or the solver raised
+                print(f"Error solving auto-battle policy: {e}")
+                self._failed.add(key)
+                continue
+            finished += 1
+        return finished
+
+    def shutdown(self) -> None:
+        """Stop the worker, dropping any policy still being solved."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._pending.clear()
+
+# Shared policy cache used by auto-battle
+policy_manager: PolicyManager = PolicyManager()
@@ -0,0 +1,183 @@
+import time
+import pygame
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+from src.game.core.constants import Colors
+
+# Type aliases
+Percentiles = Tuple[float, float, float]
+
+FRAME_PHASE: str = "frame"  # Whole frame, from one begin_frame to the next
+
+class _PhaseTimer:
+    """Reusable context manager that adds the time spent in a with block to a phase."""
+
+    __slots__ = ("profiler", "phase", "start")
+
+    def __init__(self, profiler: "ProfilerManager", phase: str) -> None:
+        self.profiler = profiler
+        self.phase = phase
+        self.start = 0.0
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info) -> None:
+        self.profiler.add(self.phase, time.perf_counter() - self.start)
+
+class _NullTimer:
+    """Context manager used while profiling is off, so instrumentation costs almost nothing."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+_NULL_TIMER = _NullTimer()
+
+class ProfilerManager:
+    """Collects per-phase frame times and draws them as an overlay.
+
+    Code marks a phase with ``with profiler.measure("phase"):``. Times of the same
+    phase within one frame are summed, and the last window frames are kept to
+    report p50, p95 and p99 per phase.
+    """
+
+    def __init__(self, window: int = 240, refresh_frames: int = 15) -> None:
+        """Initialize the profiler. It starts disabled.
+
+        Args:
+            window: Number of recent frames used for the percentiles
+            refresh_frames: Recompute the overlay figures every this many frames
+        """
+        self.enabled: bool = False
+        self.window: int = window
+        self.refresh_frames: int = refresh_frames
+        self.history: Dict[str, Deque[float]] = {}
+        self._current: Dict[str, float] = {}
+        self._timers: Dict[str, _PhaseTimer] = {}
+        self._frame_start: Optional[float] = None
+        self._frames_since_refresh: int = 0
+        self._summary: List[Tuple[str, Percentiles]] = []
+
+    def toggle(self) -> None:
+        """Turn profiling and the overlay on or off. Turning it on starts from empty history."""
+        self.enabled = not self.enabled
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all recorded frames."""
+        self.history.clear()
+        self._current.clear()
+        self._frame_start = None
+        self._summary = []
+
+    def measure(self, phase: str):
+        """Get a context manager that times a with block as part of a phase.
+
+        Args:
+            phase: Name of the phase, e.g. "events" or "flip"
+
+        Returns:
+            A reusable context manager
+        """
+        if not self.enabled:
+            return _NULL_TIMER
+        timer = self._timers.get(phase)
+        if timer is None:
+            timer = self._timers[phase] = _PhaseTimer(self, phase)
+        return timer
+
+    def add(self, phase: str, seconds: float) -> None:
+        """Add time to a phase of the current frame.
+
+        Args:
+            phase: Name of the phase
+            seconds: Time spent
+        """
+        self._current[phase] = self._current.get(phase, 0.0) + seconds
+
+    def begin_frame(self) -> None:
+        """Close the previous frame and start timing a new one."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self._frame_start is not None:
+            self._current[FRAME_PHASE] = now - self._frame_start
+            for phase, seconds in self._current.items():
+                samples = self.history.get(phase)
+                if samples is None:
+                    samples = self.history[phase] = deque(maxlen=self.window)
+                samples.append(seconds * 1000)
+            self._frames_since_refresh += 1
+        self._current = {}
+        self._frame_start = now
+
+    def percentiles(self, phase: str) -> Percentiles:
+        """Get p50, p95 and p99 of a phase over the recorded frames.
+
+        Frames in which the phase did not run are not counted.
+
+        Args:
+            phase: Name of the phase
+
+        Returns:
+            Tuple of (p50, p95, p99) in milliseconds, zeros if nothing was recorded
+        """
+        samples = sorted(self.history.get(phase, ()))
+        if not samples:
+            return (0.0, 0.0, 0.0)
+        last = len(samples) - 1
+        return tuple(samples[round(last * q)] for q in (0.50, 0.95, 0.99))
+
+    def summary(self) -> List[Tuple[str, Percentiles]]:
+        """Get the percentiles of every phase, the whole frame first.
+
+        Returns:
+            List of (phase, (p50, p95, p99)) sorted by p95, slowest first
+        """
+        phases = sorted((phase for phase in self.history if phase != FRAME_PHASE),
+                        key=lambda phase: self.percentiles(phase)[1], reverse=True)
+        return [(phase, self.percentiles(phase)) for phase in [FRAME_PHASE] + phases if phase in self.history]
+
+    def draw(self, surface: pygame.Surface, font: pygame.font.Font, x: int = 5, y: int = 5) -> pygame.Rect:
+        """Draw the overlay with the percentiles of each phase.
+
+        Args:
+            surface: The surface to draw on
+            font: Font used for the overlay text
+            x: Left edge of the overlay
+            y: Top edge of the overlay
+
+        Returns:
+            The area covered by the overlay
+        """
+        if not self._summary or self._frames_since_refresh >= self.refresh_frames:
+            self._summary = self.summary()
+            self._frames_since_refresh = 0
+
+        header = ("phase", "p50", "p95", "p99")
+        rows = [header] + [(phase, f"{p50:.2f}", f"{p95:.2f}", f"{p99:.2f}")
+                           for phase, (p50, p95, p99) in self._summary]
+        line_height = font.get_linesize()
+        name_width = max(font.size(row[0])[0] for row in rows) + 10
+        number_width = font.size("000.00")[0] + 10
+        rect = pygame.Rect(x, y, name_width + number_width * 3 + 10, line_height * len(rows) + 10)
+
+        panel = pygame.Surface(rect.size, pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 180))
+        for index, row in enumerate(rows):
+            row_y = 5 + index * line_height
+            panel.blit(font.render(row[0], True, Colors.WHITE), (5, row_y))
+            # Right-align the numbers in their columns
+            for column, text in enumerate(row[1:], start=1):
+                text_surface = font.render(text, True, Colors.WHITE)
+                panel.blit(text_surface, (5 + name_width + number_width * column - text_surface.get_width(), row_y))
+        surface.blit(panel, rect)
+        return rect
+
+# Shared profiler used by Game, the scenes and the managers
+profiler: ProfilerManager = ProfilerManager()
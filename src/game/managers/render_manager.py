@@ -0,0 +1,123 @@
+import pygame
+from typing import Dict, List, Optional, Tuple
+from src.game.core.constants import Colors
+
+# Window events after which the whole window has to be pushed again
+REDRAW_EVENTS: Tuple[int, ...] = tuple(
+    getattr(pygame, name) for name in ("VIDEOEXPOSE", "WINDOWEXPOSED", "WINDOWRESTORED", "WINDOWSIZECHANGED")
+    if hasattr(pygame, name)
+)
+
+class RenderManager:
+    """Tracks which parts of the screen changed and only pushes those to the display."""
+
+    def __init__(self, screen: pygame.Surface, background: Tuple[int, int, int] = Colors.WHITE) -> None:
+        """
+        Initialize the render manager.
+
+        Args:
+            screen: The display surface
+            background: Color used to clear the screen and erase widgets
+        """
+        self.screen: pygame.Surface = screen
+        self.background: Tuple[int, int, int] = background
+        self.full_redraw: bool = True
+        self.dirty_rects: List[pygame.Rect] = []
+        self.frames_presented: int = 0
+        self.pixels_presented: int = 0
+
+    def invalidate(self, rect: Optional[pygame.Rect] = None) -> None:
+        """
+        Mark part of the screen as changed.
+
+        Args:
+            rect: The changed region, or None to redraw the whole screen
+        """
+        if rect is None:
+            self.full_redraw = True
+        elif not self.full_redraw:
+            clipped = pygame.Rect(rect).clip(self.screen.get_rect())
+            if clipped.width > 0 and clipped.height > 0:
+                self.dirty_rects.append(clipped)
+
+    def needs_full_redraw(self) -> bool:
+        """
+        Check if the next frame has to be drawn from scratch.
+
+        Returns:
+            True if the whole screen must be redrawn, False otherwise
+        """
+        return self.full_redraw
+
+    def has_pending(self) -> bool:
+        """
+        Check if anything was drawn or invalidated since the last present.
+
+        Returns:
+            True if the next present would push pixels, False if the screen is idle
+        """
+        return self.full_redraw or bool(self.dirty_rects)
+
+    def clear(self) -> None:
+        """Fill the whole screen with the background and mark it changed."""
+        self.screen.fill(self.background)
+        self.full_redraw = True
+
+    def erase(self, rect: pygame.Rect) -> None:
+        """
+        Fill a region with the background and mark it changed.
+
+        Args:
+            rect: The region to erase before a widget is redrawn
+        """
+        self.screen.fill(self.background, rect)
+        self.invalidate(rect)
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        """
+        Force a full redraw when the window contents were lost or resized.
+
+        Args:
+            event: The pygame event to check
+        """
+        if event.type in REDRAW_EVENTS:
+            self.invalidate()
+
+    def present(self) -> None:
+        """Push the changed regions to the display and start a new frame."""
+        if self.full_redraw:
+            pygame.display.update()
+            self.pixels_presented += self.screen.get_width() * self.screen.get_height()
+        elif self.dirty_rects:
+            rects = self._merge(self.dirty_rects)
+            pygame.display.update(rects)
+            self.pixels_presented += sum(rect.width * rect.height for rect in rects)
+        self.frames_presented += 1
+        self.full_redraw = False
+        self.dirty_rects = []
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the presentation counters.
+
+        Returns:
+            Dictionary with the number of frames and pixels pushed to the display
+        """
+        return {
+            "frames_presented": self.frames_presented,
+            "pixels_presented": self.pixels_presented,
+        }
+
+    @staticmethod
+    def _merge(rects: List[pygame.Rect]) -> List[pygame.Rect]:
+        """Combine overlapping rectangles so no pixel is pushed twice."""
+        merged: List[pygame.Rect] = []
+        for rect in rects:
+            rect = rect.copy()
+            overlapping = rect.collidelistall(merged)
+            while overlapping:
+                for index in reversed(overlapping):
+                    rect.union_ip(merged.pop(index))
+                overlapping = rect.collidelistall(merged)
+            merged.append(rect)
+        return merged
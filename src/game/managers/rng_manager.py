@@ -0,0 +1,208 @@
+import random
+from array import array
+from typing import Any, Dict, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+
+# Stream names, one per subsystem so extra draws in one never shift another
+COMBAT_STREAM: str = "combat"  # Hits, crits, dodges and blocks
+SPAWN_STREAM: str = "spawn"  # Which monster appears and its stats
+SHOP_STREAM: str = "shop"  # Shop cards
+HERO_STREAM: str = "hero"  # Starting hero stats
+
+DEFAULT_BLOCK_SIZE: int = 1024
+
+class RandomStream:
+    """A seedable random number stream that pre-generates its draws in blocks.
+
+    Every value comes from the same sequence of uniform floats in [0, 1), so
+    single draws and block draws can be mixed freely and stay reproducible.
+    """
+
+    def __init__(self, name: str, seed: Any, block_size: int = DEFAULT_BLOCK_SIZE) -> None:
+        """
+        Initialize a stream.
+
+        Args:
+            name: Name of the subsystem using the stream
+            seed: Seed of the stream
+            block_size: Number of floats generated at a time
+        """
+        if block_size <= 0:
+            raise ValueError("block_size must be greater than 0")
+        self.name: str = name
+        self.block_size: int = block_size
+        self.draws: int = 0
+        self._random: random.Random = random.Random()
+        self._block: array = array('d')
+        self._index: int = 0
+        self.seed(seed)
+
+    def seed(self, seed: Any) -> None:
+        """
+        Restart the stream from a seed, dropping any pre-generated draws.
+
+        Args:
+            seed: Any value accepted by random.seed
+        """
+        self._random.seed(seed)
+        self._block = array('d')
+        self._index = 0
+        self.draws = 0
+
+    def _refill(self) -> None:
+        """Generate the next block of floats."""
+        generate = self._random.random
+        self._block = array('d', [generate() for _ in range(self.block_size)])
+        self._index = 0
+
+    def random(self) -> float:
+        """
+        Get the next float.
+
+        Returns:
+            A float in [0, 1)
+        """
+        if self._index >= len(self._block):
+            self._refill()
+        value = self._block[self._index]
+        self._index += 1
+        self.draws += 1
+        return value
+
+    def randrange(self, start: int, stop: int) -> int:
+        """
+        Get a random integer.
+
+        Args:
+            start: Lowest value
+            stop: One past the highest value
+
+        Returns:
+            An integer in [start, stop)
+        """
+        if stop <= start:
+            raise ValueError(f"empty range for randrange({start}, {stop})")
+        return start + int(self.random() * (stop - start))
+
+    def randint(self, low: int, high: int) -> int:
+        """
+        Get a random integer, including both ends.
+
+        Args:
+            low: Lowest value
+            high: Highest value
+
+        Returns:
+            An integer in [low, high]
+        """
+        return self.randrange(low, high + 1)
+
+    def choice(self, sequence: Sequence[T]) -> T:
+        """
+        Pick a random element.
+
+        Args:
+            sequence: A non-empty sequence
+
+        Returns:
+            One element of the sequence
+        """
+        if not sequence:
+            raise IndexError("cannot choose from an empty sequence")
+        return sequence[int(self.random() * len(sequence))]
+
+    def block(self, count: int) -> array:
+        """
+        Take the next count floats at once, e.g. for a batch simulation.
+
+        Args:
+            count: Number of floats
+
+        Returns:
+            An array('d') of floats in [0, 1), the same values count random() calls would give
+        """
+        values = array('d')
+        while len(values) < count:
+            if self._index >= len(self._block):
+                self._refill()
+            take = min(count - len(values), len(self._block) - self._index)
+            values.extend(self._block[self._index:self._index + take])
+            self._index += take
+        self.draws += count
+        return values
+
+    def numpy_block(self, count: int) -> Any:
+        """
+        Take the next count floats as a NumPy array. Requires NumPy.
+
+        Args:
+            count: Number of floats
+
+        Returns:
+            A float64 numpy.ndarray with the same values as block(count)
+        """
+        import numpy  # Optional, only needed for vectorized simulations
+        return numpy.frombuffer(self.block(count), dtype=numpy.float64)
+
+class RngManager:
+    """Hands out one named random stream per subsystem, all derived from one seed."""
+
+    def __init__(self, seed: Optional[int] = None, block_size: int = DEFAULT_BLOCK_SIZE) -> None:
+        """
+        Initialize the manager. Streams are created on first use.
+
+        Args:
+            seed: Master seed, or None to pick one
+            block_size: Block size of new streams
+        """
+        self.block_size: int = block_size
+        self._streams: Dict[str, RandomStream] = {}
+        self.master_seed: int = 0
+        self.seed(seed)
+
+    def seed(self, seed: Optional[int] = None) -> int:
+        """
+        Reseed every stream from a master seed.
+
+        Args:
+            seed: Master seed, or None to pick one
+
+        Returns:
+            The master seed in use
+        """
+        self.master_seed = random.randrange(2**32) if seed is None else seed
+        for name, stream in self._streams.items():
+            stream.seed(self._stream_seed(name))
+        return self.master_seed
+
+    def _stream_seed(self, name: str) -> str:
+        """Derive the seed of a stream, so streams are independent but fixed by the master seed."""
+        return f"{self.master_seed}:{name}"
+
+    def stream(self, name: str) -> RandomStream:
+        """
+        Get a stream, creating it on first use.
+
+        Args:
+            name: Name of the subsystem, e.g. COMBAT_STREAM
+
+        Returns:
+            The shared stream with that name
+        """
+        stream = self._streams.get(name)
+        if stream is None:
+            stream = self._streams[name] = RandomStream(name, self._stream_seed(name), self.block_size)
+        return stream
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the number of draws taken from each stream.
+
+        Returns:
+            Dictionary of draws by stream name
+        """
+        return {name: stream.draws for name, stream in self._streams.items()}
+
+# Shared streams used by combat, spawns and the shop
+rng: RngManager = RngManager()
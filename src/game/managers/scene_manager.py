@@ -0,0 +1,114 @@
+import pygame
+from typing import Dict, List, Optional, Type
+from src.game.core.constants import GameState
+from src.game.managers.render_manager import RenderManager
+from src.game.scenes.scene import Scene
+
+class SceneManager:
+    """Keeps the stack of active scenes and forwards the main loop to them."""
+
+    def __init__(self, game, scenes: Dict[GameState, Type[Scene]], renderer: RenderManager) -> None:
+        """
+        Initialize the scene manager.
+
+        Args:
+            game: The game passed to every scene
+            scenes: Scene class to show for each game state
+            renderer: Render manager invalidated whenever the stack changes
+        """
+        self.game = game
+        self.scenes: Dict[GameState, Type[Scene]] = scenes
+        self.renderer: RenderManager = renderer
+        self.stack: List[Scene] = []
+
+    @property
+    def top(self) -> Optional[Scene]:
+        """The scene that receives events and updates."""
+        return self.stack[-1] if self.stack else None
+
+    def push(self, scene: Scene) -> None:
+        """
+        Put a scene on top of the stack.
+
+        Args:
+            scene: The scene to show
+        """
+        self.stack.append(scene)
+        self.renderer.invalidate()
+        scene.enter()
+
+    def pop(self) -> Optional[Scene]:
+        """
+        Remove the top scene, returning to the one below.
+
+        Returns:
+            The removed scene, or None if the stack was empty
+        """
+        if not self.stack:
+            return None
+        scene = self.stack.pop()
+        scene.exit()
+        self.renderer.invalidate()
+        return scene
+
+    def clear(self) -> None:
+        """Remove every scene, top first."""
+        while self.stack:
+            self.pop()
+
+    def sync(self, state: GameState) -> bool:
+        """
+        Replace the stack with the scene for state if it is not already showing.
+
+        Args:
+            state: The current game state
+
+        Returns:
+            True if the scenes were switched, False otherwise
+        """
+        if self.stack and self.stack[0].state == state:
+            return False
+        self.clear()
+        scene_class = self.scenes.get(state)
+        if scene_class is not None:
+            self.push(scene_class(self.game))
+        return True
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        """
+        Send an event to the top scene.
+
+        Args:
+            event: The pygame event to handle
+        """
+        if self.top:
+            self.top.handle_event(event)
+
+    def update(self, dt: float) -> None:
+        """
+        Update the top scene. Scenes underneath are paused.
+
+        Args:
+            dt: Length of the simulation step in seconds
+        """
+        if self.top:
+            self.top.update(dt)
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """
+        Draw the top scene and, for overlays, the scene underneath it.
+
+        The scene underneath is frozen while covered, so it is only redrawn
+        when the whole screen has to be redrawn.
+
+        Args:
+            surface: The surface to draw on
+        """
+        top = self.top
+        if top is None:
+            return
+        if top.is_overlay and self.renderer.needs_full_redraw():
+            base = next((scene for scene in reversed(self.stack) if not scene.is_overlay), None)
+            if base is not None:
+                base.draw(surface)
+        top.draw(surface)
@@ -0,0 +1,401 @@
+import pygame
+from typing import List, Optional
+from src.game.core.battle_engine import BattleAction
+from src.game.core.constants import BattleActions, Colors, GameConstants, GameState
+from src.game.managers.policy_manager import policy_manager
+from src.game.entities.monster import Monster
+from src.game.managers.battle_manager import BattleManager, BattleState, TurnState
+from src.game.managers.profiler_manager import profiler
+from src.game.scenes.scene import Scene
+from src.game.scenes.popup_scene import PauseScene
+from src.game.ui.ui_helpers import draw_text_centered
+
+class BattleScene(Scene):
+    """Battle screen where the hero fights the monsters of the current quest."""
+
+    state = GameState.BATTLE
+
+    def enter(self) -> None:
+        """Reset the battle buttons and bring in the first monster."""
+        game = self.game
+        game.event_manager.reset_button_delay()
+        self.auto_timer: float = 0.0  # Time since auto-battle last took a turn
+
+        # Initialize battle manager if needed
+        if game.battle_manager is None:
+            game.battle_manager = BattleManager(game.hero, game.battle_log)
+
+        # Reset battle buttons to initial state
+        battle_buttons = game.button_manager.get_buttons(GameState.BATTLE)
+
+        # Hide victory buttons
+        for name in ['Continue', 'Retreat']:
+            if name in battle_buttons:
+                battle_buttons[name].hide()
+                battle_buttons[name].lock()
+
+        # Set up combat buttons
+        combat_buttons = ['Ability', 'Rest', 'Flee']
+        for name in combat_buttons:
+            if name in battle_buttons:
+                button = battle_buttons[name]
+                button.show()
+                if game.battle_manager.turn == TurnState.HERO_TURN:
+                    button.unlock()
+                else:
+                    button.lock()
+
+        # Handle potion buttons
+        if 'Potion' in battle_buttons:
+            potion = battle_buttons['Potion']
+            if game.hero and game.hero.has_potions():
+                potion.unlock()
+            else:
+                potion.lock()
+
+        # Hide selection buttons
+        for name in ['Health Potion', 'Damage Potion', 'Block Potion']:
+            if name in battle_buttons:
+                battle_buttons[name].hide()
+                battle_buttons[name].lock()
+
+        # Add ability buttons for hero, reusing pooled buttons
+        game.button_manager.sync_hero_ability_buttons(game.hero.abilities)
+
+        # Set up monster if needed
+        if not game.battle_manager.monster or not game.battle_manager.monster.is_alive():
+            if not game.current_quest or not self._setup_new_monster(game.current_quest.get_monster()):
+                game.game_state = GameState.QUEST
+
+    def update(self, dt: float) -> None:
+        """Advance the battle and handle victory or defeat."""
+        game = self.game
+        odds_manager = game.battle_manager.odds_manager
+        if odds_manager.busy and odds_manager.poll():
+            game.battle_manager.update_odds()  # Show the odds solved in the background
+        # Update battle state and handle victory/defeat
+        battle_result = game.battle_manager.update_battle_state()
+
+        if battle_result is False:  # Hero defeated
+            if game.current_quest:
+                for button in game.button_manager.available_quests.buttons:
+                    if button.quest == game.current_quest:
+                        game.button_manager.move_failed_quest(button)
+                        if game.village.health <= 0:
+                            game.game_state = GameState.DEFEAT
+                        break
+            game.game_state = GameState.DEFEAT
+        elif battle_result is True:  # Monster defeated
+            self._handle_monster_defeat()
+        elif game.battle_manager.auto:
+            self._auto_turn(dt)
+
+        # Update button states
+        with profiler.measure("update_button_states"):
+            game.battle_manager.update_button_states(game.button_manager)
+
+    def _auto_turn(self, dt: float) -> None:
+        """Take the hero's turn for them every AUTO_TURN_DELAY seconds while auto-battle is on."""
+        game = self.game
+        if policy_manager.busy:
+            policy_manager.poll()
+        self.auto_timer += dt
+        if self.auto_timer < GameConstants.AUTO_TURN_DELAY:
+            return
+        self.auto_timer = 0.0
+        battle_manager = game.battle_manager
+        if not battle_manager.can_take_auto_turn():
+            return
+        # Whether the policy is solved yet depends on timing, so recordings keep the move that was made
+        event_manager = game.event_manager
+        recorded = event_manager.replay_decision()
+        if recorded is not None:
+            action = BattleAction(BattleActions[recorded[0]], recorded[1])
+        else:
+            action = battle_manager.auto_action()
+            event_manager.record_decision([action.kind.name, action.name])
+        if battle_manager.take_auto_turn(action):
+            game.battle_log.append(f"{game.hero.name} flees from battle!")
+            self._handle_quest_failure()
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        """Handle the battle log, the menu key and the battle buttons."""
+        game = self.game
+        battle_manager = game.battle_manager
+        game.battle_log.handle_event(event)  # Mouse wheel pages back through the log
+
+        # Handle keyboard input
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE and game.event_manager.can_click_buttons():
+                game.event_manager.reset_button_delay()
+                game.scene_manager.push(PauseScene(game))
+                return
+
+        # Handle button clicks
+        if event.type != pygame.MOUSEBUTTONDOWN or event.button != 1 or not game.event_manager.can_click_buttons():
+            return
+        mouse_pos = event.pos  # Replays carry the click position, not the live mouse
+
+        # Check for ability button clicks when in ability selection mode
+        if battle_manager.state == BattleState.USE_ABILITY:
+            clicked_ability = game.button_manager.hero_ability_buttons.handle_click(mouse_pos)
+            if clicked_ability:
+                battle_manager.use_ability(clicked_ability)
+                game.event_manager.reset_button_delay()
+                return
+
+        # Handle other battle buttons
+        for button_name, button in game.button_manager.get_buttons(GameState.BATTLE).items():
+            if game.event_manager.handle_button_click(event, button):
+                if button_name == "Continue" and battle_manager.state == BattleState.MONSTER_DEFEATED:
+                    # Get next monster
+                    new_monster = game.current_quest.get_monster()
+                    success = self._setup_new_monster(new_monster)
+                    if success:
+                        battle_manager.state = BattleState.HOME
+                        battle_manager.turn = TurnState.HERO_TURN
+                        self._switch_battle_layout(False)
+                    else:
+                        game.game_state = GameState.QUEST
+                    break
+
+                # Handle combat actions during hero's turn
+                if battle_manager.turn == TurnState.HERO_TURN:
+                    if button_name == "Ability":
+                        if button.is_selected():
+                            button.deselect()
+                        else:
+                            button.select()
+                        battle_manager.handle_ability()
+                        game.event_manager.reset_button_delay()
+                    elif button_name == "Potion":
+                        if button.is_selected():
+                            button.deselect()
+                        else:
+                            button.select()
+                        battle_manager.handle_use_potion()
+                        game.event_manager.reset_button_delay()
+                    elif button_name == "Rest":
+                        battle_manager.handle_rest()
+                        game.event_manager.reset_button_delay()
+                    elif button_name == "Auto":
+                        battle_manager.auto = not battle_manager.auto
+                        self.auto_timer = 0.0
+                        game.event_manager.reset_button_delay()
+                    elif button_name == "Flee":
+                        if battle_manager.handle_flee():
+                            game.battle_log.append(f"{game.hero.name} flees from battle!")
+                            self._handle_quest_failure()
+                    elif button_name in ["Health Potion", "Damage Potion", "Block Potion"]:
+                        battle_manager.use_potion(button_name)
+                        game.event_manager.reset_button_delay()
+
+                # Handle retreat button
+                if button_name == "Retreat":
+                    game.battle_log.append(f"{game.hero.name} retreats to regroup!")
+                    self._handle_quest_failure()
+                break
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """Draw the combatants, the battle log, the buttons and tooltips."""
+        game = self.game
+        battle_manager = game.battle_manager
+
+        # Draw the battle screen first
+        game.renderer.clear()
+
+        # Draw combatants
+        if game.hero:
+            with profiler.measure("hero_draw"):
+                game.hero.draw(surface, game.font, 0, 25)
+        if battle_manager and battle_manager.monster:
+            with profiler.measure("monster_draw"):
+                battle_manager.monster.draw(surface, game.font, GameConstants.SCREEN_WIDTH // 2, 25)
+        # Draw UI elements
+        with profiler.measure("battle_log"):
+            self._draw_battle_log(surface)
+        game.button_manager.draw_buttons(surface, GameState.BATTLE)
+        if battle_manager:
+            if battle_manager.state == BattleState.USE_ABILITY:
+                game.button_manager.hero_ability_buttons.draw(surface)
+
+        # Draw turn indicator during combat
+        if battle_manager.state != BattleState.MONSTER_DEFEATED:
+            turn_text = "Monster's Turn" if battle_manager.turn == TurnState.MONSTER_TURN else "Your Turn"
+            if battle_manager.odds is not None:
+                turn_text += f" - {battle_manager.odds.win_probability:.0%} to win"
+            draw_text_centered(turn_text, game.font, Colors.BLACK, surface,
+                            GameConstants.SCREEN_WIDTH // 2, 10)
+
+        with profiler.measure("tooltips"):
+            self._draw_tooltips(surface)
+
+    def _draw_tooltips(self, surface: pygame.Surface) -> None:
+        """Draw the tooltip of the ability or potion button under the mouse."""
+        battle_manager = self.game.battle_manager
+        # Get current mouse position for tooltips
+        mouse_pos = pygame.mouse.get_pos()
+
+        # Draw tooltips based on current state
+        battle_buttons = self.game.button_manager.get_buttons(GameState.BATTLE)
+        if battle_manager.state == BattleState.USE_ABILITY:
+            for button_name, button in battle_buttons.items():
+                if button_name.startswith("Ability_") and not button.is_locked() and button.rect.collidepoint(mouse_pos):
+                    ability_tooltip = battle_manager.get_ability_tooltip(button_name)
+                    if ability_tooltip:
+                        ability_tooltip.draw(surface, mouse_pos[0] + 10, mouse_pos[1])
+        elif battle_manager.state == BattleState.USE_ITEM:
+            for button_name, button in battle_buttons.items():
+                if button_name in ["Health Potion", "Damage Potion", "Block Potion"] and not button.is_locked() and button.rect.collidepoint(mouse_pos):
+                    if potion_tooltip := battle_manager.get_potion_tooltip(button_name):
+                        potion_tooltip.draw(surface, mouse_pos[0] + 10, mouse_pos[1])
+
+    def _update_potion_button_state(self, button_name: str, potion_type: str) -> None:
+        """Helper method to update potion button states.
+        
+        Args:
+            button_name: The name of the button to update
+            potion_type: The type of potion the button uses
+        """
+        hero = self.game.hero
+        button = self.game.button_manager.get_button(GameState.BATTLE, button_name)
+        if button is None:
+            return
+            
+        if hero and hero.potion_bag[potion_type] > 0 and button.is_locked():
+            button.unlock()
+        elif hero and hero.potion_bag[potion_type] == 0 and not button.is_locked():
+            button.lock()
+
+    def _handle_quest_completion(self) -> None:
+        """Helper method to handle quest completion logic."""
+        game = self.game
+        if game.current_quest is None:
+            return
+            
+        # Find the quest button in available quests
+        for button in game.button_manager.available_quests.buttons:
+            if button.quest == game.current_quest:
+                # Check if hero died or fled - quest failed
+                if not game.hero.is_alive() or game.game_state == GameState.QUEST:
+                    game.button_manager.move_failed_quest(button)
+                else:
+                    game.button_manager.move_completed_quest(button)
+                break
+        
+        # Reset battle state and buttons
+        game.battle_manager.state = BattleState.HOME
+        game.battle_manager.turn = TurnState.HERO_TURN
+        self._switch_battle_layout(False)
+        
+        # Check if all quests are complete or failed
+        if len(game.button_manager.available_quests.buttons) == 0:
+            # Check if any quests were completed successfully
+            if len(game.button_manager.completed_quests.buttons) > 0:
+                game.game_state = GameState.VICTORY
+            else:
+                game.game_state = GameState.DEFEAT
+        else:
+            game.game_state = GameState.QUEST
+
+    def _switch_battle_layout(self, to_victory: bool) -> None:
+        """Switch between combat and victory button layouts.
+        
+        Args:
+            to_victory: True to switch to victory layout, False for combat layout
+        """
+        battle_manager = self.game.battle_manager
+        battle_buttons = self.game.button_manager.get_buttons(GameState.BATTLE)
+        
+        # Combat buttons
+        combat_buttons: List[str] = ['Ability', 'Rest', 'Potion', 'Flee']
+        # Victory buttons
+        victory_buttons: List[str] = ['Continue', 'Retreat']
+        
+        # Show/hide appropriate buttons
+        for name, button in battle_buttons.items():
+            if name in combat_buttons:
+                if to_victory:
+                    button.hide()
+                    button.lock()  # Lock combat buttons in victory state
+                else:
+                    button.show()
+                    # During combat, availability depends on turn
+                    if battle_manager and battle_manager.turn == TurnState.HERO_TURN:
+                        button.unlock()
+                    else:
+                        button.lock()
+            elif name in victory_buttons:
+                if to_victory:
+                    button.show()
+                    button.unlock()
+                else:
+                    button.hide()
+                    button.lock()  # Lock victory buttons in combat state
+
+    def _handle_monster_defeat(self) -> None:
+        """Handle monster defeat logic."""
+        game = self.game
+        if not game.battle_manager or not game.current_quest:
+            return
+            
+        # Switch to victory layout
+        self._switch_battle_layout(True)
+        
+        # Update quest progress using the proper method
+        if game.battle_manager.monster:
+            game.current_quest.slay_monster(game.battle_manager.monster)
+        
+        # Check if quest is complete
+        if game.current_quest.is_complete():
+            self._handle_quest_completion()
+
+    def _draw_battle_log(self, surface: pygame.Surface) -> None:
+        """Draw the battle log on the screen."""
+        # Calculate battle log position
+        button_width = GameConstants.BUTTON_WIDTH + 40  # Button width plus margins
+        log_x = button_width  # Start after buttons
+        log_y = GameConstants.SCREEN_HEIGHT // 2  # Align with buttons
+        log_width = GameConstants.SCREEN_WIDTH - button_width - 20  # Remaining width minus margin
+        log_height = GameConstants.SCREEN_HEIGHT - log_y - 20  # Remaining height minus margin
+        
+        # Draw battle log background
+        log_rect = pygame.Rect(
+            log_x,  # x position after buttons
+            log_y,  # y position aligned with buttons
+            log_width,  # width fills remaining space
+            log_height  # height fills remaining space
+        )
+        self.game.battle_log.draw(surface, log_rect, Colors.LIGHT_GRAY)
+
+    def _setup_new_monster(self, monster: Optional[Monster]) -> bool:
+        """Set up a new monster for battle.
+        
+        Args:
+            monster: The monster to set up, or None if no monster available
+            
+        Returns:
+            bool: True if setup was successful, False if no monster available
+        """
+        game = self.game
+        if not monster or not game.battle_manager:
+            return False
+            
+        game.battle_manager.monster = monster
+        game.battle_manager.update_odds()
+        self._switch_battle_layout(False)  # Switch to combat layout
+        game.battle_log.append(f"A {monster.name} appears!")
+        
+        return True
+
+    def _handle_quest_failure(self) -> None:
+        """Helper method to handle quest failure logic."""
+        game = self.game
+        if game.current_quest:
+            for button in game.button_manager.available_quests.buttons:
+                if button.quest == game.current_quest:
+                    game.button_manager.move_failed_quest(button)
+                    if game.village.health <= 0:
+                        game.game_state = GameState.DEFEAT
+                        return
+            game.game_state = GameState.QUEST
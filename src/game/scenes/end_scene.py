@@ -0,0 +1,61 @@
+import pygame
+from src.game.core.constants import Colors, GameConstants, GameState
+from src.game.scenes.scene import Scene
+from src.game.ui.ui_helpers import draw_text_centered
+
+class VictoryScene(Scene):
+    """Shown when all quests are completed."""
+
+    state = GameState.VICTORY
+    allows_idle = True
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        """Return to the main menu on escape."""
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.game.game_state = GameState.HOME
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """Draw the victory text. The screen is static, so it is only drawn when invalidated."""
+        game = self.game
+        if not game.renderer.needs_full_redraw():
+            return
+        game.renderer.clear()
+        draw_text_centered("Victory!", game.font, Colors.GOLD, surface,
+            GameConstants.SCREEN_WIDTH // 2, GameConstants.SCREEN_HEIGHT // 2 - 100)
+        draw_text_centered(f"{game.hero.name if game.hero else 'Hero'} has saved the village!", game.font, Colors.BLACK,
+            surface, GameConstants.SCREEN_WIDTH // 2, GameConstants.SCREEN_HEIGHT // 2 - 50)
+        draw_text_centered("Press ESC to return to the main menu", game.font, Colors.BLACK,
+            surface, GameConstants.SCREEN_WIDTH // 2, GameConstants.SCREEN_HEIGHT // 2 + 20)
+
+class DefeatScene(Scene):
+    """Shown when the hero dies or the village falls."""
+
+    state = GameState.DEFEAT
+    allows_idle = True
+
+    def __init__(self, game) -> None:
+        """Initialize the defeat screen.
+
+        Args:
+            game: The game that owns the scene
+        """
+        super().__init__(game)
+        self.defeat_reason: str = "The village has fallen!"
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        """Return to the main menu on escape."""
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.game.game_state = GameState.HOME
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """Draw the defeat text. The screen is static, so it is only drawn when invalidated."""
+        game = self.game
+        if not game.renderer.needs_full_redraw():
+            return
+        game.renderer.clear()
+        draw_text_centered(self.defeat_reason, game.font, Colors.RED, surface,
+            GameConstants.SCREEN_WIDTH // 2, GameConstants.SCREEN_HEIGHT // 2 - 100)
+        draw_text_centered("Game Over", game.font, Colors.BLACK, surface,
+            GameConstants.SCREEN_WIDTH // 2, GameConstants.SCREEN_HEIGHT // 2 - 50)
+        draw_text_centered("Press ESC to return to the main menu", game.font, Colors.BLACK,
+            surface, GameConstants.SCREEN_WIDTH // 2, GameConstants.SCREEN_HEIGHT // 2 + 20)
@@ -0,0 +1,39 @@
+import pygame
+from src.game.core.constants import GameState
+from src.game.scenes.scene import Scene
+from src.game.scenes.popup_scene import OptionsScene
+
+class HomeScene(Scene):
+    """Main menu with new game, load game, options and exit."""
+
+    state = GameState.HOME
+    allows_idle = True
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        """Handle home screen button clicks."""
+        if event.type != pygame.MOUSEBUTTONDOWN:
+            return
+        game = self.game
+        # Check each button to see if it is clicked. If it is clicked do something
+        for button_name, button in game.button_manager.get_buttons(GameState.HOME).items():
+            if game.event_manager.handle_button_click(event, button):
+                if button_name == "New Game":
+                    game.game_state = GameState.NEW_GAME
+                elif button_name == "Load Game":
+                    game.load_game()
+                    game.game_state = GameState.VILLAGE
+                elif button_name == "Options":
+                    game.scene_manager.push(OptionsScene(game))
+                elif button_name == "Exit Game":
+                    game.game_state = GameState.EXIT
+                break
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """Draw the home screen buttons, redrawing only the ones that changed."""
+        game = self.game
+        if game.renderer.needs_full_redraw():
+            game.renderer.clear()
+            # Draw all home screen buttons
+            game.button_manager.draw_buttons(surface, GameState.HOME)
+        else:
+            game.button_manager.draw_dirty_buttons(surface, GameState.HOME, game.renderer)
@@ -0,0 +1,116 @@
+import pygame
+from src.game.core.constants import Colors, GameConstants, GameState
+from src.game.entities.hero import make_hero
+from src.game.scenes.scene import Scene
+from src.game.scenes.popup_scene import PauseScene
+from src.game.ui.ui_helpers import draw_text_centered
+
+class NewGameScene(Scene):
+    """New game screen for creating a hero."""
+
+    state = GameState.NEW_GAME
+
+    def __init__(self, game) -> None:
+        """Initialize the new game screen.
+
+        Args:
+            game: The game that owns the scene
+        """
+        super().__init__(game)
+        self.hero_class: str = ''
+
+    def enter(self) -> None:
+        """Reset the text box for a fresh hero."""
+        self.game.text_box.text = ''  # Reset text box
+        self.game.text_box.temp_text = ''  # Reset temporary text
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        """Handle typing the hero name and the class and menu buttons."""
+        game = self.game
+        text_box = game.text_box
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE and game.event_manager.can_click_buttons():
+                game.event_manager.reset_button_delay()
+                game.scene_manager.push(PauseScene(game))
+            else:
+                text_box.handle_event(event)
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            # Handle text box activation
+            if text_box.rect.collidepoint(event.pos):
+                text_box.active = True
+            else:
+                text_box.active = False
+                # When deactivating, update the permanent text with the temporary text
+                if text_box.temp_text:
+                    text_box.text = text_box.temp_text
+
+            knight_button = game.button_manager.get_button(GameState.NEW_GAME, "Knight")
+            assassin_button = game.button_manager.get_button(GameState.NEW_GAME, "Assassin")
+            for button_name, button in game.button_manager.get_buttons(GameState.NEW_GAME).items():
+                if game.event_manager.handle_button_click(event, button):
+                    game.event_manager.reset_button_delay()
+                    if button_name == "Knight":
+                        knight_button.select()
+                        assassin_button.deselect()
+                    elif button_name == "Assassin":
+                        knight_button.deselect()
+                        assassin_button.select()
+                    elif button_name == "Back":
+                        knight_button.deselect()
+                        assassin_button.deselect()
+                        game.game_state = GameState.HOME
+                    elif button_name == "Create Hero":
+                        hero_name = text_box.text
+                        # Reset game state and managers for new game
+                        game.start()
+                        # Use make_hero which properly handles name assignment
+                        game.hero = make_hero(hero_name, self.hero_class)
+                        game.game_state = GameState.VILLAGE
+                    break
+
+    def update(self, dt: float) -> None:
+        """Track the selected class and lock Create Hero until a name and class are chosen."""
+        button_manager = self.game.button_manager
+        if button_manager.get_button(GameState.NEW_GAME, "Knight").is_selected():
+            self.hero_class = 'Knight'
+        elif button_manager.get_button(GameState.NEW_GAME, "Assassin").is_selected():
+            self.hero_class = 'Assassin'
+        else:
+            self.hero_class = ''
+
+        # Enable/disable Create Hero button based on having both name and class
+        hero_name = self.game.text_box.text
+        create_hero_button = button_manager.get_button(GameState.NEW_GAME, "Create Hero")
+        if hero_name and self.hero_class and create_hero_button.is_locked():
+            create_hero_button.unlock()
+        elif (not hero_name or not self.hero_class) and not create_hero_button.is_locked():
+            create_hero_button.lock()
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """Draw the class choices, the name box and the current selection."""
+        game = self.game
+        knight_button = game.button_manager.get_button(GameState.NEW_GAME, "Knight")
+        assassin_button = game.button_manager.get_button(GameState.NEW_GAME, "Assassin")
+
+        # Draw Background
+        game.renderer.clear()
+
+        # Draw class labels
+        draw_text_centered("Knight", game.font, Colors.BLACK, surface,
+                        knight_button.rect.centerx, knight_button.rect.bottomleft[1] + 10)
+        draw_text_centered("Assassin", game.font, Colors.BLACK, surface,
+                        assassin_button.rect.centerx, assassin_button.rect.bottomleft[1] + 10)
+
+        # Display current text from text box and hero class below it
+        hero_name = game.text_box.text  # Use text instead of temp_text
+        name_y = game.text_box.rect.bottom + 20  # 20px below text box
+        class_y = name_y + 40  # 40px below name text
+
+        draw_text_centered(f"Hero Name: {hero_name}", game.font, Colors.BLACK, surface,
+                         GameConstants.SCREEN_WIDTH // 2, name_y)
+        draw_text_centered(f"Hero Class: {self.hero_class}", game.font, Colors.BLACK, surface,
+                         GameConstants.SCREEN_WIDTH // 2, class_y)
+
+        # Draw buttons and text box
+        game.button_manager.draw_buttons(surface, GameState.NEW_GAME)
+        game.text_box.draw(surface)
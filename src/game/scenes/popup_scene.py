@@ -0,0 +1,107 @@
+import pygame
+from src.game.core.constants import Colors, GameConstants, GameState
+from src.game.scenes.scene import Scene
+from src.game.ui.ui_helpers import draw_text_centered
+
+class PauseScene(Scene):
+    """Escape menu drawn over the current screen."""
+
+    state = GameState.PAUSE
+    is_overlay = True
+    allows_idle = True
+
+    def enter(self) -> None:
+        """Label the exit button for the current screen."""
+        exit_text: str = "Exit Game" if self.game.game_state == GameState.NEW_GAME else "Save and Exit"
+        exit_button = self.game.button_manager.get_button(GameState.PAUSE, "Exit")
+        if exit_button:
+            exit_button.update_text(exit_text)
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        """Handle popup buttons and closing the popup."""
+        game = self.game
+        # Check for popup close
+        if game.event_manager.handle_popup_events(event):
+            game.scene_manager.pop()
+            return
+
+        for button_name, button in game.button_manager.get_buttons(GameState.PAUSE).items():
+            if game.event_manager.handle_button_click(event, button):
+                if button_name == "Resume":
+                    game.scene_manager.pop()
+                elif button_name == "Options":
+                    game.scene_manager.push(OptionsScene(game))
+                elif button_name == "Exit":
+                    if game.game_state != GameState.NEW_GAME:
+                        game.save_game()
+                    game.game_state = GameState.HOME
+                break
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """Draw the popup over the screen underneath."""
+        game = self.game
+        if game.renderer.needs_full_redraw():
+            game.screen_manager.draw_popup("Menu", game.button_manager.get_buttons(GameState.PAUSE))
+        else:
+            game.button_manager.draw_dirty_buttons(surface, GameState.PAUSE, game.renderer)
+
+class OptionsScene(Scene):
+    """Options popup with the music volume slider."""
+
+    state = GameState.OPTIONS
+    is_overlay = True
+    allows_idle = True
+
+    def __init__(self, game) -> None:
+        """Initialize the options popup.
+
+        Args:
+            game: The game that owns the scene
+        """
+        super().__init__(game)
+        self.volume_x: int = (GameConstants.SCREEN_WIDTH - 300) // 2
+        self.volume_y: int = (GameConstants.SCREEN_HEIGHT - GameConstants.POPUP_HEIGHT) // 2 + 100
+        self.volume_rect: pygame.Rect = pygame.Rect(self.volume_x, self.volume_y, 300, 20)
+        self.volume_changed: bool = False
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        """Handle the back button, the volume slider and closing the popup."""
+        game = self.game
+        # Check for popup close
+        if game.event_manager.handle_popup_events(event):
+            game.scene_manager.pop()
+            return
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            for button_name, button in game.button_manager.get_buttons(GameState.OPTIONS).items():
+                if game.event_manager.handle_button_click(event, button):
+                    if button_name == "Back":
+                        game.scene_manager.pop()
+                        return
+                    break
+
+            # Handle volume slider
+            new_volume = game.event_manager.handle_volume_slider(event, self.volume_rect, self.volume_x)
+            if new_volume is not None:
+                pygame.mixer.music.set_volume(new_volume)
+                self.volume_changed = True
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """Draw the popup over the screen underneath."""
+        game = self.game
+        full_redraw = game.renderer.needs_full_redraw()
+        if full_redraw:
+            game.screen_manager.draw_popup("Options", game.button_manager.get_buttons(GameState.OPTIONS))
+            # Draw volume text
+            draw_text_centered("Volume", game.font, Colors.BLACK, surface,
+                GameConstants.SCREEN_WIDTH // 2, self.volume_y - 20)
+        else:
+            game.button_manager.draw_dirty_buttons(surface, GameState.OPTIONS, game.renderer)
+
+        # Draw volume slider
+        if full_redraw or self.volume_changed:
+            game.renderer.invalidate(self.volume_rect)
+            pygame.draw.rect(surface, Colors.GRAY, self.volume_rect)
+            volume_pos = self.volume_x + int(pygame.mixer.music.get_volume() * 300)
+            pygame.draw.rect(surface, Colors.BLUE,
+                pygame.Rect(self.volume_x, self.volume_y, volume_pos - self.volume_x, 20))
+            self.volume_changed = False
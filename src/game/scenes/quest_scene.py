@@ -0,0 +1,140 @@
+import pygame
+from typing import Optional
+from src.game.core.constants import GameState
+from src.game.core.quest_estimator import HeroBuild
+from src.game.entities.quest import QuestButton
+from src.game.managers.battle_manager import BattleManager
+from src.game.managers.estimate_manager import estimate_manager
+from src.game.scenes.scene import Scene
+from src.game.scenes.popup_scene import PauseScene
+from src.game.ui.scrollable import ScrollableButtons
+
+class QuestScene(Scene):
+    """Quest screen where the player can select and start quests."""
+
+    state = GameState.QUEST
+    allows_idle = True
+
+    def __init__(self, game) -> None:
+        """Initialize the quest screen.
+
+        Args:
+            game: The game that owns the scene
+        """
+        super().__init__(game)
+        self.selected_quest: Optional[QuestButton] = None
+        self.quest_list_view: ScrollableButtons = game.button_manager.available_quests
+        self.hero_build: Optional[HeroBuild] = None
+        self.estimates_seen: int = 0  # estimate_manager.finished when the ratings were last refreshed
+
+    def enter(self) -> None:
+        """Select the Available tab and make sure there is a battle manager."""
+        game = self.game
+        game.button_manager.get_button(GameState.QUEST, "Available").select()
+
+        # Initialize battle manager if it doesn't exist
+        if game.battle_manager is None and game.hero:
+            game.battle_manager = BattleManager(game.hero, game.battle_log)
+
+        # Rate the quests for the hero as they are now, in the background
+        self.hero_build = HeroBuild.from_hero(game.hero) if game.hero else None
+        self.estimates_seen = estimate_manager.finished
+        self._update_estimates()
+
+    def _update_estimates(self) -> None:
+        """Show the difficulty estimates that are ready and queue the missing ones."""
+        if self.hero_build is None:
+            return
+        for button in self.game.button_manager.available_quests.buttons:
+            quest = button.quest
+            button.set_estimate(estimate_manager.request(self.hero_build, quest.name, quest.monster_list))
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        """Handle tab, start and back buttons and scrolling the quest list."""
+        game = self.game
+        quest_buttons = game.button_manager.get_buttons(GameState.QUEST)
+        available_button = quest_buttons.get("Available")
+        complete_button = quest_buttons.get("Complete")
+        failed_button = quest_buttons.get("Failed")
+
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE and game.event_manager.can_click_buttons():
+                game.event_manager.reset_button_delay()
+                game.scene_manager.push(PauseScene(game))
+                return
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            for button_name, button in quest_buttons.items():
+                if game.event_manager.handle_button_click(event, button):
+                    if button_name == "Available":
+                        available_button.select()
+                        complete_button.deselect()
+                        failed_button.deselect()
+                        game.renderer.invalidate()  # Show a different quest list
+                    elif button_name == "Complete":
+                        available_button.deselect()
+                        complete_button.select()
+                        failed_button.deselect()
+                        game.renderer.invalidate()
+                    elif button_name == "Failed":
+                        available_button.deselect()
+                        complete_button.deselect()
+                        failed_button.select()
+                        game.renderer.invalidate()
+                    # Handle action buttons
+                    elif button_name == "Start" and self.selected_quest:
+                        game.current_quest = self.selected_quest.quest
+                        # Always create a fresh battle manager for a new quest
+                        game.battle_manager = BattleManager(game.hero, game.battle_log)
+                        game.game_state = GameState.BATTLE
+                        return
+                    elif button_name == "Back":
+                        print("Quest screen: Back button clicked") # DEBUG
+                        game.game_state = GameState.VILLAGE
+                        return
+                    break
+
+        if available_button.is_selected():
+            game.button_manager.available_quests.handle_event(event)
+        elif complete_button.is_selected():
+            game.button_manager.completed_quests.handle_event(event)
+        elif failed_button.is_selected():
+            game.button_manager.failed_quests.handle_event(event)
+
+    def update(self, dt: float) -> None:
+        """Pick the quest list for the selected tab and lock Start without a selection."""
+        button_manager = self.game.button_manager
+        if estimate_manager.finished != self.estimates_seen:  # Game collected new estimates
+            self.estimates_seen = estimate_manager.finished
+            self._update_estimates()
+        available_selected = button_manager.get_button(GameState.QUEST, "Available").is_selected()
+        start_button = button_manager.get_button(GameState.QUEST, "Start")
+
+        # Pick the appropriate quest list
+        if available_selected:
+            self.quest_list_view = button_manager.available_quests
+            self.selected_quest = self.quest_list_view.get_selected_button()
+        elif button_manager.get_button(GameState.QUEST, "Complete").is_selected():
+            self.quest_list_view = button_manager.completed_quests
+        else:  # showing_failed
+            self.quest_list_view = button_manager.failed_quests
+
+        # Update Start button state based on selection
+        if available_selected and self.selected_quest and start_button.is_locked():
+            start_button.unlock()
+        elif (not self.selected_quest or not available_selected) and not start_button.is_locked():
+            start_button.lock()
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """Draw the quest list and buttons, redrawing only what changed."""
+        game = self.game
+        if game.renderer.needs_full_redraw():
+            game.renderer.clear()
+            self.quest_list_view.draw(surface)
+            # Draw all quest screen buttons
+            game.button_manager.draw_buttons(surface, GameState.QUEST)
+        else:
+            # Only redraw the quest list and buttons that changed
+            if self.quest_list_view.needs_redraw():
+                game.renderer.erase(self.quest_list_view.rect)
+                self.quest_list_view.draw(surface)
+            game.button_manager.draw_dirty_buttons(surface, GameState.QUEST, game.renderer)
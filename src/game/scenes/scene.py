@@ -0,0 +1,55 @@
+import pygame
+from typing import TYPE_CHECKING, Optional
+from src.game.core.constants import GameState
+
+if TYPE_CHECKING:
+    from src.game.core.game import Game
+
+class Scene:
+    """Base class for a screen driven by the game's main loop.
+
+    Scenes live on the SceneManager stack. Only the top scene receives events
+    and updates; overlay scenes such as popups are drawn over the scene below.
+    """
+
+    state: Optional[GameState] = None  # Game state this scene is shown for
+    is_overlay: bool = False  # Draw the scene underneath before this one
+    allows_idle: bool = False  # The loop may sleep until input while this scene is on top
+
+    def __init__(self, game: "Game") -> None:
+        """Initialize the scene.
+
+        Args:
+            game: The game that owns the scene
+        """
+        self.game: "Game" = game
+
+    def enter(self) -> None:
+        """Called when the scene is pushed onto the stack."""
+
+    def exit(self) -> None:
+        """Called when the scene is removed from the stack."""
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        """Handle a single input event.
+
+        Args:
+            event: The pygame event to handle
+        """
+
+    def update(self, dt: float) -> None:
+        """Advance the scene by one fixed simulation step.
+
+        Args:
+            dt: Length of the step in seconds
+        """
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """Draw the scene.
+
+        Anything that moves should be drawn between its previous and current
+        position using game.render_alpha.
+
+        Args:
+            surface: The surface to draw on
+        """
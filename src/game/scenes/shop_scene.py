@@ -0,0 +1,71 @@
+import pygame
+from src.game.core.constants import GameConstants, GameState, ShopConstants
+from src.game.scenes.scene import Scene
+from src.game.scenes.popup_scene import PauseScene
+
+class ShopScene(Scene):
+    """Shop screen where the hero can buy items."""
+
+    state = GameState.SHOP
+
+    def __init__(self, game) -> None:
+        """Initialize the shop screen and its clickable areas.
+
+        Args:
+            game: The game that owns the scene
+        """
+        super().__init__(game)
+        # Calculate positions for item sections
+        section_width = GameConstants.SCREEN_WIDTH // 3
+        section_height = 150
+        y_start = 100
+        padding = 20
+
+        # Calculate clickable areas for each section
+        self.potion_rect = pygame.Rect(padding, y_start, section_width - padding * 2, section_height)
+        self.weapon_rect = pygame.Rect(section_width + padding, y_start, section_width - padding * 2, section_height)
+        self.armor_rect = pygame.Rect(section_width * 2 + padding, y_start, section_width - padding * 2, section_height)
+
+        # Calculate buy button area
+        self.buy_button_rect = pygame.Rect(
+            GameConstants.SCREEN_WIDTH // 2 - 100,
+            y_start + section_height + padding,
+            200,
+            40
+        )
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        """Handle selecting, buying and leaving."""
+        game = self.game
+        shop = game.village.shop
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE and game.event_manager.can_click_buttons():
+                game.event_manager.reset_button_delay()
+                game.scene_manager.push(PauseScene(game))
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:  # Left click only
+            if game.event_manager.can_click_buttons():
+                mouse_pos = event.pos  # Replays carry the click position, not the live mouse
+                # Check for section clicks
+                if self.potion_rect.collidepoint(mouse_pos):
+                    shop.card_selected(ShopConstants.POTION_CARD_KEY)
+                elif self.weapon_rect.collidepoint(mouse_pos):
+                    shop.card_selected(ShopConstants.WEAPON_CARD_KEY)
+                elif self.armor_rect.collidepoint(mouse_pos):
+                    shop.card_selected(ShopConstants.ARMOR_CARD_KEY)
+                # Check for buy button click
+                elif (self.buy_button_rect.collidepoint(mouse_pos) and
+                    shop.card_selected_key is not None and
+                    shop.can_buy_selected(game.hero)):
+                    shop.buy_item(game.hero)
+                # Check for leave button click
+                elif game.button_manager.get_button(GameState.SHOP, "Leave").rect.collidepoint(mouse_pos):
+                    game.game_state = GameState.VILLAGE
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """Draw the shop and the leave button."""
+        game = self.game
+        game.renderer.clear()
+        # Draw shop interface
+        game.village.shop.draw(surface, game.hero)
+        # Draw leave button
+        game.button_manager.draw_buttons(surface, GameState.SHOP)
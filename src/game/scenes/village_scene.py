@@ -0,0 +1,49 @@
+import pygame
+from src.game.core.constants import GameConstants, GameState
+from src.game.managers.profiler_manager import profiler
+from src.game.scenes.scene import Scene
+from src.game.scenes.popup_scene import PauseScene
+
+class VillageScene(Scene):
+    """Main village screen where the player can see the village status and access other features."""
+
+    state = GameState.VILLAGE
+
+    def enter(self) -> None:
+        """Start the button delay so the click that opened the village is ignored."""
+        self.game.event_manager.reset_button_delay()
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        """Handle the menu key and the village buttons."""
+        game = self.game
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE and game.event_manager.can_click_buttons():
+                game.event_manager.reset_button_delay()
+                game.scene_manager.push(PauseScene(game))
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            # Check each button
+            for button_name, button in game.button_manager.get_buttons(GameState.VILLAGE).items():
+                if game.event_manager.handle_button_click(event, button):
+                    if button_name == "Menu":
+                        game.scene_manager.push(PauseScene(game))
+                    elif button_name == "Quest":
+                        game.game_state = GameState.QUEST
+                    elif button_name == "Shop":
+                        game.game_state = GameState.SHOP
+                    elif button_name == "Rest":
+                        game.hero.rest()
+                    break
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """Draw the village, the hero and the village buttons."""
+        game = self.game
+        game.renderer.clear()
+
+        # Draw the village and hero
+        game.village.draw(surface, GameConstants.SCREEN_WIDTH // 4, 50)  # Draw village at top quarter
+        if game.hero:
+            with profiler.measure("hero_draw"):
+                game.hero.draw(surface, game.font, 0, GameConstants.SCREEN_HEIGHT // 2)
+
+        # Draw Buttons
+        game.button_manager.draw_buttons(surface, GameState.VILLAGE)
@@ -0,0 +1,197 @@
+import tempfile
+import pygame
+from array import array
+from collections import deque
+from typing import BinaryIO, Deque, Iterator, List, Optional, Tuple, Union
+from src.game.core.constants import Colors
+from src.game.ui.ui_helpers import render_text
+
+DEFAULT_MAX_ENTRIES: int = 200
+
+class BattleLog:
+    """A bounded battle log that keeps recent entries in memory and older ones on disk.
+
+    Recent entries live in a ring buffer together with their rendered surface, so
+    each line is rendered once. Entries pushed out of the buffer are streamed to a
+    temporary history file and can still be paged back with the mouse wheel.
+    """
+
+    def __init__(self, font: pygame.font.Font, max_entries: int = DEFAULT_MAX_ENTRIES,
+                color: Tuple[int, int, int] = Colors.BLACK) -> None:
+        """Initialize an empty battle log.
+
+        Args:
+            font: Font used to render entries
+            max_entries: Number of entries kept in memory before spilling to disk
+            color: RGB color of the entry text
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be greater than 0")
+        self.font: pygame.font.Font = font
+        self.color: Tuple[int, int, int] = color
+        self.max_entries: int = max_entries
+        self._entries: Deque[str] = deque(maxlen=max_entries)
+        self._surfaces: Deque[Optional[pygame.Surface]] = deque(maxlen=max_entries)
+        self._history: Optional[BinaryIO] = None
+        self._history_offsets: array = array('q')  # Byte offset of each spilled entry
+        self.scroll_offset: int = 0  # Lines scrolled back from the newest entry
+        self.rect: Optional[pygame.Rect] = None  # Where the log was last drawn
+
+    def append(self, text: str) -> None:
+        """Add an entry, spilling the oldest in-memory entry to disk if the buffer is full.
+
+        Args:
+            text: The message to add
+        """
+        if len(self._entries) == self.max_entries:
+            self._spill(self._entries[0])
+        self._entries.append(text)
+        self._surfaces.append(None)  # Rendered on first draw
+        self.scroll_offset = 0
+
+    def _spill(self, text: str) -> None:
+        """Write an entry that is about to leave the ring buffer to the history file."""
+        if self._history is None:
+            self._history = tempfile.TemporaryFile(mode="w+b")
+        self._history.seek(0, 2)
+        self._history_offsets.append(self._history.tell())
+        self._history.write(text.replace("\n", " ").encode("utf-8") + b"\n")
+
+    def _read_history(self, start: int, stop: int) -> List[str]:
+        """Read spilled entries start..stop-1 back from the history file."""
+        if self._history is None or start >= stop:
+            return []
+        self._history.flush()
+        self._history.seek(self._history_offsets[start])
+        return [self._history.readline().decode("utf-8").rstrip("\n") for _ in range(start, stop)]
+
+    @property
+    def spilled(self) -> int:
+        """Number of entries that only exist in the history file."""
+        return len(self._history_offsets)
+
+    def get_lines(self, start: int, stop: int) -> List[str]:
+        """Get entries by position in the whole session, oldest first.
+
+        Args:
+            start: Index of the first entry, counting spilled entries
+            stop: Index one past the last entry
+
+        Returns:
+            The requested entries, read from disk where needed
+        """
+        start = max(0, start)
+        stop = min(len(self), stop)
+        lines = self._read_history(start, min(stop, self.spilled))
+        first = max(start - self.spilled, 0)
+        last = stop - self.spilled
+        lines.extend(self._entries[index] for index in range(first, last))
+        return lines
+
+    def get_page(self, page: int, page_size: int) -> List[str]:
+        """Get a page of entries, where page 0 holds the newest entries.
+
+        Args:
+            page: Number of pages to go back
+            page_size: Number of entries per page
+
+        Returns:
+            The entries on that page, oldest first
+        """
+        stop = len(self) - page * page_size
+        return self.get_lines(stop - page_size, stop)
+
+    def scroll(self, lines: int, visible_lines: int) -> None:
+        """Scroll back (positive) or forward (negative) through the log.
+
+        Args:
+            lines: Number of lines to move
+            visible_lines: Number of lines the log shows at once
+        """
+        max_offset = max(0, len(self) - visible_lines)
+        self.scroll_offset = max(0, min(self.scroll_offset + lines, max_offset))
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        """Page through the history with the mouse wheel while hovering the log.
+
+        Args:
+            event: The pygame event to handle
+        """
+        if event.type != pygame.MOUSEWHEEL or not self.rect:
+            return
+        mouse_pos = getattr(event, "pos", None) or pygame.mouse.get_pos()  # Replayed wheel events carry the position
+        if self.rect.collidepoint(mouse_pos):
+            self.scroll(event.y, self._visible_lines(self.rect))
+
+    def _visible_lines(self, rect: pygame.Rect) -> int:
+        """Number of entries that fit in rect."""
+        return max(1, (rect.height - 20) // self.font.get_linesize())
+
+    def _entry_surface(self, index: int) -> pygame.Surface:
+        """Get the rendered surface of an in-memory entry, rendering it on first use."""
+        surface = self._surfaces[index]
+        if surface is None:
+            surface = self.font.render(self._entries[index], True, self.color)
+            self._surfaces[index] = surface
+        return surface
+
+    def draw(self, surface: pygame.Surface, rect: pygame.Rect, background: Tuple[int, int, int] = Colors.LIGHT_GRAY) -> None:
+        """Draw the visible entries inside rect.
+
+        Args:
+            surface: The surface to draw on
+            rect: The area of the log
+            background: RGB color of the log background
+        """
+        self.rect = rect
+        pygame.draw.rect(surface, background, rect)
+
+        max_lines = self._visible_lines(rect)
+        stop = len(self) - self.scroll_offset
+        start = max(0, stop - max_lines)
+        line_height = self.font.get_linesize()
+        y = rect.y + 10
+
+        # Entries that were spilled are only shown when paging back
+        for text in self._read_history(start, min(stop, self.spilled)):
+            surface.blit(render_text(text, self.font, self.color), (rect.x + 10, y))
+            y += line_height
+        for index in range(max(start - self.spilled, 0), stop - self.spilled):
+            surface.blit(self._entry_surface(index), (rect.x + 10, y))
+            y += line_height
+
+    def clear(self) -> None:
+        """Remove every entry and delete the history file."""
+        self._entries.clear()
+        self._surfaces.clear()
+        self._history_offsets = array('q')
+        self.scroll_offset = 0
+        self.close()
+
+    def close(self) -> None:
+        """Close and delete the history file."""
+        if self._history is not None:
+            self._history.close()
+            self._history = None
+
+    def __len__(self) -> int:
+        return self.spilled + len(self._entries)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over every entry of the session, oldest first, reading spilled entries from disk."""
+        for start in range(0, self.spilled, self.max_entries):
+            yield from self._read_history(start, min(start + self.max_entries, self.spilled))
+        yield from list(self._entries)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:
+        """Get entries by position in the whole session, like get_lines."""
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                return self.get_lines(start, stop)
+            return [self[position] for position in range(start, stop, step)]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("battle log index out of range")
+        return self.get_lines(index, index + 1)[0]
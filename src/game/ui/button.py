@@ -2,7 +2,7 @@ import pygame
 from src.game.ui.spritesheet import SpriteSheet
 from src.game.core.constants import Colors
 from src.game.ui.tooltip import Tooltip
-from typing import Optional, Tuple
+from typing import Any, Optional, Tuple
 
 # Button states
 BUTTON_DEFUALT = 0
@@ -22,6 +22,7 @@ class Button():
         self.state = BUTTON_DEFUALT
 
         self.tooltip: Optional[Tooltip] = None
+        self._drawn_key: Optional[Tuple[Any, ...]] = None  # What the screen currently shows
     
     def reset(self) -> None:
         """Reset the button, set state to BUTTON_DEFAULT"""
@@ -80,6 +81,28 @@ class Button():
         """
         return self.visible
     
+    def update_hover(self) -> None:
+        """Switch between the default and hover states based on the mouse position."""
+        mouse_pos = pygame.mouse.get_pos()
+
+        if self.state == BUTTON_DEFUALT and self.rect.collidepoint(mouse_pos):
+            self.state = BUTTON_HOVER
+        elif self.state == BUTTON_HOVER and not self.rect.collidepoint(mouse_pos):
+            self.state = BUTTON_DEFUALT
+
+    def _render_key(self) -> Tuple[Any, ...]:
+        """Get the values that decide what the button looks like on screen."""
+        return (self.state, self.visible, self.rect.topleft)
+
+    def needs_redraw(self) -> bool:
+        """
+        Check if the button changed since it was last drawn.
+        
+        Returns:
+            True if the button has to be redrawn, False otherwise
+        """
+        return self._render_key() != self._drawn_key
+
     def draw(self, surface: Optional[pygame.Surface]):
         """
         Draw the button if a surface is provided and the button is visible.
@@ -87,16 +110,13 @@ class Button():
         Args:
             surface: Optional pygame surface to draw on
         """
-        mouse_pos = pygame.mouse.get_pos()
-
-        if self.state == BUTTON_DEFUALT and self.rect.collidepoint(mouse_pos):
-            self.state = BUTTON_HOVER
-        elif self.state == BUTTON_HOVER and not self.rect.collidepoint(mouse_pos):
-            self.state = BUTTON_DEFUALT
+        self.update_hover()
 
-        if surface is not None and self.visible:
-            image = self.button_sheet.get_image(self.state, self.frame_width, self.frame_height, self.scale, Colors.BLACK)
-            surface.blit(image, (self.rect.x, self.rect.y))
+        if surface is not None:
+            self._drawn_key = self._render_key()
+            if self.visible:
+                image = self.button_sheet.get_image(self.state, self.frame_width, self.frame_height, self.scale, Colors.BLACK)
+                surface.blit(image, (self.rect.x, self.rect.y))
     
     def draw_tooltip(self, surface: Optional[pygame.Surface]) -> None:
         """
@@ -156,6 +176,10 @@ class TextButton(Button):
         self.locked_surface: pygame.Surface = self.font.render(self.text, True, Colors.GRAY)
         self._update_text_position()
 
+    def _render_key(self) -> Tuple[Any, ...]:
+        """Get the values that decide what the button looks like on screen."""
+        return super()._render_key() + (self.text,)
+
     def _update_text_position(self) -> None:
         """Update the text rectangle to remain centered in the button."""
         self.text_rect = self.text_surface.get_rect(center=self.rect.center)
@@ -39,6 +39,17 @@ class ScrollableButtons:
             50  # Initial height, will be adjusted in draw
         )
         self.dragging_scrollbar = False
+        self.dirty = True  # Content moved or changed since the last draw
+
+    def needs_redraw(self) -> bool:
+        """Check if the container has to be redrawn.
+        
+        Returns:
+            True if scrolling, selection or any visible button changed since the last draw
+        """
+        if self.dirty:
+            return True
+        return any(button.needs_redraw() for button in self.buttons if self.rect.colliderect(button.rect))
 
     def handle_event(self, event: pygame.event.Event) -> None:
         """Handle mouse wheel and scrollbar events.
@@ -46,9 +57,16 @@ class ScrollableButtons:
         Args:
             event: The pygame event to handle
         """
+        previous = (self.scroll_offset, self.selected)
+        self._handle_event(event)
+        if (self.scroll_offset, self.selected) != previous:
+            self.dirty = True
+
+    def _handle_event(self, event: pygame.event.Event) -> None:
+        """Update scrolling and selection for a single event."""
         if event.type == pygame.MOUSEWHEEL:
             # Only scroll if mouse is inside the scrollable area
-            mouse_pos = pygame.mouse.get_pos()
+            mouse_pos = getattr(event, "pos", None) or pygame.mouse.get_pos()  # Replayed wheel events carry the position
             if self.rect.collidepoint(mouse_pos):
                 content_height = len(self.buttons) * (self.button_height + self.button_spacing)
                 
@@ -144,6 +162,7 @@ class ScrollableButtons:
                 visible_buttons.append(button)
 
         surface.set_clip(None)  # Reset clipping
+        self.dirty = False
 
         # Draw scrollbar if needed
         content_height = len(self.buttons) * (self.button_height + self.button_spacing)
@@ -186,6 +205,7 @@ class ScrollableButtons:
         button.rect.height = old_height  # Restore original height
         
         self.buttons.append(button)
+        self.dirty = True
 
     def remove_button(self, button_or_index: Union[Button, int]) -> None:
         """Remove a button from the scrollable area.
@@ -216,12 +236,14 @@ class ScrollableButtons:
         for i, button in enumerate(self.buttons):
             button_y = i * (self.button_height + self.button_spacing)
             button.rect.y = self.rect.y + button_y
+        self.dirty = True
 
     def clear_buttons(self) -> None:
         """Remove all buttons from the scrollable area."""
         self.buttons.clear()
         self.selected = None
         self.scroll_offset = 0
+        self.dirty = True
         
     def get_selected_button(self) -> Button | None:
         """Get the currently selected button.
@@ -257,7 +279,7 @@ class ScrollableButtons:
                 self.button_height
             )
             
-            if actual_rect.collidepoint(mouse_pos) and not button.is_locked():
+            if actual_rect.collidepoint(mouse_pos) and button.is_visible() and not button.is_locked():
                 return button.text
                 
         return None
@@ -1,33 +1,47 @@
 import pygame
 from typing import Tuple
+from src.game.utils.lru_cache import LRUCache
 
 class SpriteSheet:
     """A class to handle sprite sheets and extract individual sprites."""
-    
-    def __init__(self, image: pygame.Surface) -> None:
+
+    def __init__(self, image: pygame.Surface, cache_size: int = 32) -> None:
         """Initialize the sprite sheet.
-        
+
         Args:
             image: The sprite sheet surface containing all sprites
+            cache_size: Maximum number of extracted frames kept in memory
         """
         self.sheet = image
+        self.frame_cache: LRUCache = LRUCache(cache_size)
 
     def get_image(self, frame: int, width: int, height: int, scale: float, color: Tuple[int, int, int]) -> pygame.Surface:
         """Extract a single sprite from the sprite sheet.
-        
+
+        Frames are cached by (frame, width, height, scale, color), so repeated
+        calls return the same Surface. Callers must not draw onto it.
+
         Args:
             frame: The frame number to extract (0-based index)
             width: The width of each sprite in pixels
             height: The height of each sprite in pixels
             scale: Scale factor to resize the sprite
             color: RGB color tuple to use as transparency key
-            
+
         Returns:
-            A new Surface containing the extracted and processed sprite
+            A Surface containing the extracted and processed sprite
         """
-        image = pygame.Surface((width, height)).convert_alpha()
-        image.blit(self.sheet, (0, 0), ((frame * width), 0, width, height))
-        image = pygame.transform.scale(image, (width * scale, height * scale))
-        image.set_colorkey(color)
+        key = (frame, width, height, scale, tuple(color))
+        image = self.frame_cache.get(key)
+        if image is None:
+            image = pygame.Surface((width, height)).convert_alpha()
+            image.blit(self.sheet, (0, 0), ((frame * width), 0, width, height))
+            image = pygame.transform.scale(image, (width * scale, height * scale))
+            image.set_colorkey(color)
+            self.frame_cache.put(key, image)
+
+        return image
 
-        return image
\ No newline at end of file
+    def clear_cache(self) -> None:
+        """Drop all cached frames, e.g. after the sheet image changes."""
+        self.frame_cache.clear()
@@ -3,9 +3,46 @@ from src.game.entities.items import *
 from src.game.utils.fileIO import *
 import pygame
 import random
-from typing import List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from src.game.ui.button import Button
+from src.game.utils.lru_cache import LRUCache
+
+# Rendered text surfaces keyed by (text, font, color, antialias)
+text_cache: LRUCache = LRUCache(512)
+# Wrapped line breaks keyed by (text, font, max_width)
+layout_cache: LRUCache = LRUCache(256)
+
+def render_text(text: str, font: pygame.font.Font, color: Tuple[int, int, int], antialias: bool = True) -> pygame.Surface:
+    """
+    Render text, reusing the surface from an earlier call with the same arguments.
+
+    The returned surface is shared, so callers must not draw onto it.
+
+    Args:
+        text: Text to render
+        font: Font to use for rendering
+        color: RGB color tuple for the text
+        antialias: Whether to render with antialiasing
+
+    Returns:
+        Surface containing the rendered text
+    """
+    key = (text, font, tuple(color), antialias)
+    text_surface = text_cache.get(key)
+    if text_surface is None:
+        text_surface = font.render(text, antialias, color)
+        text_cache.put(key, text_surface)
+    return text_surface
+
+def text_cache_stats() -> Dict[str, Any]:
+    """
+    Get the rendered-text cache counters.
+
+    Returns:
+        Dictionary with size, max_size, hits, misses, evictions and hit_rate
+    """
+    return text_cache.stats()
 
 class Tooltip:
     """A class for displaying tooltips with text."""
@@ -76,7 +113,7 @@ def draw_text(text: str, font: pygame.font.Font, color: Tuple[int, int, int], su
         x: X coordinate to draw at
         y: Y coordinate to draw at
     """
-    textobj: pygame.Surface = font.render(text, True, color)
+    textobj: pygame.Surface = render_text(text, font, color)
     textrect: pygame.Rect = textobj.get_rect(topleft=(x, y))
     surface.blit(textobj, textrect)
 
@@ -92,10 +129,67 @@ def draw_text_centered(text: str, font: pygame.font.Font, color: Tuple[int, int,
         x: X coordinate of center
         y: Y coordinate of center
     """
-    textobj: pygame.Surface = font.render(text, True, color)
+    textobj: pygame.Surface = render_text(text, font, color)
     textrect: pygame.Rect = textobj.get_rect(center=(x, y))
     surface.blit(textobj, textrect)
 
+# Kerning can make a line a few pixels wider than the sum of its words
+WRAP_MEASURE_MARGIN: int = 4
+
+def _fits(words: List[str], word: str, estimated_width: int, font: pygame.font.Font, max_width: int) -> bool:
+    """Check if a word fits on a line, measuring the whole line only near the limit."""
+    if estimated_width > max_width:
+        return False
+    if estimated_width < max_width - WRAP_MEASURE_MARGIN:
+        return True
+    return font.size(' '.join(words + [word]))[0] <= max_width
+
+def wrap_text(text: str, font: pygame.font.Font, max_width: int) -> Tuple[str, ...]:
+    """
+    Split text into lines that fit within a width, caching the result.
+
+    Each word is measured once and line widths are accumulated from the word
+    and space widths, so the cost grows linearly with the length of the text.
+
+    Args:
+        text: Text to wrap
+        font: Font used to measure the text
+        max_width: Maximum width in pixels before wrapping
+
+    Returns:
+        Tuple of wrapped lines
+    """
+    key = (text, font, max_width)
+    wrapped_lines = layout_cache.get(key)
+    if wrapped_lines is not None:
+        return wrapped_lines
+
+    space_width: int = font.size(' ')[0]
+    lines: List[str] = []
+    current_words: List[str] = []
+    current_width: int = 0
+
+    for word in text.split(' '):
+        if not word:
+            continue
+        word_width = font.size(word)[0]
+        if not current_words:
+            current_words.append(word)
+            current_width = word_width
+        elif _fits(current_words, word, current_width + space_width + word_width, font, max_width):
+            current_words.append(word)
+            current_width += space_width + word_width
+        else:
+            lines.append(' '.join(current_words))
+            current_words = [word]
+            current_width = word_width
+    if current_words:
+        lines.append(' '.join(current_words))
+
+    wrapped_lines = tuple(lines)
+    layout_cache.put(key, wrapped_lines)
+    return wrapped_lines
+
 def draw_wrapped_text(text: str, font: pygame.font.Font, color: Tuple[int, int, int], surface: pygame.Surface, x: int, y: int, max_width: int) -> int:
     """
     Draw wrapped text on the screen at the specified position.
@@ -112,24 +206,12 @@ def draw_wrapped_text(text: str, font: pygame.font.Font, color: Tuple[int, int,
     Returns:
         Number of lines drawn
     """
-    words: List[str] = text.split(' ')
-    wrapped_lines: List[str] = []
-    current_line: str = ""
-
-    for word in words:
-        test_line = f"{current_line} {word}".strip()
-        if font.size(test_line)[0] <= max_width:
-            current_line = test_line
-        else:
-            wrapped_lines.append(current_line)
-            current_line = word
-    if current_line:
-        wrapped_lines.append(current_line)
-
+    wrapped_lines = wrap_text(text, font, max_width)
+    line_height = font.get_linesize()
     for i, line in enumerate(wrapped_lines):
-        text_surface: pygame.Surface = font.render(line, True, color)
-        surface.blit(text_surface, (x, y + i * font.get_linesize()))
-    return i
+        text_surface: pygame.Surface = render_text(line, font, color)
+        surface.blit(text_surface, (x, y + i * line_height))
+    return len(wrapped_lines)
 
 def draw_multiple_lines(text: str, font: pygame.font.Font, color: Tuple[int, int, int], surface: pygame.Surface, x: int, y: int) -> None:
     """
@@ -181,7 +263,7 @@ def draw_energy_bar(surface: pygame.Surface, font: pygame.font.Font, x: int, y:
             fill_width = int((current / maximum) * width)
             pygame.draw.rect(surface, Colors.LIGHT_BLUE, (x, y, fill_width, height))
     text = f"{current}/{maximum}"
-    text_surface = font.render(text, True, Colors.WHITE)
+    text_surface = render_text(text, font, Colors.WHITE)
     text_rect = text_surface.get_rect(center=(x + width//2, y + height//2))
     surface.blit(text_surface, text_rect)
 